@@ -0,0 +1,114 @@
+"""Microbenchmark: encoding large listing pages.
+
+Compares, for a 1000-row page of ten-column rows,
+
+* ``legacy``: what FastAPI does when ``get_all_records`` returns a
+  ``PaginatedResponse``: build the model, run the route's
+  ``serialize_response`` (response-model validation of every row dict) and
+  render with Starlette's ``JSONResponse``;
+* ``direct/json``: :class:`graphsql.encoding.FastJSONResponse` on the plain
+  page dict with the ``json`` backend;
+* ``direct/orjson``: the same with the ``orjson`` backend (if installed).
+
+Run from the repository root::
+
+    python benchmarks/json_encoding.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import timeit
+from typing import Any
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import APIRoute, serialize_response  # noqa: E402
+
+from graphsql import encoding  # noqa: E402
+from graphsql.rest_routes import PaginatedResponse, router  # noqa: E402
+
+PAGE_SIZE = 1000
+REPEAT = 5
+NUMBER = 10
+
+
+def build_page() -> dict[str, Any]:
+    rows = [
+        {
+            "id": i,
+            "name": f"user-{i}",
+            "email": f"user{i}@example.com",
+            "age": i % 90,
+            "score": i * 7,
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-02T12:30:00",
+            "birthday": "1990-05-17",
+            "balance": i / 4,
+            "active": i % 2 == 0,
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    return {
+        "data": rows,
+        "total": 100_000,
+        "limit": PAGE_SIZE,
+        "offset": 0,
+        "next_cursor": None,
+        "count_strategy": "exact",
+    }
+
+
+LIST_ROUTE = next(
+    route
+    for route in router.routes
+    if isinstance(route, APIRoute) and route.path == "/api/{table_name}" and "GET" in route.methods
+)
+LOOP = asyncio.new_event_loop()
+
+
+def legacy(page: dict[str, Any]) -> bytes:
+    content = LOOP.run_until_complete(
+        serialize_response(
+            field=LIST_ROUTE.response_field, response_content=PaginatedResponse(**page)
+        )
+    )
+    return JSONResponse(content).body
+
+
+def direct(page: dict[str, Any], backend: str) -> bytes:
+    encoding.BACKEND = backend
+    return encoding.FastJSONResponse(page).body
+
+
+def pages_per_second(func: Any) -> float:
+    best = min(timeit.repeat(func, repeat=REPEAT, number=NUMBER))
+    return NUMBER / best
+
+
+def main() -> None:
+    page = build_page()
+    backends = ["json"] + (["orjson"] if encoding.orjson is not None else [])
+    for backend in backends:
+        assert json.loads(direct(page, backend)) == json.loads(legacy(page))
+
+    results = {"legacy (response model)": pages_per_second(lambda: legacy(page))}
+    for backend in backends:
+        results[f"direct/{backend}"] = pages_per_second(lambda b=backend: direct(page, b))
+
+    baseline = results["legacy (response model)"]
+    print(f"{PAGE_SIZE}-row pages, 10 columns")
+    for label, rate in results.items():
+        print(
+            f"{label:<38} {rate:>8,.1f} pages/s {rate * PAGE_SIZE:>12,.0f} rows/s"
+            f"  ({rate / baseline:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Microbenchmark: per-value isinstance serialization vs. precompiled serializers.
+
+Serializes 1000-row pages of a ten-column table (ints, strings, datetimes,
+dates, decimals, bytes) and reports rows per second for
+
+* ``legacy``: the former ``serialize_model`` loop, which runs an ``isinstance``
+  chain for every value of every row;
+* ``precompiled``: :func:`graphsql.serializers.get_serializer` applied to the
+  same ORM instances and to Core result tuples.
+
+Run from the repository root::
+
+    python benchmarks/serialization.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlalchemy import (  # noqa: E402
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    LargeBinary,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    create_engine,
+    select,
+)
+from sqlalchemy.ext.automap import automap_base  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from graphsql.serializers import get_serializer  # noqa: E402
+
+PAGE_SIZE = 1000
+REPEAT = 5
+NUMBER = 20
+
+
+def legacy_serialize_model(obj: Any) -> dict[str, Any]:
+    """Copy of ``serialize_model`` before precompiled serializers."""
+    result = {}
+    for column in obj.__table__.columns:
+        value = getattr(obj, column.name)
+        if isinstance(value, (datetime, date)):
+            result[column.name] = value.isoformat()
+        elif isinstance(value, Decimal):
+            result[column.name] = float(value)
+        elif isinstance(value, bytes):
+            result[column.name] = value.decode("utf-8", errors="ignore")
+        else:
+            result[column.name] = value
+    return result
+
+
+def build_fixture() -> tuple[Table, list[Any], list[Any]]:
+    metadata = MetaData()
+    table = Table(
+        "bench",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("email", String),
+        Column("age", Integer),
+        Column("score", Integer),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+        Column("birthday", Date),
+        Column("balance", Numeric(12, 2)),
+        Column("avatar", LargeBinary),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(),
+            [
+                {
+                    "id": i,
+                    "name": f"user-{i}",
+                    "email": f"user{i}@example.com",
+                    "age": i % 90,
+                    "score": i * 7,
+                    "created_at": start + timedelta(minutes=i),
+                    "updated_at": start + timedelta(hours=i),
+                    "birthday": date(1990, 1, 1) + timedelta(days=i),
+                    "balance": Decimal(i) / 4,
+                    "avatar": b"\x89PNG" * 4,
+                }
+                for i in range(PAGE_SIZE)
+            ],
+        )
+
+    base = automap_base(metadata=metadata)
+    base.prepare()
+    session = Session(engine)
+    instances = session.query(base.classes.bench).all()
+    with engine.connect() as conn:
+        rows = conn.execute(select(table)).all()
+    return table, instances, rows
+
+
+def rows_per_second(func: Any) -> float:
+    best = min(timeit.repeat(func, repeat=REPEAT, number=NUMBER))
+    return PAGE_SIZE * NUMBER / best
+
+
+def main() -> None:
+    table, instances, rows = build_fixture()
+    serializer = get_serializer(table)
+    assert [legacy_serialize_model(obj) for obj in instances] == [
+        serializer.from_tuple(row) for row in rows
+    ]
+
+    results = {
+        "legacy (ORM instances)": rows_per_second(
+            lambda: [legacy_serialize_model(obj) for obj in instances]
+        ),
+        "precompiled (ORM instances)": rows_per_second(
+            lambda: [serializer.from_object(obj) for obj in instances]
+        ),
+        "precompiled (Core rows)": rows_per_second(
+            lambda: [serializer.from_tuple(row) for row in rows]
+        ),
+    }
+
+    baseline = results["legacy (ORM instances)"]
+    print(f"{PAGE_SIZE}-row pages, {len(table.columns)} columns")
+    for label, rate in results.items():
+        print(f"{label:<30} {rate:>12,.0f} rows/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Helpers for batched and set-based bulk writes.
+
+Bulk loads are written through SQLAlchemy Core ``insert()`` with a list of
+parameter sets, which the DBAPI executes as a single ``executemany`` per batch
+instead of one ORM flush and commit per row. Filtered updates and deletes run
+as one ``UPDATE ... WHERE`` / ``DELETE ... WHERE`` statement.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Any, Literal
+
+from sqlalchemy import Table, delete, insert, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.sql.elements import ColumnElement
+
+ConflictMode = Literal["error", "ignore", "update"]
+
+
+def build_insert(
+    table: Table, dialect_name: str, on_conflict: str, columns: Iterable[str]
+) -> Insert:
+    """Build an ``INSERT`` for one homogeneous group of rows.
+
+    Args:
+        table: Target table.
+        dialect_name: SQLAlchemy dialect name of the bound engine.
+        on_conflict: ``error`` for a plain insert, ``ignore`` to skip rows whose
+            primary key already exists, or ``update`` to overwrite them.
+        columns: Columns supplied by the rows; only these are updated on
+            conflict.
+
+    Returns:
+        Insert statement ready for ``executemany``.
+
+    Raises:
+        ValueError: If an upsert is requested for a table without a primary
+            key or on a dialect without ``ON CONFLICT`` support.
+    """
+    if on_conflict == "error":
+        return insert(table)
+
+    pk_columns = [column.name for column in table.primary_key.columns]
+    if not pk_columns:
+        raise ValueError("Upserts require a primary key")
+    update_columns = [name for name in columns if name not in pk_columns]
+
+    if dialect_name in ("postgresql", "sqlite"):
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(table)
+        if on_conflict == "ignore" or not update_columns:
+            return stmt.on_conflict_do_nothing(index_elements=pk_columns)
+        return stmt.on_conflict_do_update(
+            index_elements=pk_columns,
+            set_={name: stmt.excluded[name] for name in update_columns},
+        )
+
+    if dialect_name in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table)
+        if on_conflict == "ignore" or not update_columns:
+            return stmt.prefix_with("IGNORE")
+        return stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in update_columns})
+
+    raise ValueError(f"Upserts are not supported on dialect '{dialect_name}'")
+
+
+def insert_batch(engine: Engine, table: Table, rows: list[dict[str, Any]], on_conflict: str) -> int:
+    """Insert one batch of rows in a single transaction.
+
+    Rows are grouped by their key set because ``executemany`` needs every
+    parameter set to bind the same columns; each group is one round trip.
+    Rows skipped by ``on_conflict="ignore"`` are not counted; where the
+    driver does not report a row count the group's size is used instead.
+
+    Args:
+        engine: Engine to write through.
+        table: Target table.
+        rows: Column-name keyed rows.
+        on_conflict: Conflict handling, see :func:`build_insert`.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If rows reference unknown columns or the conflict mode is
+            unsupported.
+        sqlalchemy.exc.SQLAlchemyError: If the database rejects the batch; the
+            whole batch is rolled back.
+    """
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    unknown = {name for keys in groups for name in keys} - set(table.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+    written = 0
+    with engine.begin() as conn:
+        for keys, group in groups.items():
+            stmt = build_insert(table, engine.dialect.name, on_conflict, keys)
+            rowcount = conn.execute(stmt, group).rowcount
+            written += rowcount if rowcount is not None and rowcount >= 0 else len(group)
+    return written
+
+
+def supports_returning(dialect: Dialect, statement: str) -> bool:
+    """Return whether ``dialect`` can add ``RETURNING`` to an UPDATE/DELETE.
+
+    SQLAlchemy 2.x exposes ``update_returning``/``delete_returning``; 1.4 only
+    has ``full_returning`` (PostgreSQL).
+    """
+    flag = getattr(dialect, f"{statement}_returning", None)
+    if flag is None:
+        flag = getattr(dialect, "full_returning", False)
+    return bool(flag)
+
+
+def update_where(
+    engine: Engine,
+    table: Table,
+    conditions: list[ColumnElement[bool]],
+    values: dict[str, Any],
+) -> tuple[int, list[dict[str, Any]] | None]:
+    """Apply ``values`` to every row matching ``conditions`` in one statement.
+
+    Returns:
+        Affected row count and the updated rows when the dialect supports
+        ``RETURNING`` (otherwise ``None``).
+
+    Raises:
+        ValueError: If ``values`` is empty or names unknown columns.
+    """
+    if not values:
+        raise ValueError("No values to update")
+    unknown = set(values) - set(table.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+    stmt = update(table).where(*conditions).values(**values)
+    return _execute_set_based(engine, table, stmt, "update")
+
+
+def delete_where(
+    engine: Engine, table: Table, conditions: list[ColumnElement[bool]]
+) -> tuple[int, list[dict[str, Any]] | None]:
+    """Delete every row matching ``conditions`` in one statement.
+
+    Returns:
+        Affected row count and the deleted rows when the dialect supports
+        ``RETURNING`` (otherwise ``None``).
+    """
+    stmt = delete(table).where(*conditions)
+    return _execute_set_based(engine, table, stmt, "delete")
+
+
+def _execute_set_based(
+    engine: Engine, table: Table, stmt: Any, kind: str
+) -> tuple[int, list[dict[str, Any]] | None]:
+    returning = supports_returning(engine.dialect, kind)
+    if returning:
+        stmt = stmt.returning(*table.columns)
+
+    with engine.begin() as conn:
+        result = conn.execute(stmt)
+        if returning:
+            rows = [dict(row._mapping) for row in result]
+            return len(rows), rows
+        return result.rowcount, None
+
+
+def parse_json_array(body: bytes) -> list[dict[str, Any]]:
+    """Parse a JSON array of row objects.
+
+    Raises:
+        ValueError: If the body is not a JSON array of objects.
+    """
+    rows = json.loads(body)
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise ValueError("Expected a JSON array of objects")
+    return rows
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[dict[str, Any]]:
+    """Incrementally parse newline-delimited JSON objects from a byte stream.
+
+    Blank lines are skipped.
+
+    Raises:
+        ValueError: If a line is not a JSON object; the message names the line.
+    """
+    pending = b""
+    line_no = 0
+
+    def _parse(line: bytes) -> dict[str, Any] | None:
+        if not line.strip():
+            return None
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"Line {line_no}: {exc}") from exc
+        if not isinstance(row, dict):
+            raise ValueError(f"Line {line_no}: expected a JSON object")
+        return row
+
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_no += 1
+            row = _parse(line)
+            if row is not None:
+                yield row
+
+    line_no += 1
+    row = _parse(pending)
+    if row is not None:
+        yield row
+
+
+async def iter_rows(rows: Iterable[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    """Expose an in-memory row list as an async stream for :func:`iter_batches`."""
+    for row in rows:
+        yield row
+
+
+async def iter_batches(
+    rows: AsyncIterable[dict[str, Any]], size: int
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Group an async stream of rows into lists of at most ``size`` rows."""
+    batch: list[dict[str, Any]] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
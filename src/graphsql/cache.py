@@ -1,74 +1,914 @@
-"""Redis-based caching and session storage utilities."""
+"""Redis-based caching and session storage utilities.
+
+Cache reads go through two tiers: a bounded in-process LRU with a short TTL
+(:class:`LocalCache`) and Redis. Deletions are broadcast on a Redis pub/sub
+channel so every API replica drops its local copy; each tier counts its own
+hits and misses (see :func:`cache_stats`).
+
+Every Redis call made through :func:`get_redis` passes a
+:class:`CircuitBreaker`: after repeated connection failures or timeouts
+Redis is bypassed entirely (callers fail fast and fall back to the database)
+until a single probe call succeeds again.
+
+Pub/sub subscribers hold their connection for as long as they listen and may
+wait indefinitely for a message, so :func:`get_pubsub` serves them from a
+separate connection pool without the command socket timeout.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
 import json
-from typing import Any
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar, cast
 
 from loguru import logger
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
+from graphsql import cache_codec
 from graphsql.config import settings
 
+T = TypeVar("T")
+
 _redis_client: Redis | None = None
+# Subscriber connections, kept apart from the bounded command pool
+_pubsub_client: Redis | None = None
+
+# Identifies this process on the invalidation channel so it ignores its own messages
+INSTANCE_ID = uuid.uuid4().hex
+
+
+class LocalCache:
+    """Bounded in-process LRU cache with per-entry expiry.
+
+    Values are stored as decoded objects and shared between callers, so they
+    must be treated as read-only.
+
+    Examples:
+        >>> local = LocalCache(max_entries=2, ttl=30)
+        >>> local.set("a", 1)
+        >>> local.get("a")
+        1
+    """
+
+    def __init__(self, max_entries: int, ttl: int) -> None:
+        """Create an empty cache holding at most ``max_entries`` for ``ttl`` seconds."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the tier stores anything at all."""
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, key: str) -> Any | None:
+        """Return a live entry (refreshing its LRU position), or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store ``value``; the local TTL never exceeds the tier's own TTL."""
+        if not self.enabled:
+            return
+        lifetime = min(ttl, self.ttl) if ttl else self.ttl
+        self._entries[key] = (time.monotonic() + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Drop one entry if present."""
+        self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with ``prefix``."""
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored (possibly expired) entries."""
+        return len(self._entries)
+
+
+class RedisUnavailableError(ConnectionError):
+    """Raised instead of contacting Redis while the circuit breaker is open."""
+
+
+class RedisPoolExhaustedError(RedisConnectionError):
+    """Raised when no pooled connection frees up within the pool timeout.
+
+    The pool is local back-pressure, not a sign that Redis is unreachable, so
+    the circuit breaker does not count it as a failure.
+    """
+
+
+class _CommandConnectionPool(BlockingConnectionPool):
+    """Blocking pool reporting exhaustion as :class:`RedisPoolExhaustedError`."""
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().get_connection(*args, **kwargs)  # type: ignore[no-untyped-call]
+        except RedisConnectionError as exc:
+            # Only the wait for a free connection fails with a bare timeout cause
+            if isinstance(exc.__cause__, asyncio.TimeoutError):
+                raise RedisPoolExhaustedError(*exc.args) from exc
+            raise
+
+
+# Errors meaning Redis could not be reached; anything else is a Redis reply
+_CONNECTION_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError, asyncio.TimeoutError)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for the Redis connection.
+
+    ``closed``: calls go through. After ``threshold`` consecutive connection
+    failures the breaker is ``open`` and :meth:`allow` rejects calls for
+    ``reset_timeout`` seconds. The next call after that is a ``half_open``
+    probe: success closes the breaker, failure re-opens it. A probe that never
+    reports back simply allows another probe after the next timeout.
+
+    Examples:
+        >>> breaker = CircuitBreaker(threshold=1, reset_timeout=30)
+        >>> breaker.record_failure()
+        >>> breaker.state, breaker.allow()
+        ('open', False)
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float) -> None:
+        """Create a closed breaker."""
+        self.threshold = max(threshold, 1)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Return ``closed``, ``open`` or ``half_open``."""
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._probing else "open"
+
+    def allow(self) -> bool:
+        """Return whether a Redis call may be attempted now."""
+        if self._opened_at is None:
+            return True
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return False
+        # Let exactly one probe through per timeout window
+        self._opened_at = time.monotonic()
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a call reached Redis."""
+        if self._opened_at is not None:
+            logger.info("Redis reachable again; circuit breaker closed")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a connection failure, opening the breaker at the threshold."""
+        self.failures += 1
+        if self._probing or (self._opened_at is None and self.failures >= self.threshold):
+            if self._opened_at is None:
+                logger.warning(
+                    f"Redis unreachable after {self.failures} attempts; "
+                    f"bypassing it for {self.reset_timeout}s"
+                )
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the breaker state for health reporting."""
+        return {"state": self.state, "consecutive_failures": self.failures}
+
+
+class _GuardedRedis:
+    """Proxy reporting the outcome of every awaited Redis command to a breaker."""
+
+    def __init__(self, client: Redis, breaker: CircuitBreaker) -> None:
+        self._client = client
+        self._breaker = breaker
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            # Pub/sub handles, pipelines and scan iterators are passed through
+            return self._guard(result) if inspect.isawaitable(result) else result
+
+        return call
+
+    def pipeline(self, *args: Any, **kwargs: Any) -> Any:
+        """Return a pipeline whose ``execute`` round trip is reported to the breaker."""
+        return _GuardedPipeline(self._client.pipeline(*args, **kwargs), self)
+
+    async def _guard(self, awaitable: Awaitable[Any]) -> Any:
+        try:
+            result = await awaitable
+        except RedisPoolExhaustedError:
+            # Redis was never contacted
+            raise
+        except _CONNECTION_ERRORS:
+            self._breaker.record_failure()
+            raise
+        except Exception:
+            self._breaker.record_success()
+            raise
+        self._breaker.record_success()
+        return result
+
+
+class _GuardedPipeline:
+    """Pipeline proxy whose ``execute`` goes through :meth:`_GuardedRedis._guard`."""
+
+    def __init__(self, pipe: Any, guarded: _GuardedRedis) -> None:
+        self._pipe = pipe
+        self._guarded = guarded
+
+    def __getattr__(self, name: str) -> Any:
+        # Queued commands return the pipeline itself; keep chaining on the proxy
+        attr = getattr(self._pipe, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            return self if result is self._pipe else result
+
+        return call
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Send the queued commands, reporting the round trip to the breaker."""
+        return await self._guarded._guard(self._pipe.execute(*args, **kwargs))
+
+
+local_cache = LocalCache(settings.local_cache_max_entries, settings.local_cache_ttl_seconds)
+_redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+redis_breaker = CircuitBreaker(
+    settings.redis_breaker_threshold, settings.redis_breaker_reset_seconds
+)
+_invalidation_task: asyncio.Task[None] | None = None
+
+
+def invalidation_channel() -> str:
+    """Return the pub/sub channel carrying cache invalidations."""
+    return settings.cache_prefix + "invalidate"
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    """Return hit/miss counters for both tiers and the Redis circuit breaker state.
+
+    Examples:
+        >>> cache_stats()  # doctest: +SKIP
+        {'local': {'hits': 12, 'misses': 3, 'entries': 3},
+         'redis': {'hits': 2, 'misses': 1, 'errors': 0},
+         'breaker': {'state': 'closed', 'consecutive_failures': 0}}
+    """
+    return {
+        "local": {
+            "hits": local_cache.hits,
+            "misses": local_cache.misses,
+            "entries": len(local_cache),
+        },
+        "redis": dict(_redis_stats),
+        "breaker": redis_breaker.snapshot(),
+    }
 
 
 async def get_redis() -> Redis:
-    """Lazily initialize and return a Redis client."""
+    """Lazily initialize and return a Redis client guarded by :data:`redis_breaker`.
+
+    Connects and reads time out after ``settings.redis_socket_timeout_seconds``,
+    so an unresponsive Redis costs a bounded delay until the breaker opens.
+    Connections come from a pool of ``settings.redis_max_connections``; when
+    all are busy a call waits up to ``settings.redis_pool_timeout_seconds``
+    and then fails with :class:`RedisPoolExhaustedError`, which does not
+    count towards the breaker.
+
+    Raises:
+        RedisUnavailableError: While the breaker is open; Redis is not contacted.
+    """
     global _redis_client
+    if not redis_breaker.allow():
+        raise RedisUnavailableError("Redis circuit breaker is open")
     if _redis_client is None:
-        _redis_client = Redis.from_url(settings.redis_url, decode_responses=True)
+        pool = _CommandConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout_seconds,
+            # Cache values may be binary (see graphsql.cache_codec)
+            decode_responses=False,
+            socket_timeout=settings.redis_socket_timeout_seconds,
+            socket_connect_timeout=settings.redis_socket_timeout_seconds,
+        )
+        _redis_client = Redis(connection_pool=pool)
         logger.info(
             "Redis client initialized",
             extra={"redis_url": settings.redis_url},
         )
-    return _redis_client
+    return cast(Redis, _GuardedRedis(_redis_client, redis_breaker))
+
+
+async def get_pubsub() -> PubSub:
+    """Return a new pub/sub handle on the dedicated subscriber connection pool.
+
+    Subscribers block on their connection until a message arrives, so they do
+    not use the command pool: idle channels would hit its socket timeout and
+    every listener would hold one of its bounded connections. Idle subscriber
+    connections are checked with a ``PING`` every
+    ``settings.redis_health_check_seconds`` instead. The circuit breaker does
+    not apply; callers handle connection errors themselves.
+
+    Examples:
+        >>> pubsub = await get_pubsub()  # doctest: +SKIP
+        >>> await pubsub.subscribe(invalidation_channel())  # doctest: +SKIP
+    """
+    global _pubsub_client
+    if _pubsub_client is None:
+        pool = ConnectionPool.from_url(
+            settings.redis_url,
+            decode_responses=False,
+            socket_timeout=None,
+            socket_connect_timeout=settings.redis_socket_timeout_seconds,
+            health_check_interval=settings.redis_health_check_seconds,
+        )
+        _pubsub_client = Redis(connection_pool=pool)
+    return _pubsub_client.pubsub()
 
 
 async def close_redis() -> None:
-    """Close the Redis connection if open."""
-    global _redis_client
-    if _redis_client is not None:
-        await _redis_client.close()
-        _redis_client = None
+    """Close the Redis clients and their connection pools if open."""
+    global _redis_client, _pubsub_client
+    for client in (_redis_client, _pubsub_client):
+        if client is not None:
+            await client.close()
+            await client.connection_pool.disconnect()
+    _redis_client = _pubsub_client = None
+
+
+def _decode_entry(key: str, raw: str | bytes | None) -> Any | None:
+    """Decode a Redis value, counting it as a hit, a miss or an unreadable entry."""
+    if raw is None:
+        _redis_stats["misses"] += 1
+        return None
+    try:
+        value = cache_codec.decode(raw)
+    except Exception as exc:  # noqa: BLE001
+        _redis_stats["errors"] += 1
+        logger.debug(f"Cache value for key {key} is unreadable: {exc}")
+        return None
+    _redis_stats["hits"] += 1
+    local_cache.set(key, value)
+    return value
 
 
 async def cache_get(key: str) -> Any | None:
     """Retrieve a cached value by key.
 
-    Returns None on cache miss or connection issues.
+    The in-process tier is checked first; Redis hits are decoded with
+    :func:`graphsql.cache_codec.decode` and copied into it. Returns None on
+    cache miss, connection issues or unreadable values.
     """
+    value = local_cache.get(key)
+    if value is not None:
+        return value
+
     try:
         client = await get_redis()
-        value = await client.get(settings.cache_prefix + key)
-        if value is None:
-            return None
-        return json.loads(value)
+        raw = await client.get(settings.cache_prefix + key)
     except Exception as exc:  # noqa: BLE001
+        _redis_stats["errors"] += 1
         logger.debug(f"Cache get failed for key {key}: {exc}")
         return None
+    return _decode_entry(key, raw)
+
 
+async def cache_set(
+    key: str, value: Any, ttl: int | None = None, *, broadcast: bool = False
+) -> None:
+    """Store a value in both cache tiers with optional TTL.
 
-async def cache_set(key: str, value: Any, ttl: int | None = None) -> None:
-    """Store a value in cache with optional TTL."""
+    The Redis copy is serialized with :func:`graphsql.cache_codec.encode`.
+    Pass ``broadcast=True`` when the value replaces one other replicas may
+    hold in their local tier, so they drop their copy and re-read Redis.
+    """
+    ttl = ttl or settings.cache_ttl_seconds
+    local_cache.set(key, value, ttl)
     try:
         client = await get_redis()
-        await client.set(
-            settings.cache_prefix + key,
-            json.dumps(value, default=str),
-            ex=ttl or settings.cache_ttl_seconds,
-        )
+        await client.set(settings.cache_prefix + key, cache_codec.encode(value), ex=ttl)
     except Exception as exc:  # noqa: BLE001
         logger.debug(f"Cache set failed for key {key}: {exc}")
+    if broadcast:
+        await broadcast_invalidation(keys=[key])
+
+
+async def cache_get_many(keys: Iterable[str]) -> dict[str, Any]:
+    """Retrieve several cached values with at most one Redis round trip.
+
+    Keys found in the in-process tier are served from it; the rest are
+    fetched with a single ``MGET`` and copied into the local tier.
+
+    Returns:
+        Mapping of the keys that were found to their values; misses are
+        omitted.
+
+    Examples:
+        >>> await cache_get_many(["records:users:1", "records:users:2"])  # doctest: +SKIP
+        {'records:users:1': {'id': 1, 'name': 'Ada'}}
+    """
+    found: dict[str, Any] = {}
+    missing: list[str] = []
+    for key in dict.fromkeys(keys):
+        value = local_cache.get(key)
+        if value is None:
+            missing.append(key)
+        else:
+            found[key] = value
+    if not missing:
+        return found
+
+    try:
+        client = await get_redis()
+        raws = await client.mget([settings.cache_prefix + key for key in missing])
+    except Exception as exc:  # noqa: BLE001
+        _redis_stats["errors"] += 1
+        logger.debug(f"Cache get_many failed for {len(missing)} keys: {exc}")
+        return found
+
+    for key, raw in zip(missing, raws, strict=True):
+        value = _decode_entry(key, raw)
+        if value is not None:
+            found[key] = value
+    return found
+
+
+async def cache_set_many(items: dict[str, Any], ttl: int | None = None) -> None:
+    """Store several values in both tiers, writing Redis in one pipelined round trip."""
+    if not items:
+        return
+    ttl = ttl or settings.cache_ttl_seconds
+    for key, value in items.items():
+        local_cache.set(key, value, ttl)
+    try:
+        client = await get_redis()
+        pipe = client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(settings.cache_prefix + key, cache_codec.encode(value), ex=ttl)
+        await pipe.execute()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Cache set_many failed for {len(items)} keys: {exc}")
 
 
 async def cache_delete(key: str) -> None:
-    """Delete a cached key."""
+    """Delete a cached key from Redis and from every replica's local tier."""
+    local_cache.delete(key)
     try:
         client = await get_redis()
         await client.delete(settings.cache_prefix + key)
     except Exception as exc:  # noqa: BLE001
         logger.debug(f"Cache delete failed for key {key}: {exc}")
+    await broadcast_invalidation(keys=[key])
+
+
+LOCK_POLL_INTERVAL = 0.05
+
+# In-flight recomputations keyed by ("load" | "refresh", cache key)
+_inflight: dict[tuple[str, str], asyncio.Task[Any]] = {}
+
+
+def _fresh_key(key: str) -> str:
+    return f"fresh:{key}"
+
+
+def _lock_key(key: str) -> str:
+    return settings.cache_prefix + f"lock:{key}"
+
+
+async def _acquire_lock(key: str) -> str | None:
+    """Take the cross-replica recompute lock for ``key``.
+
+    Returns:
+        The lock token, ``""`` when Redis is unavailable (compute without a
+        lock), or ``None`` when another replica holds it.
+    """
+    token = uuid.uuid4().hex
+    try:
+        client = await get_redis()
+        acquired = await client.set(
+            _lock_key(key), token, nx=True, ex=settings.cache_lock_ttl_seconds
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Cache lock failed for key {key}: {exc}")
+        return ""
+    return token if acquired else None
+
+
+async def _release_lock(key: str, token: str) -> None:
+    """Release the recompute lock if this worker still owns it."""
+    if not token:
+        return
+    try:
+        client = await get_redis()
+        # GET-then-DEL can race only with an expired lock; the TTL bounds the damage
+        if await client.get(_lock_key(key)) in (token, token.encode()):
+            await client.delete(_lock_key(key))
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Cache unlock failed for key {key}: {exc}")
+
+
+async def _wait_for_peer(key: str) -> Any | None:
+    """Wait for the replica holding the lock to publish a value.
+
+    Gives up when the lock disappears without a value (the peer failed) or
+    after the lock TTL.
+    """
+    deadline = time.monotonic() + settings.cache_lock_ttl_seconds
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        value = await cache_get(key)
+        if value is not None:
+            return value
+        try:
+            client = await get_redis()
+            if not await client.exists(_lock_key(key)):
+                return None
+        except Exception:  # noqa: BLE001
+            return None
+    return None
+
+
+async def _recompute(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    wait_for_peer: bool,
+) -> Any | None:
+    token = await _acquire_lock(key)
+    if token is None:
+        if not wait_for_peer:
+            # Background refresh: the lock holder is already refreshing
+            return None
+        value = await _wait_for_peer(key)
+        if value is not None:
+            return value
+        token = ""
+
+    try:
+        value = await compute()
+        if value is not None:
+            await cache_set(key, value, ttl=ttl + stale_ttl)
+            if stale_ttl:
+                await cache_set(_fresh_key(key), 1, ttl=ttl)
+        return value
+    finally:
+        await _release_lock(key, token)
+
+
+def _single_flight(
+    kind: str, key: str, factory: Callable[[], Awaitable[T]]
+) -> tuple[asyncio.Task[T], bool]:
+    """Return the in-flight task for ``(kind, key)``, starting one if none is running.
+
+    Returns:
+        The task and whether this call started it.
+    """
+    slot = (kind, key)
+    task = _inflight.get(slot)
+    if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+        return task, False
+
+    task = asyncio.ensure_future(factory())
+    _inflight[slot] = task
+
+    def _forget(done: asyncio.Task[Any]) -> None:
+        if _inflight.get(slot) is done:
+            del _inflight[slot]
+
+    task.add_done_callback(_forget)
+    return task, True
+
+
+def _log_refresh_failure(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+
+async def cache_get_or_set(
+    key: str,
+    compute: Callable[[], Awaitable[T | None]],
+    ttl: int | None = None,
+    stale_ttl: int | None = None,
+) -> T | None:
+    """Return the cached value for ``key``, computing it at most once on a miss.
+
+    Concurrent misses in this process share one ``compute`` call, and a
+    short Redis ``SET NX`` lock makes other replicas wait for the value
+    instead of recomputing it too (they compute themselves if the lock
+    holder fails or Redis is unavailable).
+
+    With a stale-while-revalidate window, values stay in the cache for
+    ``ttl + stale_ttl`` seconds; after ``ttl`` they are still served while one
+    worker refreshes them in the background.
+
+    Args:
+        key: Cache key.
+        compute: Coroutine factory producing the value; ``None`` is returned
+            but not cached.
+        ttl: Freshness lifetime; defaults to ``settings.cache_ttl_seconds``.
+        stale_ttl: Stale-while-revalidate window; defaults to
+            ``settings.cache_stale_ttl_seconds`` (``0`` disables it).
+
+    Returns:
+        The cached or freshly computed value.
+
+    Examples:
+        >>> info = await cache_get_or_set(  # doctest: +SKIP
+        ...     "tables:info:users", lambda: load_info("users"), stale_ttl=60
+        ... )
+    """
+    ttl = ttl or settings.cache_ttl_seconds
+    stale_ttl = settings.cache_stale_ttl_seconds if stale_ttl is None else stale_ttl
+
+    value = await cache_get(key)
+    if value is not None:
+        if stale_ttl and await cache_get(_fresh_key(key)) is None:
+            refresh, started = _single_flight(
+                "refresh", key, lambda: _recompute(key, compute, ttl, stale_ttl, False)
+            )
+            if started:
+                refresh.add_done_callback(_log_refresh_failure)
+        return value  # type: ignore[no-any-return]
+
+    task, _ = _single_flight("load", key, lambda: _recompute(key, compute, ttl, stale_ttl, True))
+    return await asyncio.shield(task)
+
+
+async def broadcast_invalidation(keys: list[str] | None = None, prefix: str | None = None) -> None:
+    """Tell other replicas to drop local entries by key or key prefix."""
+    message = json.dumps({"origin": INSTANCE_ID, "keys": keys or [], "prefix": prefix})
+    try:
+        client = await get_redis()
+        await client.publish(invalidation_channel(), message)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Cache invalidation broadcast failed: {exc}")
+
+
+def apply_invalidation(raw: str | bytes) -> None:
+    """Apply an invalidation message received from another replica."""
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return
+    if message.get("origin") == INSTANCE_ID:
+        return
+    for key in message.get("keys") or []:
+        local_cache.delete(key)
+    if message.get("prefix"):
+        local_cache.delete_prefix(message["prefix"])
+
+
+async def _listen_for_invalidations() -> None:
+    """Consume the invalidation channel, resubscribing after connection errors."""
+    while True:
+        try:
+            pubsub = await get_pubsub()
+            await pubsub.subscribe(invalidation_channel())
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        apply_invalidation(message["data"])
+            finally:
+                await pubsub.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Cache invalidation listener failed: {exc}")
+            # Entries received while disconnected may be stale
+            local_cache.clear()
+            await asyncio.sleep(settings.local_cache_ttl_seconds or 1)
+
+
+async def start_invalidation_listener() -> None:
+    """Start the background task applying other replicas' invalidations."""
+    global _invalidation_task
+    if local_cache.enabled and _invalidation_task is None:
+        _invalidation_task = asyncio.create_task(_listen_for_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    """Cancel the invalidation listener if it is running."""
+    global _invalidation_task
+    if _invalidation_task is not None:
+        _invalidation_task.cancel()
+        try:
+            await _invalidation_task
+        except asyncio.CancelledError:
+            pass
+        _invalidation_task = None
+
+
+def count_cache_key(table_name: str) -> str:
+    """Return the cache key holding a table's cached row count."""
+    return f"tables:count:{table_name}"
+
+
+def table_tag(table_name: str) -> str:
+    """Return the invalidation tag shared by all results derived from a table."""
+    return f"table:{table_name}"
+
+
+def _generation_key(tag: str) -> str:
+    return f"gen:{tag}"
+
+
+def _remember_generation(key: str, generation: int) -> int:
+    # Generations only grow, so keep the newest one seen: a lookup that read
+    # Redis before a concurrent bump must not overwrite the bumped value.
+    current = local_cache.get(key)
+    if current is not None and current > generation:
+        return current  # type: ignore[no-any-return]
+    local_cache.set(key, generation)
+    return generation
+
+
+async def tag_generation(tag: str) -> int | None:
+    """Return the current generation of ``tag``.
+
+    Returns:
+        The generation (``0`` before the first bump), or ``None`` when Redis
+        is unreachable and tagged entries cannot be invalidated reliably.
+    """
+    key = _generation_key(tag)
+    generation = local_cache.get(key)
+    if generation is not None:
+        return generation  # type: ignore[no-any-return]
+    try:
+        client = await get_redis()
+        raw = await client.get(settings.cache_prefix + key)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Generation lookup failed for {tag}: {exc}")
+        return None
+    return _remember_generation(key, int(raw or 0))
+
+
+async def bump_tag(tag: str) -> None:
+    """Invalidate every entry tagged with ``tag`` in O(1).
+
+    Tagged keys embed the tag's generation (see :func:`tagged_cache_key`), so
+    incrementing it orphans all existing entries at once; they age out via
+    their TTL instead of being found and deleted.
+    """
+    key = _generation_key(tag)
+    try:
+        client = await get_redis()
+        _remember_generation(key, await client.incr(settings.cache_prefix + key))
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Generation bump failed for {tag}: {exc}")
+        local_cache.delete(key)
+    await broadcast_invalidation(keys=[key])
+
+
+async def tagged_cache_key(tag: str, scope: str, params: Iterable[tuple[str, Any]]) -> str | None:
+    """Build a cache key that is invalidated whenever ``tag`` is bumped.
+
+    Args:
+        tag: Invalidation tag, e.g. :func:`table_tag`.
+        scope: Namespace of the cached result, e.g. ``rest`` or ``graphql``.
+        params: Parameters that identify the result; order does not matter.
+
+    Returns:
+        The key, or ``None`` if the tag generation is unavailable, in which
+        case the result should not be cached.
+
+    Examples:
+        >>> await tagged_cache_key("table:users", "rest", [("limit", "10")])  # doctest: +SKIP
+        'tagged:table:users:3:rest:6f1ed002ab5595859014ebf0951522d9'
+    """
+    generation = await tag_generation(tag)
+    if generation is None:
+        return None
+    canonical = "&".join(f"{key}={value}" for key, value in sorted(params))
+    digest = hashlib.md5(canonical.encode(), usedforsecurity=False).hexdigest()
+    return f"tagged:{tag}:{generation}:{scope}:{digest}"
+
+
+def list_cache_ttl(table_name: str) -> int | None:
+    """Return the list-result cache TTL for a table, or ``None`` if disabled.
+
+    Tables opt in through ``settings.list_cache_tables`` (``*`` for all).
+    """
+    tables = settings.list_cache_tables
+    return tables.get(table_name, tables.get("*"))
+
+
+async def invalidate_table_cache(table_name: str) -> None:
+    """Drop cached data derived from a table's rows.
+
+    Deletes the cached row count and bumps the table's tag, which invalidates
+    every cached list page and GraphQL list result for it.
+
+    Call this wherever a write to ``table_name`` is published via
+    :func:`graphsql.events.publish_change`.
+    """
+    await cache_delete(count_cache_key(table_name))
+    if list_cache_ttl(table_name) is not None:
+        await bump_tag(table_tag(table_name))
+
+
+def record_cache_key(table_name: str, record_id: Any) -> str:
+    """Return the cache key holding one record, addressed by primary key."""
+    return f"records:{table_name}:{record_id}"
+
+
+def record_cache_ttl(table_name: str) -> int | None:
+    """Return the record-cache TTL for a table, or ``None`` if it is not cached.
+
+    Tables opt in through ``settings.record_cache_tables``; a ``*`` entry
+    applies to every table without its own entry.
+    """
+    tables = settings.record_cache_tables
+    return tables.get(table_name, tables.get("*"))
+
+
+async def get_cached_record(table_name: str, record_id: Any) -> dict[str, Any] | None:
+    """Return a cached record, or ``None`` on a miss or for uncached tables."""
+    if record_cache_ttl(table_name) is None:
+        return None
+    return await cache_get(record_cache_key(table_name, record_id))
+
+
+async def cache_record(
+    table_name: str, record_id: Any, record: dict[str, Any], *, written: bool = False
+) -> None:
+    """Store a serialized record if its table has the record cache enabled.
+
+    Write paths pass ``written=True`` so other replicas drop their stale
+    local copy of the record.
+    """
+    ttl = record_cache_ttl(table_name)
+    if ttl is not None:
+        await cache_set(record_cache_key(table_name, record_id), record, ttl=ttl, broadcast=written)
+
+
+async def evict_record(table_name: str, record_id: Any) -> None:
+    """Remove one record from the record cache."""
+    if record_cache_ttl(table_name) is not None:
+        await cache_delete(record_cache_key(table_name, record_id))
+
+
+async def evict_table_records(table_name: str) -> None:
+    """Remove every cached record of a table.
+
+    Used after set-based writes whose affected keys are unknown. Keys are
+    found with ``SCAN``, so this never blocks Redis on large keyspaces.
+    """
+    if record_cache_ttl(table_name) is None:
+        return
+    prefix = record_cache_key(table_name, "")
+    local_cache.delete_prefix(prefix)
+    await broadcast_invalidation(prefix=prefix)
+    pattern = settings.cache_prefix + prefix + "*"
+    try:
+        client = await get_redis()
+        keys = [key async for key in client.scan_iter(match=pattern, count=500)]
+        if keys:
+            await client.delete(*keys)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Record cache eviction failed for {table_name}: {exc}")
 
 
 async def session_create(session_id: str, data: dict, ttl: int | None = None) -> None:
@@ -0,0 +1,101 @@
+"""Encoding of values stored in the Redis cache tier.
+
+Values are written by :func:`encode` and read back by :func:`decode`. The
+codec is chosen once at import time from ``settings.cache_codec``:
+
+* ``json`` (default): JSON text, byte-for-byte what earlier releases stored;
+* ``msgpack``: compact binary via ``msgpack`` (``pip install
+  graphsql[speedups]``); falls back to ``json`` with a warning when it is
+  not installed.
+
+Encoded values of at least ``settings.cache_compress_min_bytes`` bytes are
+additionally zlib-compressed (``0`` disables compression).
+
+Binary payloads start with a two-byte header: ``\\x01``, which can never
+begin a JSON document, followed by a codec tag. :func:`decode` dispatches on
+that header, so every replica reads values written with any codec, including
+untagged JSON from older releases. Enable ``msgpack`` or compression only once
+all replicas run a release that understands the header.
+
+Examples:
+    >>> from graphsql.cache_codec import decode, encode
+    >>> decode(encode({"id": 1}))
+    {'id': 1}
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any
+
+from loguru import logger
+
+from graphsql.config import settings
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+MARKER = b"\x01"
+MSGPACK_TAG = b"m"
+ZLIB_TAG = b"z"
+# Favour speed: cached values are compressed on every write
+COMPRESSION_LEVEL = 1
+
+
+def _select_codec(name: str) -> str:
+    if name == "msgpack":
+        if msgpack is None:
+            logger.warning("CACHE_CODEC=msgpack but msgpack is not installed; using json")
+            return "json"
+        return "msgpack"
+    if name != "json":
+        logger.warning(f"Unknown CACHE_CODEC {name!r}; using json")
+    return "json"
+
+
+CODEC = _select_codec(settings.cache_codec)
+
+
+def encode(value: Any) -> str | bytes:
+    """Serialize ``value`` for storage in Redis.
+
+    Args:
+        value: JSON-compatible value; unknown types are converted with ``str``.
+
+    Returns:
+        JSON text, or tagged bytes for binary and compressed payloads.
+    """
+    payload: str | bytes
+    if CODEC == "msgpack":
+        payload = MARKER + MSGPACK_TAG + msgpack.packb(value, default=str)
+    else:
+        payload = json.dumps(value, default=str)
+
+    threshold = settings.cache_compress_min_bytes
+    if threshold and len(payload) >= threshold:
+        data = payload.encode("utf-8") if isinstance(payload, str) else payload
+        return MARKER + ZLIB_TAG + zlib.compress(data, COMPRESSION_LEVEL)
+    return payload
+
+
+def decode(raw: str | bytes) -> Any:
+    """Deserialize a value written by :func:`encode` with any codec.
+
+    Raises:
+        ValueError: If the payload carries an unknown tag or needs a codec
+            that is not installed.
+    """
+    if isinstance(raw, str) or raw[:1] != MARKER:
+        return json.loads(raw)
+
+    tag, body = raw[1:2], raw[2:]
+    if tag == ZLIB_TAG:
+        return decode(zlib.decompress(body))
+    if tag == MSGPACK_TAG:
+        if msgpack is None:
+            raise ValueError("Cached value is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(body, strict_map_key=False)
+    raise ValueError(f"Unknown cache codec tag {tag!r}")
@@ -24,6 +24,9 @@ class Settings:
     """
 
     database_url: str
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_async: str = "auto"
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_reload: bool = True
@@ -32,6 +35,14 @@ class Settings:
     enable_auth: bool = False
     default_page_size: int = 50
     max_page_size: int = 1000
+    count_strategy: str = "exact"
+    count_cache_ttl_seconds: int = 60
+    export_batch_size: int = 1000
+    bulk_batch_size: int = 500
+    json_backend: str = "auto"
+    graphql_document_cache_size: int = 256
+    persisted_query_ttl_seconds: int = 86400
+    graphql_max_cost: int = 20000
     log_level: str = "INFO"
     jwt_secret_key: str = ""
     jwt_algorithm: str = "HS256"
@@ -40,8 +51,26 @@ class Settings:
     rate_limit_tables: str = "100/minute"
     rate_limit_storage_uri: str = "memory://"
     redis_url: str = "redis://localhost:6379/0"
+    redis_socket_timeout_seconds: float = 0.5
+    redis_max_connections: int = 50
+    redis_pool_timeout_seconds: float = 1.0
+    redis_health_check_seconds: int = 30
+    redis_breaker_threshold: int = 5
+    redis_breaker_reset_seconds: float = 10.0
     cache_ttl_seconds: int = 300
+    cache_stale_ttl_seconds: int = 0
+    cache_lock_ttl_seconds: int = 10
+    local_cache_max_entries: int = 1024
+    local_cache_ttl_seconds: int = 30
+    record_cache_ttl_seconds: int = 60
+    record_cache_tables: dict[str, int] = field(default_factory=dict)
+    list_cache_ttl_seconds: int = 30
+    list_cache_tables: dict[str, int] = field(default_factory=dict)
     cache_prefix: str = "graphsql:cache:"
+    cache_codec: str = "json"
+    cache_compress_min_bytes: int = 0
+    cache_warmup_budget_seconds: float = 5.0
+    cache_warmup_tables: dict[str, int] = field(default_factory=dict)
     session_ttl_seconds: int = 86400
     session_prefix: str = "graphsql:session:"
 
@@ -55,6 +84,11 @@ class Settings:
         Environment keys
         ----------------
         - ``DATABASE_URL``: SQLAlchemy database URL (default ``sqlite:///./database.db``)
+        - ``DB_POOL_SIZE``: Persistent connections kept in the pool (default ``10``)
+        - ``DB_MAX_OVERFLOW``: Extra connections allowed above the pool size (default ``20``)
+        - ``DB_ASYNC``: ``auto`` runs GraphQL reads on an ``AsyncSession`` when the
+          database's async driver is installed; ``off`` always uses the thread pool
+          (default ``auto``)
         - ``API_HOST``: Bind host for FastAPI/uvicorn (default ``0.0.0.0``)
         - ``API_PORT``: Bind port (default ``8000``)
         - ``API_RELOAD``: Enable auto-reload in development (default ``true``)
@@ -63,6 +97,18 @@ class Settings:
         - ``ENABLE_AUTH``: Toggle API key enforcement (default ``false``)
         - ``DEFAULT_PAGE_SIZE``: Page size for REST/GraphQL listings (default ``50``)
         - ``MAX_PAGE_SIZE``: Max page size allowed (default ``1000``)
+        - ``COUNT_STRATEGY``: How list totals are computed: ``exact``, ``estimated``,
+          ``cached`` or ``none`` (default ``exact``)
+        - ``COUNT_CACHE_TTL_SECONDS``: TTL for cached totals (default ``60``)
+        - ``EXPORT_BATCH_SIZE``: Rows fetched per round trip by table exports (default ``1000``)
+        - ``BULK_BATCH_SIZE``: Default rows per transaction for bulk inserts (default ``500``)
+        - ``JSON_BACKEND``: Response encoder: ``auto``, ``orjson`` or ``json`` (default ``auto``)
+        - ``GRAPHQL_DOCUMENT_CACHE_SIZE``: Parsed and validated GraphQL documents kept
+          per worker; ``0`` disables the caches (default ``256``)
+        - ``PERSISTED_QUERY_TTL_SECONDS``: Lifetime of automatic persisted query
+          documents in the cache (default ``86400``)
+        - ``GRAPHQL_MAX_COST``: Largest estimated row cost a GraphQL operation may have
+          before it is rejected; ``0`` disables the limit (default ``20000``)
         - ``LOG_LEVEL``: Log level for the service (default ``INFO``)
         - ``JWT_SECRET_KEY``: Secret key for JWT encoding (auto-generated if not set)
         - ``JWT_ALGORITHM``: JWT algorithm (default ``HS256``)
@@ -71,8 +117,43 @@ class Settings:
         - ``RATE_LIMIT_TABLES``: Rate limit for table endpoints (default ``100/minute``)
         - ``RATE_LIMIT_STORAGE_URI``: Backend for rate limiting (default ``memory://``)
         - ``REDIS_URL``: Redis connection URL for caching/sessions (default ``redis://localhost:6379/0``)
+        - ``REDIS_SOCKET_TIMEOUT_SECONDS``: Connect and read timeout for Redis calls
+          (default ``0.5``)
+        - ``REDIS_MAX_CONNECTIONS``: Size of the per-worker Redis connection pool (default ``50``)
+        - ``REDIS_POOL_TIMEOUT_SECONDS``: How long a call waits for a free pooled
+          connection before failing (default ``1``)
+        - ``REDIS_HEALTH_CHECK_SECONDS``: How often idle pub/sub subscriber connections
+          are checked with a ``PING``; ``0`` disables the check (default ``30``)
+        - ``REDIS_BREAKER_THRESHOLD``: Consecutive Redis connection failures that open
+          the circuit breaker (default ``5``)
+        - ``REDIS_BREAKER_RESET_SECONDS``: How long the open breaker bypasses Redis before
+          letting one probe call through (default ``10``)
         - ``CACHE_TTL_SECONDS``: Default cache TTL in seconds (default ``300``)
+        - ``CACHE_STALE_TTL_SECONDS``: Stale-while-revalidate window for table metadata;
+          ``0`` disables it (default ``0``)
+        - ``CACHE_LOCK_TTL_SECONDS``: Lifetime of the cross-replica recompute lock (default ``10``)
+        - ``LOCAL_CACHE_MAX_ENTRIES``: Entries kept in the in-process cache tier; ``0``
+          disables it (default ``1024``)
+        - ``LOCAL_CACHE_TTL_SECONDS``: Upper bound on in-process entry lifetime (default ``30``)
+        - ``RECORD_CACHE_TABLES``: Tables whose rows are cached by primary key, as
+          comma-separated ``table[:ttl]`` entries; ``*`` enables every table (default empty)
+        - ``RECORD_CACHE_TTL_SECONDS``: TTL for cached records without an explicit TTL
+          (default ``60``)
+        - ``LIST_CACHE_TABLES``: Tables whose REST list pages and GraphQL list results are
+          cached until the next write, as ``table[:ttl]`` entries or ``*`` (default empty)
+        - ``LIST_CACHE_TTL_SECONDS``: TTL for cached list results without an explicit TTL
+          (default ``30``)
         - ``CACHE_PREFIX``: Cache key prefix (default ``graphsql:cache:"`)
+        - ``CACHE_CODEC``: Serialization of cached values, ``json`` or ``msgpack``
+          (default ``json``)
+        - ``CACHE_COMPRESS_MIN_BYTES``: zlib-compress cached values at least this large;
+          ``0`` disables compression (default ``0``)
+        - ``CACHE_WARMUP_BUDGET_SECONDS``: Upper bound on the startup cache warm-up;
+          ``0`` disables it (default ``5``)
+        - ``CACHE_WARMUP_TABLES``: Tables whose first rows are preloaded into the record
+          cache at startup, as ``table[:rows]`` entries (default empty)
+        - ``CACHE_WARMUP_ROWS``: Rows preloaded per table without an explicit count
+          (default ``100``)
         - ``SESSION_TTL_SECONDS``: Session TTL in seconds (default ``86400``)
         - ``SESSION_PREFIX``: Session key prefix (default ``graphsql:session:"`)
 
@@ -83,12 +164,17 @@ class Settings:
         """
 
         raw_cors = env_config("CORS_ORIGINS", default="*")
+        record_cache_ttl = env_config("RECORD_CACHE_TTL_SECONDS", cast=int, default=60)
+        list_cache_ttl = env_config("LIST_CACHE_TTL_SECONDS", cast=int, default=30)
         jwt_secret = env_config("JWT_SECRET_KEY", default="")
         if not jwt_secret:
             jwt_secret = secrets.token_urlsafe(32)
 
         return cls(
             database_url=env_config("DATABASE_URL", default="sqlite:///./database.db"),
+            db_pool_size=env_config("DB_POOL_SIZE", cast=int, default=10),
+            db_max_overflow=env_config("DB_MAX_OVERFLOW", cast=int, default=20),
+            db_async=env_config("DB_ASYNC", default="auto"),
             api_host=env_config("API_HOST", default="0.0.0.0"),
             api_port=env_config("API_PORT", cast=int, default=8000),
             api_reload=env_config("API_RELOAD", cast=bool, default=True),
@@ -97,6 +183,18 @@ class Settings:
             enable_auth=env_config("ENABLE_AUTH", cast=bool, default=False),
             default_page_size=env_config("DEFAULT_PAGE_SIZE", cast=int, default=50),
             max_page_size=env_config("MAX_PAGE_SIZE", cast=int, default=1000),
+            count_strategy=env_config("COUNT_STRATEGY", default="exact").lower(),
+            count_cache_ttl_seconds=env_config("COUNT_CACHE_TTL_SECONDS", cast=int, default=60),
+            export_batch_size=env_config("EXPORT_BATCH_SIZE", cast=int, default=1000),
+            bulk_batch_size=env_config("BULK_BATCH_SIZE", cast=int, default=500),
+            json_backend=env_config("JSON_BACKEND", default="auto").lower(),
+            graphql_document_cache_size=env_config(
+                "GRAPHQL_DOCUMENT_CACHE_SIZE", cast=int, default=256
+            ),
+            persisted_query_ttl_seconds=env_config(
+                "PERSISTED_QUERY_TTL_SECONDS", cast=int, default=86400
+            ),
+            graphql_max_cost=env_config("GRAPHQL_MAX_COST", cast=int, default=20000),
             log_level=env_config("LOG_LEVEL", default="INFO"),
             jwt_secret_key=jwt_secret,
             jwt_algorithm=env_config("JWT_ALGORITHM", default="HS256"),
@@ -105,8 +203,44 @@ class Settings:
             rate_limit_tables=env_config("RATE_LIMIT_TABLES", default="100/minute"),
             rate_limit_storage_uri=env_config("RATE_LIMIT_STORAGE_URI", default="memory://"),
             redis_url=env_config("REDIS_URL", default="redis://localhost:6379/0"),
+            redis_socket_timeout_seconds=env_config(
+                "REDIS_SOCKET_TIMEOUT_SECONDS", cast=float, default=0.5
+            ),
+            redis_max_connections=env_config("REDIS_MAX_CONNECTIONS", cast=int, default=50),
+            redis_pool_timeout_seconds=env_config(
+                "REDIS_POOL_TIMEOUT_SECONDS", cast=float, default=1.0
+            ),
+            redis_health_check_seconds=env_config(
+                "REDIS_HEALTH_CHECK_SECONDS", cast=int, default=30
+            ),
+            redis_breaker_threshold=env_config("REDIS_BREAKER_THRESHOLD", cast=int, default=5),
+            redis_breaker_reset_seconds=env_config(
+                "REDIS_BREAKER_RESET_SECONDS", cast=float, default=10.0
+            ),
             cache_ttl_seconds=env_config("CACHE_TTL_SECONDS", cast=int, default=300),
+            cache_stale_ttl_seconds=env_config("CACHE_STALE_TTL_SECONDS", cast=int, default=0),
+            cache_lock_ttl_seconds=env_config("CACHE_LOCK_TTL_SECONDS", cast=int, default=10),
+            local_cache_max_entries=env_config("LOCAL_CACHE_MAX_ENTRIES", cast=int, default=1024),
+            local_cache_ttl_seconds=env_config("LOCAL_CACHE_TTL_SECONDS", cast=int, default=30),
+            record_cache_ttl_seconds=record_cache_ttl,
+            record_cache_tables=cls.parse_table_ttls(
+                env_config("RECORD_CACHE_TABLES", default=""), record_cache_ttl
+            ),
+            list_cache_ttl_seconds=list_cache_ttl,
+            list_cache_tables=cls.parse_table_ttls(
+                env_config("LIST_CACHE_TABLES", default=""), list_cache_ttl
+            ),
             cache_prefix=env_config("CACHE_PREFIX", default="graphsql:cache:"),
+            cache_codec=env_config("CACHE_CODEC", default="json"),
+            cache_compress_min_bytes=env_config("CACHE_COMPRESS_MIN_BYTES", cast=int, default=0),
+            cache_warmup_budget_seconds=env_config(
+                "CACHE_WARMUP_BUDGET_SECONDS", cast=float, default=5.0
+            ),
+            # Same table[:n] syntax, with a row count instead of a TTL
+            cache_warmup_tables=cls.parse_table_ttls(
+                env_config("CACHE_WARMUP_TABLES", default=""),
+                env_config("CACHE_WARMUP_ROWS", cast=int, default=100),
+            ),
             session_ttl_seconds=env_config("SESSION_TTL_SECONDS", cast=int, default=86400),
             session_prefix=env_config("SESSION_PREFIX", default="graphsql:session:"),
         )
@@ -131,6 +265,31 @@ class Settings:
             return ["*"]
         return [origin.strip() for origin in raw.split(",") if origin.strip()]
 
+    @staticmethod
+    def parse_table_ttls(raw: str, default_ttl: int) -> dict[str, int]:
+        """Parse ``table[:ttl]`` entries into a per-table TTL mapping.
+
+        Args:
+            raw: Comma-separated entries from configuration.
+            default_ttl: TTL for entries without an explicit one.
+
+        Returns:
+            Mapping of table name (or ``*``) to TTL in seconds.
+
+        Raises:
+            ValueError: If a TTL is not an integer.
+
+        Examples:
+            >>> Settings.parse_table_ttls("users:30, orders", 60)
+            {'users': 30, 'orders': 60}
+        """
+        tables: dict[str, int] = {}
+        for entry in raw.split(","):
+            name, _, ttl = entry.strip().partition(":")
+            if name:
+                tables[name] = int(ttl) if ttl else default_ttl
+        return tables
+
     @property
     def JWT_SECRET_KEY(self) -> str:
         """Get JWT secret key."""
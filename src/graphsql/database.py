@@ -1,14 +1,53 @@
 """Database connection and model management."""
 
-from typing import Any
+import asyncio
+import importlib.util
+from collections.abc import Callable
+from functools import partial
+from typing import Any, TypeVar
 
+import anyio
 from loguru import logger
-from sqlalchemy import MetaData, Table, create_engine
+from sqlalchemy import MetaData, Table, create_engine, text
+from sqlalchemy.engine import Row, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql import Select
 
 from graphsql.config import settings
+from graphsql.serializers import get_serializer, registry
+
+T = TypeVar("T")
+
+# Async driver (dialect name, module) used for each sync backend
+ASYNC_DRIVERS = {
+    "postgresql": ("postgresql+asyncpg", "asyncpg"),
+    "mysql": ("mysql+aiomysql", "aiomysql"),
+    "sqlite": ("sqlite+aiosqlite", "aiosqlite"),
+}
+
+
+def async_database_url(url: str) -> str | None:
+    """Return ``url`` rewritten for its backend's async driver.
+
+    Returns:
+        The async URL, or ``None`` when the backend has no known async
+        driver, the driver is not installed, or the database is an in-memory
+        SQLite database (which an async engine could not share).
+
+    Examples:
+        >>> async_database_url("postgresql://app@db/shop")  # doctest: +SKIP
+        'postgresql+asyncpg://app@db/shop'
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or importlib.util.find_spec(driver[1]) is None:
+        return None
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return None
+    return str(parsed.set(drivername=driver[0]))
 
 
 class DatabaseManager:
@@ -36,15 +75,35 @@ class DatabaseManager:
             self.engine = create_engine(
                 settings.database_url,
                 pool_pre_ping=True,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
                 echo=settings.log_level == "DEBUG",
             )
 
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
-        # Automatic model mapping
-        self.Base = automap_base()
+        # Optional async engine for reads (see read_rows)
+        self.async_engine: AsyncEngine | None = None
+        self.AsyncSessionLocal: sessionmaker | None = None
+        async_url = (
+            async_database_url(settings.database_url) if settings.db_async != "off" else None
+        )
+        if async_url is not None:
+            pool_options = (
+                {}
+                if settings.is_sqlite
+                else {"pool_size": settings.db_pool_size, "max_overflow": settings.db_max_overflow}
+            )
+            self.async_engine = create_async_engine(async_url, pool_pre_ping=True, **pool_options)
+            self.AsyncSessionLocal = sessionmaker(
+                bind=self.async_engine, class_=AsyncSession, expire_on_commit=False
+            )
+            logger.info(f"Async reads enabled via {make_url(async_url).drivername}")
+
+        # Automatic model mapping. Models and get_table() share one MetaData so
+        # Core clauses built from reflected tables apply directly to ORM queries.
+        self.metadata = MetaData()
+        self.Base = automap_base(metadata=self.metadata)
         try:
             self.Base.prepare(autoload_with=self.engine, reflect=True)
             self._models: dict[str, Any] = {
@@ -53,9 +112,10 @@ class DatabaseManager:
         except Exception as e:
             logger.warning("Could not prepare database models: {}", e)
             self._models = {}
+            self.metadata.reflect(bind=self.engine)
 
-        self.metadata = MetaData()
-        self.metadata.reflect(bind=self.engine)
+        # Compile row serializers once instead of on the first request per table
+        registry.register_all(self.metadata.tables.values())
 
     def get_session(self) -> Session:
         """Create a new SQLAlchemy session.
@@ -70,6 +130,15 @@ class DatabaseManager:
         """
         return self.SessionLocal()
 
+    def ping(self) -> None:
+        """Run a trivial query to verify database connectivity.
+
+        Raises:
+            sqlalchemy.exc.SQLAlchemyError: If the database is unreachable.
+        """
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
     def get_model(self, table_name: str) -> type[Any] | None:
         """Return the mapped SQLAlchemy model for a table.
 
@@ -108,7 +177,7 @@ class DatabaseManager:
             {'name': 'users', 'columns': [...], 'primary_keys': ['id']}
         """
         table = self.get_table(table_name)
-        if not table:
+        if table is None:
             return None
 
         columns = []
@@ -129,20 +198,125 @@ class DatabaseManager:
             "primary_keys": [col.name for col in table.primary_key],
         }
 
-    def get_primary_key_column(self, table_name: str) -> str | None:
-        """Return the first primary key column name for a table."""
+    def estimate_row_count(self, table_name: str) -> int | None:
+        """Return the planner's row-count estimate for a table.
+
+        Reads catalog statistics instead of scanning the table: ``pg_class``
+        on PostgreSQL, ``sqlite_stat1`` on SQLite and
+        ``information_schema.tables`` on MySQL/MariaDB. Statistics are only as
+        fresh as the last ``ANALYZE``.
+
+        Args:
+            table_name: Table to estimate.
+
+        Returns:
+            Estimated number of rows, or ``None`` when the dialect is
+            unsupported or no statistics are available.
+        """
+        dialect = self.engine.dialect.name
+        if dialect == "postgresql":
+            sql = "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"
+        elif dialect == "sqlite":
+            # Table-level rows (idx IS NULL) sort first; any index row works too
+            sql = (
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = :name "
+                "ORDER BY idx IS NOT NULL LIMIT 1"
+            )
+        elif dialect in ("mysql", "mariadb"):
+            sql = (
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :name"
+            )
+        else:
+            return None
+
+        try:
+            with self.engine.connect() as conn:
+                value = conn.execute(text(sql), {"name": table_name}).scalar()
+        except Exception as e:
+            logger.debug("Row estimate unavailable for {}: {}", table_name, e)
+            return None
+
+        if isinstance(value, str):
+            # sqlite_stat1.stat is "<rows> <avg rows per key> ..."
+            value = value.split()[0]
+        if value is None or int(value) < 0:
+            # PostgreSQL reports -1 for tables that were never analyzed
+            return None
+        return int(value)
+
+    def get_primary_key_columns(self, table_name: str) -> list[str]:
+        """Return all primary key column names for a table, in key order.
+
+        Args:
+            table_name: Table name to inspect.
+
+        Returns:
+            Primary key column names; empty when the table is unknown or has no
+            primary key.
+
+        Examples:
+            >>> db_manager.get_primary_key_columns("order_items")  # doctest: +SKIP
+            ['order_id', 'line_no']
+        """
         model = self.get_model(table_name)
         if not model:
-            return None
+            return []
 
-        pk_columns = list(model.__table__.primary_key.columns)
-        return pk_columns[0].name if pk_columns else None
+        return [column.name for column in model.__table__.primary_key.columns]
+
+    def get_primary_key_column(self, table_name: str) -> str | None:
+        """Return the first primary key column name for a table."""
+        pk_columns = self.get_primary_key_columns(table_name)
+        return pk_columns[0] if pk_columns else None
 
 
 # Global database manager instance
 db_manager = DatabaseManager()
 
 
+_db_limiter: anyio.CapacityLimiter | None = None
+_db_limiter_loop: asyncio.AbstractEventLoop | None = None
+
+
+def db_thread_limit() -> int:
+    """Return how many blocking database calls may run at once.
+
+    SQLite shares a single ``StaticPool`` connection, so its calls are
+    serialized; other backends may use every pooled and overflow connection.
+    """
+    if settings.is_sqlite:
+        return 1
+    return settings.db_pool_size + settings.db_max_overflow
+
+
+async def run_in_db_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking SQLAlchemy work in a worker thread.
+
+    Synchronous ``Session`` calls block the event loop, stalling every other
+    request and WebSocket on the worker. Routing them through this dispatcher
+    moves them to threads while a capacity limiter sized to the connection
+    pool keeps callers from queueing on pool checkout inside a thread.
+
+    Args:
+        func: Blocking callable, typically a bound ``Session``/``Query`` method.
+        *args: Positional arguments for ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        Whatever ``func`` returns.
+
+    Examples:
+        >>> rows = await run_in_db_thread(db.query(model).all)  # doctest: +SKIP
+    """
+    global _db_limiter, _db_limiter_loop
+    loop = asyncio.get_running_loop()
+    if _db_limiter is None or _db_limiter_loop is not loop:
+        _db_limiter = anyio.CapacityLimiter(db_thread_limit())
+        _db_limiter_loop = loop
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=_db_limiter)
+
+
 def get_db() -> Session:
     """FastAPI dependency that yields a database session."""
     db = db_manager.get_session()
@@ -152,9 +326,65 @@ def get_db() -> Session:
         db.close()
 
 
+def fetch_rows(db: Session, stmt: Select) -> list[Row]:
+    """Run a Core ``select`` on the session's connection and return plain rows.
+
+    Reads that are serialized straight away do not need mapped instances:
+    executing on the connection skips ORM hydration and the identity map, and
+    the positional rows feed a table's precompiled ``from_tuple`` serializer.
+    Writes keep using the ORM session.
+
+    Args:
+        db: Session whose connection (and transaction) the query runs on.
+        stmt: Core ``select`` over reflected ``Table`` columns.
+
+    Returns:
+        Result rows in select-column order.
+
+    Examples:
+        >>> rows = fetch_rows(db, select(users).limit(10))  # doctest: +SKIP
+        >>> get_serializer(users).from_tuple(rows[0])  # doctest: +SKIP
+        {'id': 1, 'name': 'Alice'}
+    """
+    return list(db.connection().execute(stmt).all())
+
+
+def _read_rows_in_thread(stmt: Select) -> list[Row]:
+    db = db_manager.get_session()
+    try:
+        return fetch_rows(db, stmt)
+    finally:
+        db.close()
+
+
+async def read_rows(stmt: Select) -> list[Row]:
+    """Run a read-only Core ``select`` without blocking the event loop.
+
+    With an async engine (see :func:`async_database_url`) the query runs on
+    its own ``AsyncSession``, so concurrent callers such as independent
+    GraphQL root fields each check out a pooled connection and await it
+    directly. Otherwise it runs on a short-lived sync session in the
+    database thread pool (:func:`run_in_db_thread`).
+
+    Args:
+        stmt: Core ``select`` over reflected ``Table`` columns.
+
+    Returns:
+        Result rows in select-column order.
+    """
+    if db_manager.AsyncSessionLocal is not None:
+        async with db_manager.AsyncSessionLocal() as session:
+            result = await session.execute(stmt)
+            return result.all()  # type: ignore[no-any-return]
+    return await run_in_db_thread(_read_rows_in_thread, stmt)
+
+
 def serialize_model(obj: Any) -> dict[str, Any]:
     """Serialize a SQLAlchemy model instance.
 
+    Uses the serializer precompiled for the instance's table (see
+    :mod:`graphsql.serializers`), so no per-value type dispatch happens.
+
     Args:
         obj: ORM instance to serialize.
 
@@ -165,21 +395,5 @@ def serialize_model(obj: Any) -> dict[str, Any]:
         >>> serialize_model(record)  # doctest: +SKIP
         {'id': 1, 'created_at': '2024-01-01T12:00:00', 'name': 'Alice'}
     """
-    from datetime import date, datetime
-    from decimal import Decimal
-
-    result = {}
-    for column in obj.__table__.columns:
-        value = getattr(obj, column.name)
-
-        # Handle special types
-        if isinstance(value, (datetime, date)):
-            result[column.name] = value.isoformat()
-        elif isinstance(value, Decimal):
-            result[column.name] = float(value)  # type: ignore[assignment]
-        elif isinstance(value, bytes):
-            result[column.name] = value.decode("utf-8", errors="ignore")
-        else:
-            result[column.name] = value
+    return get_serializer(obj.__table__).from_object(obj)
 
-    return result
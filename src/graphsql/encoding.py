@@ -0,0 +1,100 @@
+"""JSON encoding for API responses, events and MCP tool results.
+
+All outgoing JSON is produced by :func:`dumps`, which uses ``orjson`` when it
+is installed (``pip install graphsql[speedups]``) and the standard library
+otherwise. The backend is chosen once at import time from
+``settings.json_backend``:
+
+* ``auto`` (default): ``orjson`` if importable, else ``json``;
+* ``orjson``: require ``orjson`` (falls back to ``json`` with a warning);
+* ``json``: always use the standard library.
+
+Both backends emit compact UTF-8 and stringify values they cannot encode
+natively (``Decimal``, ``UUID`` ...), matching the ``default=str`` behaviour
+used for change events.
+
+Examples:
+    >>> from graphsql.encoding import dumps
+    >>> dumps({"id": 1, "name": "Alice"})
+    b'{"id":1,"name":"Alice"}'
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from graphsql.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(value: Any) -> Any:
+    """Fallback for values the encoder does not handle natively."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _select_backend(name: str) -> str:
+    if name == "json":
+        return "json"
+    if orjson is None:
+        if name == "orjson":
+            logger.warning("JSON_BACKEND=orjson but orjson is not installed; using json")
+        return "json"
+    return "orjson"
+
+
+BACKEND = _select_backend(settings.json_backend)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-compatible value; unknown types are converted with ``str``.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if BACKEND == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        separators=None if indent else (",", ":"),
+        indent=2 if indent else None,
+        default=_default,
+    ).encode("utf-8")
+
+
+def dumps_str(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string (see :func:`dumps`)."""
+    return dumps(obj, indent=indent).decode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with :func:`dumps`.
+
+    Used as the application's default response class. Endpoints returning
+    large row payloads construct it directly, which also skips FastAPI's
+    ``jsonable_encoder`` pass and response-model re-validation: rows are
+    already JSON-ready once they leave a precompiled serializer.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode ``content`` with the configured JSON backend."""
+        return dumps(content)
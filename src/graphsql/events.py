@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 from loguru import logger
 
-from graphsql.cache import get_redis
+from graphsql.cache import get_pubsub, get_redis
+from graphsql.encoding import dumps
 
 CHANNEL_PREFIX = "graphsql:ws:"
 
+# Actions whose ``record`` is a full row; bulk actions carry a summary instead
+ROW_ACTIONS = frozenset({"created", "updated", "deleted"})
+
 
 def build_channel(table_name: str | None = None) -> str:
     """Construct a pub/sub channel name.
@@ -34,13 +39,49 @@ async def publish_change(table_name: str, action: str, record: dict[str, Any]) -
     """Publish a change event to Redis pub/sub.
 
     Events are broadcast to the global channel and a table-specific channel so
-    clients can choose broad or narrow subscriptions.
+    clients can choose broad or narrow subscriptions. Both publishes share one
+    pipelined round trip.
     """
-    message = json.dumps(build_payload(table_name, action, record), default=str)
+    message = dumps(build_payload(table_name, action, record))
 
     try:
         client = await get_redis()
-        await client.publish(build_channel(None), message)
-        await client.publish(build_channel(table_name), message)
+        pipe = client.pipeline(transaction=False)
+        pipe.publish(build_channel(None), message)
+        pipe.publish(build_channel(table_name), message)
+        await pipe.execute()
     except Exception as exc:  # noqa: BLE001
         logger.debug(f"Publish change failed for {table_name}: {exc}")
+
+
+async def change_events(table_name: str | None = None) -> AsyncIterator[dict[str, Any]]:
+    """Yield change event payloads published for a table, as they arrive.
+
+    Subscribes to :func:`build_channel` for ``table_name`` (the global stream
+    when ``None``) on first iteration and unsubscribes when the iterator is
+    closed. Malformed messages are skipped.
+
+    Args:
+        table_name: Table whose events to follow.
+
+    Yields:
+        Payloads in the :func:`build_payload` shape.
+    """
+    pubsub = await get_pubsub()
+    channel = build_channel(table_name)
+    await pubsub.subscribe(channel)
+
+    try:
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                yield json.loads(message.get("data"))
+            except (TypeError, ValueError) as exc:
+                logger.debug(f"Dropping malformed pubsub payload: {exc}")
+    finally:
+        try:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"PubSub cleanup failed: {exc}")
@@ -0,0 +1,131 @@
+"""Query-string filter parsing for REST endpoints.
+
+Filters are plain query parameters named after a column, optionally suffixed
+with ``__<operator>``::
+
+    ?name=Alice            name = 'Alice'
+    ?age__gte=21           age >= 21
+    ?id__in=1,2,3          id IN (1, 2, 3)
+    ?email__like=%@x.org   email LIKE '%@x.org'
+    ?deleted_at__is_null=true
+
+Values are converted to the column's Python type before binding, and each
+filter compiles to a SQLAlchemy clause against the reflected ``Table``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Table
+from sqlalchemy.sql.elements import ColumnElement
+
+OPERATOR_SEPARATOR = "__"
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off"}
+
+
+def _parse_bool(raw: str) -> bool:
+    lowered = raw.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Expected a boolean, got '{raw}'")
+
+
+_CONVERTERS: dict[type, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    Decimal: Decimal,
+    bool: _parse_bool,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+}
+
+OPERATORS: dict[str, Callable[[Any, Any], ColumnElement[bool]]] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "like": lambda column, value: column.like(value),
+    "in": lambda column, value: column.in_(value),
+    "is_null": lambda column, value: column.is_(None) if value else column.isnot(None),
+}
+
+
+def convert_value(column: Any, raw: str) -> Any:
+    """Convert a query-string value to the Python type of ``column``.
+
+    Raises:
+        ValueError: If the value cannot be parsed as the column's type.
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return raw
+
+    converter = _CONVERTERS.get(python_type)
+    if converter is None:
+        return raw
+    try:
+        return converter(raw)
+    except (ValueError, ArithmeticError) as exc:
+        raise ValueError(f"Invalid value for '{column.name}': {raw}") from exc
+
+
+def build_condition(table: Table, key: str, raw: str) -> ColumnElement[bool]:
+    """Compile one ``column[__operator]=value`` pair into a SQL clause.
+
+    Raises:
+        ValueError: If the column or operator is unknown or the value is invalid.
+
+    Examples:
+        >>> str(build_condition(users, "age__gt", "30"))  # doctest: +SKIP
+        'users.age > :age_1'
+    """
+    name, _, operator = key.partition(OPERATOR_SEPARATOR)
+    operator = operator or "eq"
+
+    if name not in table.columns:
+        raise ValueError(f"Unknown column '{name}'")
+    if operator not in OPERATORS:
+        raise ValueError(f"Unknown operator '{operator}'; expected one of {', '.join(OPERATORS)}")
+
+    column = table.columns[name]
+    value: Any
+    if operator == "is_null":
+        value = _parse_bool(raw)
+    elif operator == "like":
+        value = raw
+    elif operator == "in":
+        value = [convert_value(column, item) for item in raw.split(",") if item != ""]
+    else:
+        value = convert_value(column, raw)
+    return OPERATORS[operator](column, value)
+
+
+def parse_filters(
+    table: Table, params: Iterable[tuple[str, str]], reserved: Collection[str] = ()
+) -> list[ColumnElement[bool]]:
+    """Compile filter query parameters into SQL clauses.
+
+    Args:
+        table: Reflected table the filters apply to.
+        params: ``(key, value)`` pairs, e.g. ``request.query_params.multi_items()``.
+        reserved: Parameter names owned by the endpoint (``limit``, ``sort`` ...)
+            that are not filters.
+
+    Returns:
+        Clauses to combine with ``AND``.
+
+    Raises:
+        ValueError: If any filter is invalid.
+    """
+    return [build_condition(table, key, raw) for key, raw in params if key not in reserved]
@@ -0,0 +1,253 @@
+"""Cost-based complexity limits for GraphQL operations.
+
+Before an operation executes, :class:`QueryCost` walks its document and
+estimates how many rows it can return. Every row a field can return costs one
+point, plus the cost of that field's own selections for each of those rows.
+Nested lists therefore multiply. The number of rows a field returns is
+bounded by:
+
+* its ``limit`` or ``first`` argument, bounded by :func:`page_size` exactly
+  like the resolvers bound it, for root list and connection fields, whose
+  rows are the ``edges { node }`` beneath them;
+* the average number of referencing rows per parent for one-to-many
+  relationship fields, derived from the two tables' catalog row estimates
+  (``settings.default_page_size`` when no estimate is available);
+* one for single-record and many-to-one fields;
+* and, for every field, the table's estimated row count.
+
+Operations whose cost exceeds ``settings.graphql_max_cost`` are rejected with
+a ``QUERY_TOO_EXPENSIVE`` error before any resolver runs, so no SQL is issued
+on their behalf.
+
+Examples:
+    >>> cost = await operation_cost(schema, document, None, {})  # doctest: +SKIP
+    >>> cost <= settings.graphql_max_cost  # doctest: +SKIP
+    True
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Mapping
+from math import ceil
+from typing import Any
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+)
+from graphql.execution.values import get_argument_values
+from graphql.utilities import get_operation_ast
+from sqlalchemy import Table
+from strawberry.extensions import SchemaExtension
+
+from graphsql.cache import cache_get_or_set
+from graphsql.config import settings
+from graphsql.database import db_manager, run_in_db_thread
+
+# Arguments bounding the page size of root list and connection fields
+PAGE_ARGUMENTS = ("limit", "first")
+
+
+def page_size(requested: int, argument: str = "limit") -> int:
+    """Return the rows a page argument reads, clamped to ``settings.max_page_size``.
+
+    Resolvers and the cost analysis share this bound, so an operation is
+    costed for exactly the rows it can read.
+
+    Raises:
+        ValueError: If ``requested`` is negative.
+    """
+    if requested < 0:
+        raise ValueError(f"{argument} must not be negative")
+    return min(requested, settings.max_page_size)
+
+
+def row_estimate_cache_key(table_name: str) -> str:
+    """Return the cache key holding a table's catalog row estimate."""
+    return f"tables:estimate:{table_name}"
+
+
+async def estimated_rows(table_name: str) -> int | None:
+    """Return the catalog row estimate for a table, cached like row counts.
+
+    Args:
+        table_name: Table to estimate.
+
+    Returns:
+        Estimated row count, or ``None`` without usable statistics.
+    """
+
+    async def _load() -> dict[str, int | None]:
+        # Wrapped so that "no statistics" is cached too
+        return {"rows": await run_in_db_thread(db_manager.estimate_row_count, table_name)}
+
+    cached = await cache_get_or_set(
+        row_estimate_cache_key(table_name), _load, ttl=settings.count_cache_ttl_seconds
+    )
+    return (cached or {}).get("rows")
+
+
+class _CostWalker:
+    """Accumulates the cost of one operation, memoizing row estimates."""
+
+    def __init__(
+        self,
+        schema: Any,
+        fragments: Mapping[str, FragmentDefinitionNode],
+        variables: dict[str, Any] | None,
+    ) -> None:
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables or {}
+        self.estimates: dict[str, int | None] = {}
+
+    def table_for(self, type_name: str) -> Table | None:
+        definition = self.schema.get_type_by_name(type_name)
+        return getattr(getattr(definition, "origin", None), "__table__", None)
+
+    async def estimate(self, table: Table) -> int | None:
+        if table.name not in self.estimates:
+            self.estimates[table.name] = await estimated_rows(table.name)
+        return self.estimates[table.name]
+
+    def fields(self, selection_set: SelectionSetNode | None) -> list[FieldNode]:
+        fields: list[FieldNode] = []
+        for selection in selection_set.selections if selection_set else ():
+            if isinstance(selection, FieldNode):
+                fields.append(selection)
+            elif isinstance(selection, InlineFragmentNode):
+                fields.extend(self.fields(selection.selection_set))
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is not None:
+                    fields.extend(self.fields(fragment.selection_set))
+        return fields
+
+    async def rows(
+        self, node: FieldNode, field: Any, parent: Table | None, table: Table, many: bool
+    ) -> int:
+        if not many:
+            return 1
+        estimate = await self.estimate(table)
+        page_argument = next((name for name in PAGE_ARGUMENTS if name in field.args), None)
+        if page_argument is not None:
+            try:
+                args = get_argument_values(field, node, self.variables)
+            except GraphQLError:
+                # Bad variables fail execution anyway; cost the defaults
+                args = {}
+            size = args.get(page_argument, settings.default_page_size)
+            try:
+                rows = page_size(int(size), page_argument)
+            except ValueError as e:
+                # The resolver would reject it too; fail before anything runs
+                raise GraphQLError(str(e), extensions={"code": "BAD_USER_INPUT"}) from e
+        else:
+            parent_rows = await self.estimate(parent) if parent is not None else None
+            if estimate is not None and parent_rows:
+                rows = ceil(estimate / parent_rows)
+            else:
+                rows = settings.default_page_size
+        return rows if estimate is None else min(rows, estimate)
+
+    def connection_nodes(
+        self, node: FieldNode, connection_type: GraphQLObjectType
+    ) -> tuple[list[FieldNode], GraphQLObjectType]:
+        edge_type = get_named_type(connection_type.fields["edges"].type)
+        node_type = get_named_type(edge_type.fields["node"].type)
+        nodes = [
+            child
+            for edges in self.fields(node.selection_set)
+            if edges.name.value == "edges"
+            for item in self.fields(edges.selection_set)
+            if item.name.value == "node"
+            for child in self.fields(item.selection_set)
+        ]
+        return nodes, node_type
+
+    async def cost(
+        self,
+        fields: list[FieldNode],
+        parent_type: GraphQLObjectType,
+        parent: Table | None,
+    ) -> int:
+        total = 0
+        for node in fields:
+            field = parent_type.fields.get(node.name.value)
+            if field is None:
+                # Introspection fields such as __typename
+                continue
+            field_type = get_named_type(field.type)
+            table = self.table_for(field_type.name)
+            if table is None or not isinstance(field_type, GraphQLObjectType):
+                continue
+            many = isinstance(get_nullable_type(field.type), GraphQLList)
+            children, child_type = self.fields(node.selection_set), field_type
+            if "first" in field.args:
+                # Relay connection: its rows are the nodes under edges
+                many = True
+                children, child_type = self.connection_nodes(node, field_type)
+            rows = await self.rows(node, field, parent, table, many)
+            if rows:
+                total += rows * (1 + await self.cost(children, child_type, table))
+        return total
+
+
+async def operation_cost(
+    schema: Any,
+    document: DocumentNode,
+    operation_name: str | None,
+    variables: dict[str, Any] | None,
+) -> int:
+    """Estimate the number of rows an operation can touch.
+
+    Args:
+        schema: Strawberry schema the document was validated against.
+        document: Parsed operation document.
+        operation_name: Operation to cost when the document holds several.
+        variables: Request variables, used to read page size arguments.
+
+    Returns:
+        The operation's cost; ``0`` when the operation cannot be found.
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return 0
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    root_type = schema._schema.get_root_type(operation.operation)
+    if root_type is None:
+        return 0
+    walker = _CostWalker(schema, fragments, variables)
+    return await walker.cost(walker.fields(operation.selection_set), root_type, None)
+
+
+class QueryCost(SchemaExtension):
+    """Reject operations whose estimated cost exceeds ``settings.graphql_max_cost``."""
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        """Cost the validated document before any resolver runs."""
+        context = self.execution_context
+        budget = settings.graphql_max_cost
+        if budget > 0 and context.graphql_document is not None:
+            cost = await operation_cost(
+                context.schema, context.graphql_document, context.operation_name, context.variables
+            )
+            if cost > budget:
+                raise GraphQLError(
+                    f"Query cost {cost} exceeds the budget of {budget}",
+                    extensions={"code": "QUERY_TOO_EXPENSIVE", "cost": cost, "budget": budget},
+                )
+        yield
@@ -0,0 +1,228 @@
+"""Foreign-key relationships and batched loading for the GraphQL schema.
+
+Every single-column foreign key between two exposed tables becomes a pair of
+fields: a many-to-one field on the referencing table (``orders.user``) and a
+one-to-many field on the referenced table (``users.orders``).
+
+Resolving such a field for each parent row separately would issue one query
+per row (the N+1 pattern). Instead the resolvers go through per-request
+:class:`~strawberry.dataloader.DataLoader` instances that collect every key
+requested while a level of the query is resolved and fetch them with a single
+``WHERE column IN (...)`` query.
+
+Resolvers read only the columns the query needs: :func:`selected_columns`
+maps a field's selection set to the selected column fields plus the key
+columns that selected relationship fields resolve through.
+
+Examples:
+    >>> relationships = foreign_key_relationships(tables)  # doctest: +SKIP
+    >>> [(rel.name, rel.target) for rel in relationships["orders"]]  # doctest: +SKIP
+    [('user', 'users')]
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Table, select
+from strawberry.dataloader import DataLoader
+from strawberry.types.nodes import SelectedField, Selection
+from strawberry.utils.str_converters import to_camel_case
+
+from graphsql.database import db_manager, read_rows
+from graphsql.serializers import get_serializer
+
+# Keys per IN (...) query; larger batches are split by the loader
+MAX_BATCH_SIZE = 500
+
+
+class Relationship:
+    """A relationship field derived from a foreign key.
+
+    Attributes:
+        name: GraphQL field name on the owning table's type.
+        target: Table the field resolves to.
+        local_column: Column of the owning row holding the lookup key.
+        remote_column: Column of ``target`` matched against that key.
+        many: ``True`` for one-to-many (a list), ``False`` for many-to-one.
+    """
+
+    __slots__ = ("name", "target", "local_column", "remote_column", "many")
+
+    def __init__(
+        self, name: str, target: str, local_column: str, remote_column: str, many: bool
+    ) -> None:
+        """Describe a relationship field."""
+        self.name = name
+        self.target = target
+        self.local_column = local_column
+        self.remote_column = remote_column
+        self.many = many
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        kind = "one-to-many" if self.many else "many-to-one"
+        return f"Relationship({self.name!r} -> {self.target}.{self.remote_column}, {kind})"
+
+
+def _field_name(preferred: str, fallback: str, taken: set[str]) -> str | None:
+    for name in (preferred, fallback):
+        if name.isidentifier() and name not in taken:
+            taken.add(name)
+            return name
+    return None
+
+
+def foreign_key_relationships(tables: Mapping[str, Table]) -> dict[str, list[Relationship]]:
+    """Derive relationship fields from the foreign keys between ``tables``.
+
+    Composite foreign keys and keys referencing tables outside ``tables`` are
+    skipped. Many-to-one fields are named after the key column without its
+    ``_id`` suffix (``user_id`` -> ``user``), one-to-many fields after the
+    referencing table (``orders``). When that name is taken by a column or
+    another relationship, ``<table>_by_<column>`` is used instead.
+
+    Args:
+        tables: Exposed tables by name.
+
+    Returns:
+        Relationships by the name of the table whose type gets the field.
+    """
+    taken = {name: {column.name for column in table.columns} for name, table in tables.items()}
+    relationships: dict[str, list[Relationship]] = defaultdict(list)
+
+    for name, table in tables.items():
+        for constraint in sorted(table.foreign_key_constraints, key=lambda c: c.column_keys):
+            if len(constraint.elements) != 1:
+                continue
+            element = constraint.elements[0]
+            target = element.column.table.name
+            if target not in tables:
+                continue
+            local, remote = element.parent.name, element.column.name
+
+            preferred = local[:-3] if local.endswith("_id") and len(local) > 3 else target
+            field = _field_name(preferred, f"{target}_by_{local}", taken[name])
+            if field is None:
+                logger.warning(f"Skipping relationship {name}.{local}: field name is taken")
+            else:
+                relationships[name].append(Relationship(field, target, local, remote, False))
+
+            field = _field_name(name, f"{name}_by_{local}", taken[target])
+            if field is None:
+                logger.warning(f"Skipping relationship {target} -> {name}: field name is taken")
+            else:
+                relationships[target].append(Relationship(field, name, remote, local, True))
+
+    return dict(relationships)
+
+
+def field_columns(table: Table, relationships: Iterable[Relationship]) -> dict[str, set[str]]:
+    """Map each GraphQL field name of a table type to the columns it reads.
+
+    Column fields read themselves; relationship fields read their local key
+    column. Field names are camel-cased like Strawberry does.
+    """
+    columns = {to_camel_case(column.name): {column.name} for column in table.columns}
+    for relationship in relationships:
+        columns[to_camel_case(relationship.name)] = {relationship.local_column}
+    return columns
+
+
+def _selected_names(selections: Iterable[Selection]) -> Iterator[str]:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection.name
+        else:
+            # Fragment spreads and inline fragments
+            yield from _selected_names(selection.selections)
+
+
+def _selected_children(selections: Iterable[Selection], name: str) -> Iterator[Selection]:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            if selection.name == name:
+                yield from selection.selections
+        else:
+            yield from _selected_children(selection.selections, name)
+
+
+def selected_columns(
+    info: Any,
+    table: Table,
+    columns_by_field: Mapping[str, set[str]],
+    required: Iterable[str] = (),
+    path: Iterable[str] = (),
+) -> list[str]:
+    """Return the columns of ``table`` needed for the field being resolved.
+
+    Args:
+        info: Strawberry ``Info`` of a resolver returning ``table`` rows.
+        table: Table the rows are read from.
+        columns_by_field: Result of :func:`field_columns` for ``table``.
+        required: Columns to read regardless of the selection, e.g. a loader's
+            key column.
+        path: Field names leading from the resolved field to the rows when
+            they are nested, e.g. ``("edges", "node")`` for a connection.
+
+    Returns:
+        Column names in table order; the primary key when nothing else is
+        needed (for example when only ``__typename`` is selected).
+    """
+    selections: list[Selection] = [
+        selection for field in info.selected_fields for selection in field.selections
+    ]
+    for step in path:
+        selections = list(_selected_children(selections, step))
+
+    needed = set(required)
+    for name in _selected_names(selections):
+        needed |= columns_by_field.get(name, set())
+    if not needed:
+        needed = {column.name for column in table.primary_key} or {next(iter(table.columns)).name}
+    return [name for name in table.columns.keys() if name in needed]
+
+
+def _make_loader(table: Table, column: str, many: bool, columns: list[str]) -> DataLoader:
+    serializer = get_serializer(table).project(columns)
+    projection = select(*(table.columns[name] for name in columns))
+
+    async def load(keys: list[Any]) -> list[Any]:
+        rows = await read_rows(projection.where(table.columns[column].in_(keys)))
+        records = [serializer.from_tuple(row) for row in rows]
+        if many:
+            groups: dict[Any, list[dict[str, Any]]] = defaultdict(list)
+            for record in records:
+                groups[record[column]].append(record)
+            return [groups.get(key, []) for key in keys]
+        by_key = {record[column]: record for record in records}
+        return [by_key.get(key) for key in keys]
+
+    return DataLoader(load_fn=load, max_batch_size=MAX_BATCH_SIZE)
+
+
+def get_loader(info: Any, relationship: Relationship, columns: list[str]) -> DataLoader:
+    """Return the request's loader for ``relationship``'s target rows.
+
+    Loaders live in the request context, so batching and de-duplication span
+    one GraphQL operation and nothing is shared between requests. Each
+    distinct column projection gets its own loader.
+
+    Args:
+        info: Strawberry ``Info`` of the relationship resolver.
+        relationship: Relationship being resolved.
+        columns: Target columns to read; must include
+            ``relationship.remote_column``.
+    """
+    loaders = info.context.setdefault("dataloaders", {})
+    key = (relationship.target, relationship.remote_column, relationship.many, tuple(columns))
+    loader = loaders.get(key)
+    if loader is None:
+        table = db_manager.get_table(relationship.target)
+        loader = loaders[key] = _make_loader(
+            table, relationship.remote_column, relationship.many, columns
+        )
+    return loader  # type: ignore[no-any-return]
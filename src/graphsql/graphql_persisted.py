@@ -0,0 +1,83 @@
+"""Automatic persisted queries for the GraphQL endpoint.
+
+Implements the Apollo "automatic persisted queries" (APQ) protocol: a client
+sends only the SHA-256 hash of its operation in
+``extensions.persistedQuery.sha256Hash``. The server returns a
+``PersistedQueryNotFound`` error the first time it sees a hash. The client
+then sends the hash with the full document, and the server stores the
+document in the shared cache (:mod:`graphsql.cache`) so that every replica
+can answer later hash-only requests.
+
+Repeat operations therefore send a few bytes instead of the whole document.
+The schema's parser and validation caches then let them skip parsing and
+validation entirely (see :func:`graphsql.graphql_schema.create_graphql_schema`).
+
+Examples:
+    Register an operation, then replay it by hash only::
+
+        POST /graphql {"query": "{ allUsers { id } }",
+                       "extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}
+        POST /graphql {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import AsyncIterator
+
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from graphsql.cache import cache_get, cache_set
+from graphsql.config import settings
+
+PERSISTED_QUERY_VERSION = 1
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+
+def persisted_query_key(sha256_hash: str) -> str:
+    """Return the cache key holding the document for ``sha256_hash``."""
+    return f"apq:{sha256_hash}"
+
+
+def _error(message: str, code: str) -> GraphQLError:
+    return GraphQLError(message, extensions={"code": code})
+
+
+class PersistedQueries(SchemaExtension):
+    """Resolve ``extensions.persistedQuery`` hashes to stored documents.
+
+    Requests without the extension are left untouched. A document sent along
+    with its hash is verified and stored for
+    ``settings.persisted_query_ttl_seconds``; a hash sent alone is replaced by
+    the stored document before parsing.
+    """
+
+    async def on_operation(self) -> AsyncIterator[None]:
+        """Fill in or register the operation's document before it is parsed."""
+        context = self.execution_context
+        persisted = (context.operation_extensions or {}).get("persistedQuery")
+        if persisted is not None:
+            context.query = await self._resolve(persisted, context.query)
+        yield
+
+    @staticmethod
+    async def _resolve(persisted: object, query: str | None) -> str:
+        if not isinstance(persisted, dict) or persisted.get("version") != PERSISTED_QUERY_VERSION:
+            raise _error("Unsupported persisted query version", "PERSISTED_QUERY_NOT_SUPPORTED")
+        sha256_hash = persisted.get("sha256Hash")
+        if not isinstance(sha256_hash, str) or not _SHA256_HEX.fullmatch(sha256_hash):
+            raise _error("Invalid persisted query hash", "PERSISTED_QUERY_INVALID_HASH")
+
+        key = persisted_query_key(sha256_hash)
+        if query is None:
+            stored = await cache_get(key)
+            if not isinstance(stored, str):
+                raise _error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            return stored
+
+        if hashlib.sha256(query.encode()).hexdigest() != sha256_hash:
+            raise _error("provided sha does not match query", "PERSISTED_QUERY_HASH_MISMATCH")
+        await cache_set(key, query, ttl=settings.persisted_query_ttl_seconds)
+        return query
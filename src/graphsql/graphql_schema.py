@@ -1,22 +1,76 @@
 """GraphQL schema generation using Strawberry."""
 
+from collections.abc import AsyncGenerator
 from typing import Any
 
 import strawberry
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+from strawberry.extensions import ParserCache, SchemaExtension, ValidationCache
 from strawberry.fastapi import GraphQLRouter
 
+from graphsql.cache import (
+    cache_get,
+    cache_record,
+    cache_set,
+    invalidate_table_cache,
+    list_cache_ttl,
+    table_tag,
+    tagged_cache_key,
+)
 from graphsql.config import settings
-from graphsql.database import db_manager, get_db, serialize_model
-from graphsql.events import publish_change
+from graphsql.database import (
+    db_manager,
+    get_db,
+    read_rows,
+    run_in_db_thread,
+    serialize_model,
+)
+from graphsql.events import ROW_ACTIONS, change_events, publish_change
+from graphsql.graphql_cost import QueryCost, page_size
+from graphsql.graphql_loaders import (
+    Relationship,
+    field_columns,
+    foreign_key_relationships,
+    get_loader,
+    selected_columns,
+)
+from graphsql.graphql_persisted import PersistedQueries
+from graphsql.pagination import decode_cursor, encode_cursor, keyset_condition
+from graphsql.serializers import get_serializer, serialize_input
 
 
 def create_graphql_schema() -> GraphQLRouter:
     """Create a Strawberry GraphQL schema from reflected database tables.
 
+    Besides one field per column, each table type gets relationship fields for
+    the foreign keys between exposed tables (see
+    :mod:`graphsql.graphql_loaders`), resolved through per-request DataLoaders.
+    Resolvers select only the columns the query's selection set needs and read
+    through :func:`graphsql.database.read_rows`, so independent root fields of
+    one operation run concurrently against the connection pool.
+
+    Tables with a primary key also get a Relay-style ``<table>Connection``
+    field paginated with ``first``/``after`` keyset cursors on that key, so
+    deep pages cost as little as the first one. ``totalCount`` is only
+    counted when it is selected.
+
+    The schema accepts automatic persisted queries (see
+    :mod:`graphsql.graphql_persisted`) and keeps LRU caches of parsed and
+    validated documents, so repeated operations skip both steps. Operations
+    whose estimated cost exceeds ``settings.graphql_max_cost`` are rejected
+    before any SQL runs (see :mod:`graphsql.graphql_cost`).
+
+    Each table also gets an ``on<Table>Changed`` subscription fed by the
+    Redis change stream (:func:`graphsql.events.change_events`), served over
+    the ``graphql-ws`` and ``graphql-transport-ws`` WebSocket protocols. Its
+    ``action`` and ``where`` arguments are matched on the server, so clients
+    only receive the events they asked for.
+
     Returns:
-        Configured ``GraphQLRouter`` mounted at ``/graphql`` containing queries
-        and mutations for each table discovered via SQLAlchemy automap.
+        Configured ``GraphQLRouter`` mounted at ``/graphql`` containing queries,
+        mutations and subscriptions for each table discovered via SQLAlchemy
+        automap.
 
     Examples:
         Attach the router to a FastAPI app:
@@ -29,6 +83,8 @@ def create_graphql_schema() -> GraphQLRouter:
 
     # Dynamically create types for each table
     table_types: dict[str, Any] = {}
+    column_fields: dict[str, dict[str, Any]] = {}
+    tables: dict[str, Any] = {}
 
     for table_name in db_manager.list_tables():
         model = db_manager.get_model(table_name)
@@ -55,16 +111,83 @@ def create_graphql_schema() -> GraphQLRouter:
 
             fields[column.name] = field_type
 
-        # Create the Strawberry type
-        table_type = strawberry.type(
-            type(
-                f"{table_name.capitalize()}Type",
-                (),
-                {"__annotations__": fields, **dict.fromkeys(fields.keys())},
-            )
+        column_fields[table_name] = fields
+        tables[table_name] = model.__table__
+        # Plain class for now: relationship fields may reference any table type
+        table_types[table_name] = type(
+            f"{table_name.capitalize()}Type",
+            (),
+            # __table__ lets extensions map GraphQL types back to tables
+            {
+                "__annotations__": fields,
+                "__table__": model.__table__,
+                **dict.fromkeys(fields.keys()),
+            },
         )
 
-        table_types[table_name] = table_type
+    def build_instance(tbl_name: str, data: dict[str, Any]) -> Any:
+        instance = table_types[tbl_name]()
+        for key, value in data.items():
+            setattr(instance, key, value)
+        return instance
+
+    relationships_by_table = foreign_key_relationships(tables)
+    columns_by_field = {
+        name: field_columns(table, relationships_by_table.get(name, []))
+        for name, table in tables.items()
+    }
+
+    def make_relationship_resolver(relationship: Relationship, target_type: Any) -> Any:
+        target_table = tables[relationship.target]
+
+        def loader(info: Any) -> Any:
+            columns = selected_columns(
+                info,
+                target_table,
+                columns_by_field[relationship.target],
+                required=[relationship.remote_column],
+            )
+            return get_loader(info, relationship, columns)
+
+        if relationship.many:
+
+            async def many_resolver(root: Any, info: Any) -> list[target_type]:
+                key = getattr(root, relationship.local_column)
+                if key is None:
+                    return []
+                records = await loader(info).load(key)
+                return [build_instance(relationship.target, data) for data in records]
+
+            return many_resolver
+
+        async def one_resolver(root: Any, info: Any) -> target_type | None:
+            key = getattr(root, relationship.local_column)
+            if key is None:
+                return None
+            data = await loader(info).load(key)
+            return build_instance(relationship.target, data) if data is not None else None
+
+        return one_resolver
+
+    for table_name, relationships in relationships_by_table.items():
+        for relationship in relationships:
+            target_type = table_types[relationship.target]
+            setattr(
+                table_types[table_name],
+                relationship.name,
+                strawberry.field(resolver=make_relationship_resolver(relationship, target_type)),
+            )
+
+    for table_name, table_class in table_types.items():
+        # Decorates in place, so references captured above stay valid
+        table_types[table_name] = strawberry.type(table_class)
+
+    @strawberry.type
+    class PageInfo:
+        has_next_page: bool
+        has_previous_page: bool
+        start_cursor: str | None
+        end_cursor: str | None
 
     # Create Query class
     query_fields = {}
@@ -77,53 +200,124 @@ def create_graphql_schema() -> GraphQLRouter:
         def make_single_resolver(
             model_class: Any, pk_col: str, tbl_name: str, table_type: Any
         ) -> Any:
-            def resolver(id: int, info: Any) -> table_type | None:
-                db: Session = next(get_db())
-                try:
-                    record = (
-                        db.query(model_class).filter(getattr(model_class, pk_col) == id).first()
-                    )
+            async def resolver(id: int, info: Any) -> table_type | None:
+                table = model_class.__table__
+                columns = selected_columns(info, table, columns_by_field[tbl_name])
+                stmt = select(*(table.columns[name] for name in columns))
+                rows = await read_rows(stmt.where(table.columns[pk_col] == id).limit(1))
 
-                    if not record:
-                        return None
+                if not rows:
+                    return None
 
-                    data = serialize_model(record)
-                    # Create instance of the type
-                    type_class = table_types[tbl_name]
-                    instance = type_class()
-                    for key, value in data.items():
-                        setattr(instance, key, value)
-                    return instance
-                finally:
-                    db.close()
+                data = get_serializer(table).project(columns).from_tuple(rows[0])
+                return build_instance(tbl_name, data)
 
             return resolver
 
         # List query
         def make_list_resolver(model_class: Any, tbl_name: str, table_type: Any) -> Any:
-            def resolver(
+            async def resolver(
                 limit: int = settings.default_page_size, offset: int = 0, info: Any = None
             ) -> list[table_type]:
-                db: Session = next(get_db())
-                try:
-                    records = (
-                        db.query(model_class)
-                        .offset(offset)
-                        .limit(min(limit, settings.max_page_size))
-                        .all()
+                limit = page_size(limit)
+                if offset < 0:
+                    raise ValueError("offset must not be negative")
+                table = model_class.__table__
+                columns = selected_columns(info, table, columns_by_field[tbl_name])
+                cache_key = None
+                cache_ttl = list_cache_ttl(tbl_name)
+                if cache_ttl is not None:
+                    cache_key = await tagged_cache_key(
+                        table_tag(tbl_name),
+                        "graphql",
+                        [("limit", limit), ("offset", offset), ("fields", ",".join(columns))],
                     )
+                records = await cache_get(cache_key) if cache_key else None
 
-                    result = []
-                    for record in records:
-                        data = serialize_model(record)
-                        type_class = table_types[tbl_name]
-                        instance = type_class()
-                        for key, value in data.items():
-                            setattr(instance, key, value)
-                        result.append(instance)
-                    return result
-                finally:
-                    db.close()
+                if records is None:
+                    stmt = select(*(table.columns[name] for name in columns))
+                    rows = await read_rows(stmt.offset(offset).limit(limit))
+                    serializer = get_serializer(table).project(columns)
+                    records = [serializer.from_tuple(row) for row in rows]
+                    if cache_key is not None:
+                        await cache_set(cache_key, records, ttl=cache_ttl)
+
+                return [build_instance(tbl_name, data) for data in records]
+
+            return resolver
+
+        # Relay connection paginated by a keyset cursor on the primary key
+        def make_connection_resolver(model_class: Any, tbl_name: str, table_type: Any) -> Any:
+            table = model_class.__table__
+
+            edge_type = strawberry.type(
+                type(
+                    f"{tbl_name.capitalize()}Edge",
+                    (),
+                    {"__annotations__": {"node": table_type, "cursor": str}},
+                )
+            )
+
+            async def total_count() -> int:
+                rows = await read_rows(select(func.count()).select_from(table))
+                return int(rows[0][0])
+
+            # A resolver field, so the COUNT only runs when totalCount is selected
+            connection_type = strawberry.type(
+                type(
+                    f"{tbl_name.capitalize()}Connection",
+                    (),
+                    {
+                        "__annotations__": {
+                            "edges": list[edge_type],  # type: ignore[valid-type]
+                            "page_info": PageInfo,
+                        },
+                        "__table__": table,
+                        "total_count": strawberry.field(resolver=total_count),
+                    },
+                )
+            )
+
+            async def resolver(
+                first: int = settings.default_page_size, after: str | None = None, info: Any = None
+            ) -> connection_type:  # type: ignore[valid-type]
+                first = page_size(first, "first")
+                keys = [(column, False) for column in table.primary_key.columns]
+                key_names = [column.name for column, _ in keys]
+                columns = selected_columns(
+                    info, table, columns_by_field[tbl_name], key_names, ("edges", "node")
+                )
+                stmt = select(*(table.columns[name] for name in columns))
+                stmt = stmt.order_by(*(column for column, _ in keys))
+                if after:
+                    try:
+                        stmt = stmt.where(keyset_condition(keys, decode_cursor(after, len(keys))))
+                    except ValueError as e:
+                        raise ValueError(f"Invalid cursor: {e}") from e
+
+                # Fetch one extra row to learn whether another page exists. An
+                # empty page (e.g. for totalCount alone) reads nothing and
+                # reports no next page, so clients cannot loop on it.
+                rows = await read_rows(stmt.limit(first + 1)) if first else []
+                serializer = get_serializer(table).project(columns)
+                records = [serializer.from_tuple(row) for row in rows[:first]]
+                edges = [
+                    edge_type(
+                        node=build_instance(tbl_name, data),
+                        cursor=encode_cursor([data[name] for name in key_names]),
+                    )
+                    for data in records
+                ]
+
+                return connection_type(  # type: ignore[no-any-return]
+                    edges=edges,
+                    page_info=PageInfo(
+                        has_next_page=len(rows) > first,
+                        has_previous_page=bool(after),
+                        start_cursor=edges[0].cursor if edges else None,
+                        end_cursor=edges[-1].cursor if edges else None,
+                    ),
+                )
 
             return resolver
 
@@ -131,6 +325,9 @@ def create_graphql_schema() -> GraphQLRouter:
             query_fields[table_name] = strawberry.field(
                 resolver=make_single_resolver(model, pk_column, table_name, table_type)
             )
+            query_fields[f"{table_name}_connection"] = strawberry.field(
+                resolver=make_connection_resolver(model, table_name, table_type)
+            )
 
         query_fields[f"all_{table_name}"] = strawberry.field(
             resolver=make_list_resolver(model, table_name, table_type)
@@ -151,7 +348,8 @@ def create_graphql_schema() -> GraphQLRouter:
         # Create mutation input type
         input_fields: dict[str, Any] = {}
         for column in model.__table__.columns:  # type: ignore[union-attr]
-            if not column.primary_key and not column.autoincrement:
+            # Reflected columns report autoincrement="auto", which is truthy
+            if not column.primary_key and column.autoincrement is not True:
                 python_type = column.type.python_type
 
                 input_field_type: type
@@ -191,22 +389,24 @@ def create_graphql_schema() -> GraphQLRouter:
                         if v is not None and not k.startswith("_")
                     }
 
-                    new_record = model_class(**data_dict)
-                    db.add(new_record)
-                    db.commit()
-                    db.refresh(new_record)
+                    def _insert() -> dict[str, Any]:
+                        new_record = model_class(**data_dict)
+                        db.add(new_record)
+                        db.commit()
+                        db.refresh(new_record)
+                        return serialize_model(new_record)
 
-                    result_data = serialize_model(new_record)
+                    result_data = await run_in_db_thread(_insert)
 
+                    pk_col = db_manager.get_primary_key_column(tbl_name)
+                    if pk_col and result_data.get(pk_col) is not None:
+                        await cache_record(tbl_name, result_data[pk_col], result_data, written=True)
+                    await invalidate_table_cache(tbl_name)
                     await publish_change(tbl_name, "created", result_data)
 
-                    type_class = table_types[tbl_name]
-                    instance = type_class()
-                    for key, value in result_data.items():
-                        setattr(instance, key, value)
-                    return instance
+                    return build_instance(tbl_name, result_data)
                 except Exception as e:
-                    db.rollback()
+                    await run_in_db_thread(db.rollback)
                     raise e
                 finally:
                     db.close()
@@ -223,7 +423,82 @@ def create_graphql_schema() -> GraphQLRouter:
     # Create Mutation type dynamically with collected fields
     Mutation = strawberry.type(type("Mutation", (), mutation_fields))
 
+    # Create Subscription class
+    subscription_fields = {}
+
+    for table_name, table_type in table_types.items():
+        # Every column is an optional equality filter
+        filter_fields = dict(column_fields[table_name])
+        filter_type = strawberry.input(
+            type(
+                f"{table_name.capitalize()}Filter",
+                (),
+                {
+                    "__annotations__": filter_fields,
+                    **dict.fromkeys(filter_fields.keys(), strawberry.UNSET),
+                },
+            )
+        )
+        event_type = strawberry.type(
+            type(
+                f"{table_name.capitalize()}ChangeEvent",
+                (),
+                {"__annotations__": {"action": str, "record": table_type | None}},
+            )
+        )
+
+        def make_subscription(tbl_name: str, event_type: Any, filter_type: Any) -> Any:
+            async def subscription(
+                action: str | None = None, where: filter_type | None = None
+            ) -> AsyncGenerator[event_type, None]:
+                # Records arrive serialized; compare inputs in the same form
+                columns = tables[tbl_name].columns
+                try:
+                    conditions = {
+                        key: serialize_input(columns[key], value)
+                        for key, value in (vars(where).items() if where else ())
+                        if value is not strawberry.UNSET
+                    }
+                except ValueError as e:
+                    raise ValueError(f"Invalid filter: {e}") from e
+                async for payload in change_events(tbl_name):
+                    event_action = payload.get("action")
+                    if action is not None and event_action != action:
+                        continue
+                    # Bulk events carry a summary, not a row, so they never match filters
+                    record = payload.get("record") if event_action in ROW_ACTIONS else None
+                    if conditions and (
+                        not isinstance(record, dict)
+                        or any(record.get(key) != value for key, value in conditions.items())
+                    ):
+                        continue
+                    yield event_type(
+                        action=event_action,
+                        record=build_instance(tbl_name, record) if record else None,
+                    )
+
+            return subscription
+
+        subscription_fields[f"on_{table_name}_changed"] = strawberry.subscription(
+            resolver=make_subscription(table_name, event_type, filter_type)
+        )
+
+    # Create Subscription type dynamically with collected fields
+    Subscription = (
+        strawberry.type(type("Subscription", (), subscription_fields))
+        if subscription_fields
+        else None
+    )
+
     # Create schema
-    schema = strawberry.Schema(query=Query, mutation=Mutation)
+    extensions: list[type[SchemaExtension] | SchemaExtension] = [PersistedQueries, QueryCost]
+    if settings.graphql_document_cache_size > 0:
+        extensions += [
+            ParserCache(maxsize=settings.graphql_document_cache_size),
+            ValidationCache(maxsize=settings.graphql_document_cache_size),
+        ]
+    schema = strawberry.Schema(
+        query=Query, mutation=Mutation, subscription=Subscription, extensions=extensions
+    )
 
     return GraphQLRouter(schema, path="/graphql")
@@ -6,18 +6,24 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from loguru import logger
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from graphsql.auth_routes import router as auth_router
-from graphsql.cache import close_redis
+from graphsql.cache import (
+    cache_stats,
+    close_redis,
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
 from graphsql.config import settings
-from graphsql.database import db_manager
+from graphsql.database import db_manager, run_in_db_thread
+from graphsql.encoding import FastJSONResponse
 from graphsql.graphql_schema import create_graphql_schema
 from graphsql.rate_limit import limiter
 from graphsql.rest_routes import router as rest_router
+from graphsql.warmup import warm_cache
 from graphsql.websocket_routes import router as websocket_router
 
 # Configure loguru sink to mirror the requested log level early at import time.
@@ -35,6 +41,9 @@ logger.add(
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Emit startup and shutdown logs for the application.
 
+    Startup also warms the caches (see :func:`graphsql.warmup.warm_cache`),
+    which takes at most ``settings.cache_warmup_budget_seconds``.
+
     Args:
         app: The running FastAPI application.
 
@@ -45,12 +54,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting Auto API...")
     logger.info(f"Database: {settings.database_url.split('@')[-1]}")  # Hide credentials
     logger.info(f"Found {len(db_manager.list_tables())} tables")
+    await start_invalidation_listener()
+    await warm_cache()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Auto API...")
+    await stop_invalidation_listener()
     await close_redis()
+    if db_manager.async_engine is not None:
+        await db_manager.async_engine.dispose()
 
 
 # Create FastAPI app
@@ -59,6 +73,7 @@ app = FastAPI(
     description="Automatic REST and GraphQL API for any database",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -78,7 +93,7 @@ app.add_middleware(
 
 
 @app.get("/", tags=["Root"])
-async def root() -> JSONResponse:
+async def root() -> FastJSONResponse:
     """Return basic API metadata and discovered tables.
 
     Returns:
@@ -89,7 +104,7 @@ async def root() -> JSONResponse:
         >>> resp.body  # doctest: +SKIP
         b'{"name": "Auto API", ...}'
     """
-    return JSONResponse(
+    return FastJSONResponse(
         {
             "name": "Auto API",
             "version": "0.1.0",
@@ -105,25 +120,35 @@ async def root() -> JSONResponse:
 
 
 @app.get("/health", tags=["Health"])
-async def health_check() -> JSONResponse:
+async def health_check() -> FastJSONResponse:
     """Perform a lightweight database connectivity check.
 
+    The ``SELECT 1`` probe runs on the database thread pool so a stalled
+    database cannot block the event loop. The payload also reports hit/miss
+    counters for the local and Redis cache tiers.
+
     Returns:
         JSON health status payload; reports 503 on failure.
 
     Examples:
         >>> await health_check()  # doctest: +SKIP
-        <JSONResponse status_code=200>
+        <FastJSONResponse status_code=200>
     """
     try:
         # Test database connection
+        await run_in_db_thread(db_manager.ping)
         tables = db_manager.list_tables()
-        return JSONResponse(
-            {"status": "healthy", "database": "connected", "tables_count": len(tables)}
+        return FastJSONResponse(
+            {
+                "status": "healthy",
+                "database": "connected",
+                "tables_count": len(tables),
+                "cache": cache_stats(),
+            }
         )
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return JSONResponse(status_code=503, content={"status": "unhealthy", "error": str(e)})
+        return FastJSONResponse(status_code=503, content={"status": "unhealthy", "error": str(e)})
 
 
 # Include REST routes
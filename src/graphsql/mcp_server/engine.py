@@ -27,6 +27,7 @@ from sqlalchemy.engine import Engine
 from graphsql.mcp_server.config import MCPServerConfig, get_config
 from graphsql.mcp_server.db import get_session, reflect_metadata
 from graphsql.mcp_server.security import SecurityValidator, get_validator
+from graphsql.serializers import serialize_value, serializer_for_result
 
 logger = logging.getLogger(__name__)
 
@@ -214,11 +215,12 @@ class GraphSQLEngine:
                         rows = result.fetchall()
                         columns = list(result.keys())
 
-                        # Convert rows to dictionaries
-                        data = [dict(zip(columns, row, strict=True)) for row in rows]
-
-                        # Serialize special types
-                        data = [self._serialize_row(row) for row in data]
+                        # Convert rows to serialized dictionaries with a
+                        # serializer specialized for this result's columns
+                        serializer = serializer_for_result(
+                            columns, rows[0] if rows else None, self._serialize_value
+                        )
+                        data = [serializer.from_tuple(row) for row in rows]
 
                         execution_time = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -529,33 +531,20 @@ class GraphSQLEngine:
         except Exception:
             return None
 
-    def _serialize_row(self, row: dict[str, Any]) -> dict[str, Any]:
-        """Serialize a row dictionary for JSON output.
-
-        Handles special types like datetime, bytes, Decimal, etc.
+    @staticmethod
+    def _serialize_value(value: Any) -> Any:
+        """Serialize one value, stringifying arbitrary objects.
 
         Args:
-            row: Row dictionary to serialize.
+            value: Raw value from a result row.
 
         Returns:
-            Serialized row dictionary.
+            JSON-friendly value.
         """
-        from datetime import date, datetime
-        from decimal import Decimal
-
-        result: dict[str, Any] = {}
-        for key, value in row.items():
-            if isinstance(value, (datetime, date)):
-                result[key] = value.isoformat()
-            elif isinstance(value, Decimal):
-                result[key] = float(value)
-            elif isinstance(value, bytes):
-                result[key] = value.decode("utf-8", errors="ignore")
-            elif hasattr(value, "__dict__"):
-                result[key] = str(value)
-            else:
-                result[key] = value
-        return result
+        value = serialize_value(value)
+        if hasattr(value, "__dict__"):
+            return str(value)
+        return value
 
     @contextmanager
     def _timeout_context(self) -> Generator[None, None, None]:
@@ -16,7 +16,6 @@ Example:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import sys
 from typing import Any
@@ -28,6 +27,7 @@ from mcp.types import (
     Tool,
 )
 
+from graphsql.encoding import dumps_str
 from graphsql.mcp_server.config import MCPServerConfig, get_config
 from graphsql.mcp_server.db import close_engine, get_engine, test_connection
 from graphsql.mcp_server.engine import get_graphsql_engine
@@ -106,7 +106,7 @@ def create_mcp_server(config: MCPServerConfig | None = None) -> Server:
             if name == "sql_query":
                 sql_result = tools.sql_query(arguments.get("query", ""))
                 return [
-                    TextContent(type="text", text=json.dumps(sql_result.model_dump(), indent=2))
+                    TextContent(type="text", text=dumps_str(sql_result.model_dump(), indent=True))
                 ]
 
             elif name == "graphql_query":
@@ -115,26 +115,30 @@ def create_mcp_server(config: MCPServerConfig | None = None) -> Server:
                     arguments.get("variables"),
                 )
                 return [
-                    TextContent(type="text", text=json.dumps(gql_result.model_dump(), indent=2))
+                    TextContent(type="text", text=dumps_str(gql_result.model_dump(), indent=True))
                 ]
 
             elif name == "schema_introspect":
                 schema_result = tools.schema_introspect(arguments.get("table_name"))
                 return [
-                    TextContent(type="text", text=json.dumps(schema_result.model_dump(), indent=2))
+                    TextContent(
+                        type="text", text=dumps_str(schema_result.model_dump(), indent=True)
+                    )
                 ]
 
             elif name == "health_check":
                 health_result = tools.health_check()
                 return [
-                    TextContent(type="text", text=json.dumps(health_result.model_dump(), indent=2))
+                    TextContent(
+                        type="text", text=dumps_str(health_result.model_dump(), indent=True)
+                    )
                 ]
 
             else:
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps({"error": f"Unknown tool: {name}"}),
+                        text=dumps_str({"error": f"Unknown tool: {name}"}),
                     )
                 ]
 
@@ -143,7 +147,7 @@ def create_mcp_server(config: MCPServerConfig | None = None) -> Server:
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps({"error": str(e), "success": False}),
+                    text=dumps_str({"error": str(e), "success": False}),
                 )
             ]
 
@@ -0,0 +1,150 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset pagination makes the database walk and discard every skipped row, so
+deep pages get slower the further a client scrolls. Keyset pagination instead
+remembers the sort-key values of the last row returned and seeks directly past
+them, which keeps every page as cheap as the first one.
+
+Cursors are opaque to clients: they are URL-safe base64 encoded JSON arrays of
+the sort-key values of the last row on a page.
+
+``NULL`` sorts after every value, i.e. last ascending and first descending, on
+every dialect: :func:`keyset_order` spells the placement out with a ``CASE``
+key rather than ``NULLS LAST``, which MySQL does not support.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import and_, case, false, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort-key values into an opaque cursor string.
+
+    Args:
+        values: Sort-key values of the last row on a page.
+
+    Returns:
+        URL-safe cursor string without padding.
+
+    Examples:
+        >>> encode_cursor([42])
+        'WzQyXQ'
+    """
+    raw = json.dumps(list(values), default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string received from a client.
+        size: Expected number of sort-key values.
+
+    Returns:
+        Decoded sort-key values.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match ``size``.
+
+    Examples:
+        >>> decode_cursor("WzQyXQ", 1)
+        [42]
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Cursor does not match the requested sort keys")
+    return values
+
+
+def coerce_cursor_value(column: Any, value: Any) -> Any:
+    """Convert a decoded cursor value back to the column's Python type.
+
+    Cursor values travel as JSON, so dates and datetimes arrive as ISO strings
+    and must be parsed again before they are bound to a comparison.
+    """
+    if not isinstance(value, str):
+        return value
+
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def keyset_order(keys: Sequence[tuple[Any, bool]]) -> list[ColumnElement[Any]]:
+    """Build ``ORDER BY`` clauses for ``(column, descending)`` sort keys.
+
+    Nullable columns are preceded by a ``CASE`` key that places ``NULL`` after
+    every value, matching :func:`keyset_condition`.
+    """
+    clauses: list[ColumnElement[Any]] = []
+    for column, descending in keys:
+        if getattr(column, "nullable", False):
+            is_null = case((column.is_(None), 1), else_=0)
+            clauses.append(is_null.desc() if descending else is_null.asc())
+        clauses.append(column.desc() if descending else column.asc())
+    return clauses
+
+
+def _seek_step(column: Any, descending: bool, value: Any) -> ColumnElement[bool]:
+    """Select rows that sort strictly after ``value`` in one key."""
+    nullable = getattr(column, "nullable", False)
+    if value is None:
+        # Ascending, nothing sorts after NULL; descending, every value does
+        return column.is_not(None) if descending else false()
+    if descending:
+        return column < value
+    return or_(column > value, column.is_(None)) if nullable else column > value
+
+
+def keyset_condition(
+    keys: Sequence[tuple[Any, bool]], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    """Build a ``WHERE`` clause that seeks past a row's sort-key values.
+
+    The comparison is expanded into ``(k1 > v1) OR (k1 = v1 AND k2 > v2) ...``
+    rather than a row-value comparison so that it works on every dialect and
+    supports mixed sort directions. ``NULL`` values are sought past in the
+    order produced by :func:`keyset_order`.
+
+    Args:
+        keys: ``(column, descending)`` pairs in sort order.
+        values: Sort-key values of the last row already returned.
+
+    Returns:
+        SQLAlchemy boolean clause selecting rows strictly after ``values``.
+    """
+    clauses = []
+    for index, (column, descending) in enumerate(keys):
+        value = coerce_cursor_value(column, values[index])
+        equal_prefix = [
+            (
+                prev_column.is_(None)
+                if values[prev_index] is None
+                else prev_column == coerce_cursor_value(prev_column, values[prev_index])
+            )
+            for prev_index, (prev_column, _) in enumerate(keys[:index])
+        ]
+        clauses.append(and_(*equal_prefix, _seek_step(column, descending, value)))
+    return or_(*clauses)
@@ -1,28 +1,110 @@
 """REST API routes."""
 
-from typing import Any
+import csv
+import io
+from collections.abc import AsyncIterator, Generator
+from typing import Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi import Query as QueryParam
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import Table, select
 from sqlalchemy.orm import Session
-
-from graphsql.cache import cache_get, cache_set
+from sqlalchemy.sql import Select
+
+from graphsql.bulk import (
+    ConflictMode,
+    delete_where,
+    insert_batch,
+    iter_batches,
+    iter_ndjson,
+    iter_rows,
+    parse_json_array,
+    update_where,
+)
+from graphsql.cache import (
+    cache_get,
+    cache_get_or_set,
+    cache_record,
+    cache_set,
+    count_cache_key,
+    evict_record,
+    evict_table_records,
+    get_cached_record,
+    invalidate_table_cache,
+    list_cache_ttl,
+    table_tag,
+    tagged_cache_key,
+)
 from graphsql.config import settings
-from graphsql.database import db_manager, get_db, serialize_model
+from graphsql.database import (
+    db_manager,
+    fetch_rows,
+    get_db,
+    run_in_db_thread,
+    serialize_model,
+)
+from graphsql.encoding import FastJSONResponse, dumps
 from graphsql.events import publish_change
+from graphsql.filters import parse_filters
+from graphsql.pagination import decode_cursor, encode_cursor, keyset_condition, keyset_order
 from graphsql.rate_limit import limiter
+from graphsql.serializers import get_serializer
 
 router = APIRouter(prefix="/api", tags=["REST API"])
 
+CountStrategy = Literal["exact", "estimated", "cached", "none"]
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+# Query parameters of get_all_records that are not column filters
+LIST_QUERY_PARAMS = frozenset({"offset", "limit", "after", "count", "sort", "fields"})
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+
 
 class PaginatedResponse(BaseModel):
-    """Paginated response model."""
+    """Paginated response model.
+
+    ``total`` is ``None`` when the count strategy is ``none``; ``count_strategy``
+    reports how the total was actually obtained (an ``estimated`` request falls
+    back to ``exact`` when no catalog statistics exist).
+    """
 
     data: list[dict[str, Any]]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
+    count_strategy: str = "exact"
+
+
+class BulkBatchResult(BaseModel):
+    """Outcome of one bulk-insert batch."""
+
+    batch: int
+    rows: int
+    status: Literal["ok", "error"]
+    error: str | None = None
+
+
+class BulkInsertResponse(BaseModel):
+    """Aggregated outcome of a bulk insert request."""
+
+    inserted: int
+    failed: int
+    batches: list[BulkBatchResult]
+
+
+class BulkMutationResponse(BaseModel):
+    """Outcome of a filter-based update or delete.
+
+    ``records`` holds the affected rows when the database supports
+    ``RETURNING``; otherwise it is ``None`` and only ``affected`` is known.
+    """
+
+    affected: int
+    records: list[dict[str, Any]] | None = None
 
 
 @router.get("/tables", response_model=dict[str, list[str]])
@@ -37,14 +119,11 @@ async def list_tables(request: Request) -> dict[str, list[str]]:
         >>> await list_tables()  # doctest: +SKIP
         {'tables': ['users', 'orders']}
     """
-    cache_key = "tables:list"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached  # type: ignore[no-any-return]
 
-    tables: dict[str, list[str]] = {"tables": db_manager.list_tables()}
-    await cache_set(cache_key, tables)
-    return tables
+    async def _load() -> dict[str, list[str]]:
+        return {"tables": db_manager.list_tables()}
+
+    return await cache_get_or_set("tables:list", _load)  # type: ignore[return-value]
 
 
 @router.get("/tables/{table_name}/info")
@@ -61,16 +140,13 @@ async def get_table_info(request: Request, table_name: str) -> dict[str, Any]:
     Raises:
         HTTPException: If the table does not exist.
     """
-    cache_key = f"tables:info:{table_name}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached  # type: ignore[no-any-return]
 
-    info = db_manager.get_table_info(table_name)
+    async def _load() -> dict[str, Any] | None:
+        return db_manager.get_table_info(table_name)
+
+    info = await cache_get_or_set(f"tables:info:{table_name}", _load)
     if not info:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
-
-    await cache_set(cache_key, info)
     return info
 
 
@@ -81,54 +157,370 @@ async def get_all_records(
     table_name: str,
     offset: int = QueryParam(0, ge=0),
     limit: int = QueryParam(settings.default_page_size, ge=1),
+    after: str | None = QueryParam(
+        None, description="Keyset cursor; pass an empty value to start cursor pagination"
+    ),
+    count: CountStrategy | None = QueryParam(
+        None, description="Override the configured total-count strategy"
+    ),
+    sort: str | None = QueryParam(
+        None, description="Comma-separated columns; prefix with '-' for descending"
+    ),
+    fields: str | None = QueryParam(None, description="Comma-separated columns to return"),
     db: Session = Depends(get_db),
-) -> PaginatedResponse:
+) -> Response:
     """Get paginated records from a table.
 
+    Any other query parameter is a typed column filter
+    (``column[__op]=value``, see :mod:`graphsql.filters`). Filters, ``sort``
+    and ``fields`` are compiled into the SQL statement, so only matching rows
+    and requested columns are read and serialized.
+
+    Passing ``after`` switches from offset to keyset pagination: rows are
+    ordered by the sort columns followed by the primary key, and each page
+    seeks past the last key of the previous one, so deep pages cost the same
+    as the first.
+
+    Tables enabled in ``settings.list_cache_tables`` serve repeated pages from
+    the cache; every write to the table invalidates them at once.
+
     Args:
         table_name: Name of the table to query.
-        offset: Number of rows to skip.
+        offset: Number of rows to skip (ignored in cursor mode).
         limit: Maximum number of rows to return.
+        after: Cursor returned as ``next_cursor`` by the previous page.
+        count: Total-count strategy for this request; defaults to
+            ``settings.count_strategy``. Filtered listings always count exactly.
+        sort: Sort columns, e.g. ``-created_at,name``.
+        fields: Projection, e.g. ``id,name``.
         db: Database session dependency.
 
     Returns:
         PaginatedResponse containing records and pagination metadata.
 
     Raises:
-        HTTPException: If the table does not exist.
+        HTTPException: If the table does not exist, a filter, sort or field is
+        invalid, or the cursor is invalid or used on a table without a
+        primary key.
 
     Examples:
         A simple GET with pagination parameters::
 
             curl "http://localhost:8000/api/users?limit=20&offset=0"
+
+        Filter, sort and project::
+
+            curl "http://localhost:8000/api/users?age__gte=21&sort=-age,name&fields=id,name"
+
+        Walk a table with cursors::
+
+            curl "http://localhost:8000/api/users?limit=20&after="
+            curl "http://localhost:8000/api/users?limit=20&after=WzIwXQ"
     """
     model = db_manager.get_model(table_name)
     if not model:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
 
+    table = db_manager.get_table(table_name)
+    try:
+        conditions = parse_filters(
+            table, request.query_params.multi_items(), reserved=LIST_QUERY_PARAMS
+        )
+        order = _parse_sort(table, sort) if sort else []
+        selected = _parse_fields(table, fields) if fields else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
     # Enforce max page size defensively
     safe_limit = min(limit, settings.max_page_size)
 
-    # Get total count
-    total = db.query(model).count()
+    cache_key = None
+    cache_ttl = list_cache_ttl(table_name)
+    if cache_ttl is not None:
+        cache_key = await tagged_cache_key(
+            table_tag(table_name), "rest", request.query_params.multi_items()
+        )
+        cached = await cache_get(cache_key) if cache_key else None
+        if cached is not None:
+            return FastJSONResponse(cached)
+
+    total, strategy = await _resolve_total(
+        db, model, table_name, count or settings.count_strategy, conditions
+    )
+
+    if after is not None:
+        page = await _get_keyset_page(
+            db, table, after, safe_limit, total, strategy, conditions, order, selected
+        )
+    else:
+        stmt = _build_list_select(table, conditions, order, selected)
+        records = await run_in_db_thread(fetch_rows, db, stmt.offset(offset).limit(safe_limit))
+        page = _page(
+            _serialize_records(table, records, selected), total, safe_limit, offset, strategy
+        )
+
+    if cache_key is not None:
+        await cache_set(cache_key, page, ttl=cache_ttl)
+    # Rows are already JSON-ready; skip re-validating them through the response model
+    return FastJSONResponse(page)
+
+
+def _page(
+    data: list[dict[str, Any]],
+    total: int | None,
+    limit: int,
+    offset: int,
+    strategy: str,
+    next_cursor: str | None = None,
+) -> dict[str, Any]:
+    """Assemble a listing page shaped like :class:`PaginatedResponse`."""
+    return {
+        "data": data,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor,
+        "count_strategy": strategy,
+    }
+
+
+def _parse_sort(table: Table, sort: str) -> list[tuple[Any, bool]]:
+    """Parse ``sort=-a,b`` into ``(column, descending)`` pairs."""
+    order = []
+    for item in sort.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        descending = item.startswith("-")
+        name = item.lstrip("+-")
+        if name not in table.columns:
+            raise ValueError(f"Unknown sort column '{name}'")
+        order.append((table.columns[name], descending))
+    return order
+
+
+def _parse_fields(table: Table, fields: str) -> list[str]:
+    """Parse ``fields=a,b`` into a validated list of column names."""
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in table.columns]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+
+def _build_list_select(
+    table: Table,
+    conditions: list[Any],
+    order: list[tuple[Any, bool]],
+    columns: list[str] | None,
+) -> Select:
+    """Build the listing ``select`` with filters, ordering and optional projection.
+
+    Listings are read as Core rows (see :func:`graphsql.database.fetch_rows`);
+    with a projection only the named columns are selected.
+    """
+    if columns is None:
+        stmt = select(table)
+    else:
+        stmt = select(*(table.columns[name] for name in columns))
+    if conditions:
+        stmt = stmt.where(*conditions)
+    if order:
+        stmt = stmt.order_by(*keyset_order(order))
+    return stmt
+
+
+def _serialize_records(
+    table: Table, records: list[Any], fields: list[str] | None
+) -> list[dict[str, Any]]:
+    """Serialize Core rows whose columns are the table's, or ``fields`` first.
+
+    Rows are read by position with the table's precompiled serializer.
+    """
+    serializer = get_serializer(table)
+    if fields is not None:
+        serializer = serializer.project(fields)
+    return [serializer.from_tuple(record) for record in records]
+
+
+async def _resolve_total(
+    db: Session,
+    model: Any,
+    table_name: str,
+    strategy: str,
+    conditions: list[Any] | None = None,
+) -> tuple[int | None, str]:
+    """Compute a listing total according to the requested count strategy.
+
+    Catalog estimates and cached counts describe the whole table, so filtered
+    listings fall back to an exact ``COUNT`` of the matching rows.
+
+    Returns:
+        The total (``None`` for the ``none`` strategy) and the strategy that
+        actually produced it.
+    """
+    if strategy == "none":
+        return None, "none"
+
+    query = db.query(model)
+    if conditions:
+        return await run_in_db_thread(query.filter(*conditions).count), "exact"
+
+    if strategy == "estimated":
+        estimate = await run_in_db_thread(db_manager.estimate_row_count, table_name)
+        if estimate is not None:
+            return estimate, "estimated"
+        return await run_in_db_thread(query.count), "exact"
+
+    if strategy == "cached":
+        cache_key = count_cache_key(table_name)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return int(cached), "cached"
+        total = await run_in_db_thread(query.count)
+        await cache_set(cache_key, total, ttl=settings.count_cache_ttl_seconds)
+        return total, "cached"
+
+    return await run_in_db_thread(query.count), "exact"
+
+
+async def _get_keyset_page(
+    db: Session,
+    table: Table,
+    after: str,
+    limit: int,
+    total: int | None,
+    strategy: str,
+    conditions: list[Any],
+    order: list[tuple[Any, bool]],
+    fields: list[str] | None,
+) -> dict[str, Any]:
+    """Fetch one page in cursor mode.
+
+    The seek key is the requested sort order followed by any primary key
+    columns not already in it, which makes the ordering total.
+    """
+    pk_columns = [column.name for column in table.primary_key.columns]
+    if not pk_columns:
+        raise HTTPException(status_code=400, detail="Cursor pagination requires a primary key")
+
+    sorted_names = {column.name for column, _ in order}
+    keys = order + [(table.columns[name], False) for name in pk_columns if name not in sorted_names]
+    key_names = [column.name for column, _ in keys]
+
+    # Projections must still select the seek columns to build the next cursor
+    columns = None
+    if fields is not None:
+        columns = fields + [name for name in key_names if name not in fields]
+
+    stmt = _build_list_select(table, conditions, keys, columns)
+    if after:
+        try:
+            values = decode_cursor(after, len(keys))
+            stmt = stmt.where(keyset_condition(keys, values))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}") from e
+
+    # Fetch one extra row to learn whether another page exists
+    records = await run_in_db_thread(fetch_rows, db, stmt.limit(limit + 1))
+    has_more = len(records) > limit
+    records = records[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = records[-1]._mapping
+        next_cursor = encode_cursor([last[name] for name in key_names])
+
+    return _page(_serialize_records(table, records, fields), total, limit, 0, strategy, next_cursor)
+
+
+@router.get("/{table_name}/export")
+@limiter.limit(settings.rate_limit_tables)
+async def export_records(
+    request: Request,
+    table_name: str,
+    format: ExportFormat = QueryParam("ndjson", description="Output format"),
+) -> StreamingResponse:
+    """Stream every row of a table as NDJSON or CSV.
+
+    Rows are read through a server-side cursor in batches of
+    ``settings.export_batch_size`` and written to the client as they arrive,
+    so memory use stays constant regardless of table size and no total count
+    is computed.
+
+    Args:
+        table_name: Name of the table to export.
+        format: ``ndjson`` (one JSON object per line) or ``csv`` with a header.
+
+    Returns:
+        Streaming response with the serialized rows.
+
+    Raises:
+        HTTPException: If the table does not exist.
+
+    Examples:
+        Dump a table to a file::
 
-    # Get paginated records
-    records = db.query(model).offset(offset).limit(safe_limit).all()
+            curl -o users.ndjson "http://localhost:8000/api/users/export"
+            curl -o users.csv "http://localhost:8000/api/users/export?format=csv"
+    """
+    table = db_manager.get_table(table_name)
+    if table is None:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
 
-    return PaginatedResponse(
-        data=[serialize_model(record) for record in records],
-        total=total,
-        limit=safe_limit,
-        offset=offset,
+    return StreamingResponse(
+        _stream_export(table, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{table_name}.{format}"'},
     )
 
 
+async def _stream_export(table: Table, fmt: str) -> AsyncIterator[str | bytes]:
+    """Drive the blocking export generator one batch at a time off the event loop."""
+    chunks = _iter_export_chunks(table, fmt)
+    try:
+        while True:
+            chunk = await run_in_db_thread(next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        await run_in_db_thread(chunks.close)
+
+
+def _iter_export_chunks(table: Table, fmt: str) -> Generator[str | bytes, None, None]:
+    """Yield serialized batches of rows read from a server-side cursor."""
+    columns = [column.name for column in table.columns]
+    serializer = get_serializer(table)
+
+    with db_manager.engine.connect() as conn:
+        result = conn.execution_options(stream_results=True).execute(select(table))
+
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue()
+
+        for partition in result.partitions(settings.export_batch_size):
+            rows = [serializer.from_tuple(row) for row in partition]
+            if fmt == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows([row[name] for name in columns] for row in rows)
+                yield buffer.getvalue()
+            else:
+                yield b"".join(dumps(row) + b"\n" for row in rows)
+
+
 @router.get("/{table_name}/{record_id}")
-async def get_record(
-    table_name: str, record_id: int, db: Session = Depends(get_db)
-) -> dict[str, Any]:
+async def get_record(table_name: str, record_id: int, db: Session = Depends(get_db)) -> Response:
     """Get a specific record by ID.
 
+    Tables enabled in ``settings.record_cache_tables`` are served read-through
+    from the Redis record cache; writes through this API refresh or evict the
+    cached entry.
+
     Args:
         table_name: Name of the table to query.
         record_id: Primary key value of the record.
@@ -142,8 +534,8 @@ async def get_record(
         key is defined.
 
     Examples:
-        >>> await get_record("users", 1)  # doctest: +SKIP
-        {'id': 1, 'name': 'Alice'}
+        >>> (await get_record("users", 1)).body  # doctest: +SKIP
+        b'{"id":1,"name":"Alice"}'
     """
     model = db_manager.get_model(table_name)
     if not model:
@@ -153,18 +545,26 @@ async def get_record(
     if not pk_column:
         raise HTTPException(status_code=400, detail="Table has no primary key")
 
-    record = db.query(model).filter(getattr(model, pk_column) == record_id).first()
+    cached = await get_cached_record(table_name, record_id)
+    if cached is not None:
+        return FastJSONResponse(cached)
 
-    if not record:
+    table = model.__table__
+    stmt = select(table).where(table.columns[pk_column] == record_id).limit(1)
+    rows = await run_in_db_thread(fetch_rows, db, stmt)
+
+    if not rows:
         raise HTTPException(status_code=404, detail="Record not found")
 
-    return serialize_model(record)
+    record = get_serializer(table).from_tuple(rows[0])
+    await cache_record(table_name, record_id, record)
+    return FastJSONResponse(record)
 
 
 @router.post("/{table_name}", status_code=201)
 async def create_record(
     table_name: str, data: dict[str, Any], db: Session = Depends(get_db)
-) -> dict[str, Any]:
+) -> Response:
     """Create a new record in the table.
 
     Args:
@@ -189,22 +589,243 @@ async def create_record(
     if not model:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
 
-    try:
+    def _insert() -> dict[str, Any]:
         new_record = model(**data)
         db.add(new_record)
         db.commit()
         db.refresh(new_record)
-        await publish_change(table_name, "created", serialize_model(new_record))
         return serialize_model(new_record)
+
+    try:
+        created = await run_in_db_thread(_insert)
     except Exception as e:
-        db.rollback()
+        await run_in_db_thread(db.rollback)
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    pk_column = db_manager.get_primary_key_column(table_name)
+    if pk_column and created.get(pk_column) is not None:
+        await cache_record(table_name, created[pk_column], created, written=True)
+    await invalidate_table_cache(table_name)
+    await publish_change(table_name, "created", created)
+    return FastJSONResponse(created, status_code=201)
+
+
+@router.post("/{table_name}/bulk", response_model=BulkInsertResponse)
+async def bulk_insert_records(
+    request: Request,
+    table_name: str,
+    batch_size: int | None = QueryParam(None, ge=1, description="Rows per transaction"),
+    on_conflict: ConflictMode = QueryParam(
+        "error", description="Primary-key conflicts: fail the batch, ignore the row, or update it"
+    ),
+) -> BulkInsertResponse:
+    """Insert or upsert many rows with one ``executemany`` per batch.
+
+    The body is either a JSON array of objects or, with an NDJSON content
+    type (``application/x-ndjson``), one object per line. NDJSON bodies are
+    parsed as they stream in, so arbitrarily large loads use bounded memory.
+    Each batch is committed in its own transaction and announced with a single
+    aggregated ``bulk_created`` change event; a failed batch is rolled back and
+    reported without stopping later batches.
+
+    Args:
+        request: Incoming request carrying the rows.
+        table_name: Name of the table to insert into.
+        batch_size: Rows per transaction; defaults to ``settings.bulk_batch_size``.
+        on_conflict: ``error``, ``ignore`` or ``update`` (upsert on primary key).
+
+    Returns:
+        Per-batch results and inserted/failed row totals.
+
+    Raises:
+        HTTPException: If the table is unknown or a JSON array body is malformed.
+
+    Examples:
+        Load rows from a file::
+
+            curl -X POST "http://localhost:8000/api/users/bulk?on_conflict=update" \
+                 -H "Content-Type: application/x-ndjson" \
+                 --data-binary @users.ndjson
+    """
+    table = db_manager.get_table(table_name)
+    if table is None:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+
+    size = batch_size or settings.bulk_batch_size
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_MEDIA_TYPES:
+        rows = iter_ndjson(request.stream())
+    else:
+        try:
+            rows = iter_rows(parse_json_array(await request.body()))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid body: {e}") from e
+
+    results: list[BulkBatchResult] = []
+    batches = iter_batches(rows, size)
+    while True:
+        index = len(results)
+        try:
+            batch = await anext(batches)
+        except StopAsyncIteration:
+            break
+        except ValueError as e:
+            # Malformed NDJSON: report it and stop reading the stream
+            results.append(BulkBatchResult(batch=index, rows=0, status="error", error=str(e)))
+            break
+
+        try:
+            count = await run_in_db_thread(
+                insert_batch, db_manager.engine, table, batch, on_conflict
+            )
+        except Exception as e:
+            results.append(
+                BulkBatchResult(batch=index, rows=len(batch), status="error", error=str(e))
+            )
+            continue
+
+        results.append(BulkBatchResult(batch=index, rows=count, status="ok"))
+        if on_conflict == "update":
+            await evict_table_records(table_name)
+        await invalidate_table_cache(table_name)
+        await publish_change(
+            table_name,
+            "bulk_created",
+            {"batch": index, "count": count, "on_conflict": on_conflict},
+        )
+
+    return BulkInsertResponse(
+        inserted=sum(result.rows for result in results if result.status == "ok"),
+        failed=sum(result.rows for result in results if result.status == "error"),
+        batches=results,
+    )
+
+
+@router.patch("/{table_name}", response_model=BulkMutationResponse)
+async def update_records_where(request: Request, table_name: str, data: dict[str, Any]) -> Response:
+    """Update every row matching the query-string filters in one statement.
+
+    Filters use the ``column[__operator]=value`` syntax described in
+    :mod:`graphsql.filters`; at least one is required so a missing filter
+    cannot rewrite the whole table. A single ``bulk_updated`` change event is
+    published for the whole operation.
+
+    Args:
+        request: Incoming request carrying the filters.
+        table_name: Name of the table to update.
+        data: Column values to set on every matching row.
+
+    Returns:
+        Affected row count, plus the updated rows where ``RETURNING`` is supported.
+
+    Raises:
+        HTTPException: If the table is unknown, no or invalid filters are given,
+        or the update fails.
+
+    Examples:
+        Deactivate all users older than 90::
+
+            curl -X PATCH "http://localhost:8000/api/users?age__gt=90" \
+                 -H "Content-Type: application/json" \
+                 -d '{"active": false}'
+    """
+    table, conditions, filters = _resolve_filtered_target(request, table_name)
+
+    try:
+        affected, rows = await run_in_db_thread(
+            update_where, db_manager.engine, table, conditions, data
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    await _evict_affected(table_name, table, rows)
+    await invalidate_table_cache(table_name)
+    await publish_change(
+        table_name, "bulk_updated", {"count": affected, "filters": filters, "values": data}
+    )
+    return _mutation_response(table, affected, rows)
+
+
+@router.delete("/{table_name}", response_model=BulkMutationResponse)
+async def delete_records_where(request: Request, table_name: str) -> Response:
+    """Delete every row matching the query-string filters in one statement.
+
+    Args:
+        request: Incoming request carrying the filters.
+        table_name: Name of the table to delete from.
+
+    Returns:
+        Affected row count, plus the deleted rows where ``RETURNING`` is supported.
+
+    Raises:
+        HTTPException: If the table is unknown, no or invalid filters are given,
+        or the delete fails.
+
+    Examples:
+        Purge expired sessions::
+
+            curl -X DELETE "http://localhost:8000/api/sessions?expires_at__lt=2024-01-01"
+    """
+    table, conditions, filters = _resolve_filtered_target(request, table_name)
+
+    try:
+        affected, rows = await run_in_db_thread(delete_where, db_manager.engine, table, conditions)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    await _evict_affected(table_name, table, rows)
+    await invalidate_table_cache(table_name)
+    await publish_change(table_name, "bulk_deleted", {"count": affected, "filters": filters})
+    return _mutation_response(table, affected, rows)
+
+
+async def _evict_affected(table_name: str, table: Table, rows: list[dict[str, Any]] | None) -> None:
+    """Evict records touched by a set-based write from the record cache.
+
+    Without ``RETURNING`` rows the affected keys are unknown, so every cached
+    record of the table is dropped.
+    """
+    pk_columns = [column.name for column in table.primary_key.columns]
+    if rows is None or len(pk_columns) != 1:
+        await evict_table_records(table_name)
+        return
+    for row in rows:
+        await evict_record(table_name, row[pk_columns[0]])
+
+
+def _mutation_response(
+    table: Table, affected: int, rows: list[dict[str, Any]] | None
+) -> FastJSONResponse:
+    """Encode a :class:`BulkMutationResponse`, serializing ``RETURNING`` rows if any."""
+    records = None
+    if rows is not None:
+        serializer = get_serializer(table)
+        records = [serializer.from_mapping(row) for row in rows]
+    return FastJSONResponse({"affected": affected, "records": records})
+
+
+def _resolve_filtered_target(
+    request: Request, table_name: str
+) -> tuple[Table, list[Any], dict[str, str]]:
+    """Look up a table and compile the request's filters for a set-based write."""
+    table = db_manager.get_table(table_name)
+    if table is None:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+
+    params = request.query_params.multi_items()
+    if not params:
+        raise HTTPException(status_code=400, detail="At least one filter is required")
+    try:
+        conditions = parse_filters(table, params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid filter: {e}") from e
+    return table, conditions, dict(params)
+
 
 @router.put("/{table_name}/{record_id}")
 async def update_record(
     table_name: str, record_id: int, data: dict[str, Any], db: Session = Depends(get_db)
-) -> dict[str, Any]:
+) -> Response:
     """Update an existing record.
 
     Args:
@@ -235,28 +856,37 @@ async def update_record(
     if not pk_column:
         raise HTTPException(status_code=400, detail="Table has no primary key")
 
-    record = db.query(model).filter(getattr(model, pk_column) == record_id).first()
+    record = await run_in_db_thread(
+        db.query(model).filter(getattr(model, pk_column) == record_id).first
+    )
 
     if not record:
         raise HTTPException(status_code=404, detail="Record not found")
 
-    try:
+    def _apply() -> dict[str, Any]:
         for key, value in data.items():
             if hasattr(record, key):
                 setattr(record, key, value)
         db.commit()
         db.refresh(record)
-        await publish_change(table_name, "updated", serialize_model(record))
         return serialize_model(record)
+
+    try:
+        updated = await run_in_db_thread(_apply)
     except Exception as e:
-        db.rollback()
+        await run_in_db_thread(db.rollback)
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    await cache_record(table_name, record_id, updated, written=True)
+    await invalidate_table_cache(table_name)
+    await publish_change(table_name, "updated", updated)
+    return FastJSONResponse(updated)
+
 
 @router.patch("/{table_name}/{record_id}")
 async def patch_record(
     table_name: str, record_id: int, data: dict[str, Any], db: Session = Depends(get_db)
-) -> dict[str, Any]:
+) -> Response:
     """Partially update an existing record."""
     return await update_record(table_name, record_id, data, db)
 
@@ -287,16 +917,25 @@ async def delete_record(table_name: str, record_id: int, db: Session = Depends(g
     if not pk_column:
         raise HTTPException(status_code=400, detail="Table has no primary key")
 
-    record = db.query(model).filter(getattr(model, pk_column) == record_id).first()
+    record = await run_in_db_thread(
+        db.query(model).filter(getattr(model, pk_column) == record_id).first
+    )
 
     if not record:
         raise HTTPException(status_code=404, detail="Record not found")
 
-    try:
-        serialized = serialize_model(record)
+    serialized = serialize_model(record)
+
+    def _delete() -> None:
         db.delete(record)
         db.commit()
-        await publish_change(table_name, "deleted", serialized)
+
+    try:
+        await run_in_db_thread(_delete)
     except Exception as e:
-        db.rollback()
+        await run_in_db_thread(db.rollback)
         raise HTTPException(status_code=400, detail=str(e)) from e
+
+    await evict_record(table_name, record_id)
+    await invalidate_table_cache(table_name)
+    await publish_change(table_name, "deleted", serialized)
@@ -1,9 +1,9 @@
 """Utility functions."""
 
-from datetime import date, datetime
-from decimal import Decimal
 from typing import Any
 
+from graphsql.serializers import serialize_value
+
 
 def clean_dict(data: dict[str, Any]) -> dict[str, Any]:
     """Remove ``None`` values and normalize common Python types.
@@ -19,18 +19,4 @@ def clean_dict(data: dict[str, Any]) -> dict[str, Any]:
         >>> clean_dict({"id": 1, "ts": datetime(2024, 1, 1), "note": None})
         {'id': 1, 'ts': '2024-01-01T00:00:00'}
     """
-    cleaned: dict[str, Any] = {}
-    for key, value in data.items():
-        if value is None:
-            continue
-
-        if isinstance(value, (datetime, date)):
-            cleaned[key] = value.isoformat()
-        elif isinstance(value, Decimal):
-            cleaned[key] = float(value)
-        elif isinstance(value, bytes):
-            cleaned[key] = value.decode("utf-8", errors="ignore")
-        else:
-            cleaned[key] = value
-
-    return cleaned
+    return {key: serialize_value(value) for key, value in data.items() if value is not None}
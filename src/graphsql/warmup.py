@@ -0,0 +1,125 @@
+"""Cache warm-up run during application startup.
+
+Right after a deploy every replica starts with empty caches, so the first
+wave of traffic misses on table metadata and hot records at once. The
+:func:`warm_cache` step, awaited from :func:`graphsql.main.lifespan`,
+pre-populates:
+
+* ``tables:list`` and every ``tables:info:<table>`` entry from the reflected
+  schema;
+* the first rows (by primary key) of each table in
+  ``settings.cache_warmup_tables``, in the record cache.
+
+All jobs run concurrently and the whole phase is bounded by
+``settings.cache_warmup_budget_seconds``; whatever has not finished by then is
+cancelled, so warm-up never delays readiness by more than that bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Coroutine
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import select
+
+from graphsql.cache import cache_set_many, record_cache_key, record_cache_ttl
+from graphsql.config import settings
+from graphsql.database import db_manager, fetch_rows, run_in_db_thread
+from graphsql.serializers import get_serializer
+
+
+async def warm_metadata() -> int:
+    """Cache the table list and every table's column metadata.
+
+    Returns:
+        Number of cache entries written.
+    """
+    tables = db_manager.list_tables()
+    items: dict[str, Any] = {"tables:list": {"tables": tables}}
+    for table_name in tables:
+        info = db_manager.get_table_info(table_name)
+        if info:
+            items[f"tables:info:{table_name}"] = info
+    await cache_set_many(items)
+    return len(items)
+
+
+def _load_first_rows(table_name: str, limit: int) -> list[tuple[Any, dict[str, Any]]]:
+    """Read up to ``limit`` rows ordered by primary key as ``(pk, record)`` pairs."""
+    table = db_manager.get_table(table_name)
+    pk_column = db_manager.get_primary_key_column(table_name)
+    if table is None or not pk_column:
+        return []
+
+    serializer = get_serializer(table)
+    stmt = select(table).order_by(table.columns[pk_column]).limit(limit)
+    db = db_manager.get_session()
+    try:
+        rows = fetch_rows(db, stmt)
+    finally:
+        db.close()
+    records = [serializer.from_tuple(row) for row in rows]
+    return [(record[pk_column], record) for record in records]
+
+
+async def warm_records(table_name: str, limit: int) -> int:
+    """Preload a table's first ``limit`` rows into the record cache.
+
+    Tables without the record cache enabled (see
+    :func:`graphsql.cache.record_cache_ttl`) are skipped.
+
+    Returns:
+        Number of records cached.
+    """
+    ttl = record_cache_ttl(table_name)
+    if ttl is None:
+        logger.warning(f"Skipping warm-up of '{table_name}': record cache is not enabled for it")
+        return 0
+
+    pairs = await run_in_db_thread(_load_first_rows, table_name, limit)
+    await cache_set_many(
+        {record_cache_key(table_name, pk): record for pk, record in pairs}, ttl=ttl
+    )
+    return len(pairs)
+
+
+async def warm_cache() -> dict[str, int]:
+    """Run every warm-up job concurrently within the configured time budget.
+
+    Returns:
+        Entries written per job (``metadata`` and ``records:<table>``); jobs
+        that failed or ran out of time are omitted.
+
+    Examples:
+        >>> await warm_cache()  # doctest: +SKIP
+        {'metadata': 4, 'records:users': 100}
+    """
+    budget = settings.cache_warmup_budget_seconds
+    if budget <= 0:
+        return {}
+
+    jobs: dict[str, Coroutine[Any, Any, int]] = {"metadata": warm_metadata()}
+    for table_name, limit in settings.cache_warmup_tables.items():
+        jobs[f"records:{table_name}"] = warm_records(table_name, limit)
+    tasks = {name: asyncio.ensure_future(job) for name, job in jobs.items()}
+
+    started = time.monotonic()
+    _, pending = await asyncio.wait(tasks.values(), timeout=budget)
+    for task in pending:
+        task.cancel()
+
+    results: dict[str, int] = {}
+    for name, task in tasks.items():
+        if task in pending:
+            logger.warning(f"Cache warm-up job {name} exceeded the {budget}s budget")
+        elif task.exception() is not None:
+            logger.warning(f"Cache warm-up job {name} failed: {task.exception()}")
+        else:
+            results[name] = task.result()
+    logger.info(
+        f"Cache warm-up finished in {time.monotonic() - started:.2f}s: {results}",
+    )
+    return results
@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, st
 from loguru import logger
 
 from graphsql.auth import verify_token
-from graphsql.cache import get_redis
+from graphsql.cache import get_pubsub
 from graphsql.config import settings
 from graphsql.events import build_channel
 
@@ -47,8 +47,7 @@ async def _authenticate(websocket: WebSocket) -> str | None:
 
 async def _stream_messages(websocket: WebSocket, table_name: str | None) -> None:
     """Subscribe to Redis channels and forward messages to the client."""
-    client = await get_redis()
-    pubsub = client.pubsub()
+    pubsub = await get_pubsub()
 
     channels: list[str] = [build_channel(None)]
     if table_name:
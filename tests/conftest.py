@@ -2,14 +2,51 @@
 
 from collections.abc import Generator
 
+import fakeredis
+import fakeredis.aioredis
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
+from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from graphsql import cache
+from graphsql.config import settings
+from graphsql.database import db_manager
 from graphsql.main import app
 
 
+@pytest.fixture(autouse=True)
+def fresh_local_cache(monkeypatch) -> None:
+    """Give every test an empty in-process cache tier, zeroed counters and a closed breaker."""
+    local = cache.LocalCache(settings.local_cache_max_entries, settings.local_cache_ttl_seconds)
+    monkeypatch.setattr(cache, "local_cache", local)
+    monkeypatch.setattr(cache, "_redis_stats", {"hits": 0, "misses": 0, "errors": 0})
+    monkeypatch.setattr(
+        cache,
+        "redis_breaker",
+        cache.CircuitBreaker(settings.redis_breaker_threshold, settings.redis_breaker_reset_seconds),
+    )
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> fakeredis.aioredis.FakeRedis:
+    """Serve both Redis clients from one fakeredis server, returning bytes like production.
+
+    Subscribers get their own client, as in production, so a subscription
+    running in the test client's event loop never shares a connection pool
+    with calls the test makes from another loop.
+    """
+    server = fakeredis.FakeServer()
+    fake = fakeredis.aioredis.FakeRedis(server=server, decode_responses=False)
+    monkeypatch.setattr(cache, "_redis_client", fake)
+    monkeypatch.setattr(
+        cache, "_pubsub_client", fakeredis.aioredis.FakeRedis(server=server, decode_responses=False)
+    )
+    return fake
+
+
 @pytest.fixture(scope="session")
 def test_db() -> Generator:
     """Create an in-memory SQLite test database.
@@ -111,3 +148,46 @@ def sample_db(db_session: Session) -> Session:
 
     db_session.commit()
     return db_session
+
+
+@pytest.fixture
+def live_db(monkeypatch) -> Generator:
+    """Point the global ``db_manager`` at a populated in-memory SQLite database.
+
+    The database holds a ``users`` table with 25 rows (``id`` 1..25) so tests
+    can exercise real SQL through the REST and GraphQL layers.
+
+    Yields:
+        The SQLAlchemy engine backing the patched ``db_manager``.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    metadata = MetaData()
+    users = Table(
+        "users",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(50), nullable=False),
+        Column("age", Integer),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            users.insert(),
+            [{"id": i, "name": f"user-{i}", "age": 20 + i % 5} for i in range(1, 26)],
+        )
+
+    base = automap_base(metadata=metadata)
+    base.prepare()
+
+    monkeypatch.setattr(db_manager, "engine", engine)
+    monkeypatch.setattr(db_manager, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(db_manager, "Base", base)
+    monkeypatch.setattr(db_manager, "_models", {"users": base.classes.users})
+    monkeypatch.setattr(db_manager, "metadata", metadata)
+    # An in-memory database cannot be shared with an async engine
+    monkeypatch.setattr(db_manager, "AsyncSessionLocal", None)
+
+    yield engine
+    engine.dispose()
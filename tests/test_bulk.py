@@ -0,0 +1,126 @@
+"""Tests for the bulk insert/upsert endpoint."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from graphsql import rest_routes
+from graphsql.bulk import build_insert, iter_ndjson
+from graphsql.database import db_manager
+from graphsql.main import app
+
+
+@pytest.fixture
+def events(monkeypatch):
+    calls = []
+
+    async def fake_publish(table, action, record):
+        calls.append((table, action, record))
+
+    monkeypatch.setattr(rest_routes, "publish_change", fake_publish)
+    return calls
+
+
+def _count(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM users")).scalar()
+
+
+def test_json_array_is_inserted_in_batches(live_db, events):
+    rows = [{"id": 100 + i, "name": f"bulk-{i}"} for i in range(7)]
+    response = TestClient(app).post("/api/users/bulk", params={"batch_size": 3}, json=rows)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["inserted"] == 7
+    assert [batch["rows"] for batch in body["batches"]] == [3, 3, 1]
+    assert _count(live_db) == 32
+    assert [(action, record["count"]) for _, action, record in events] == [
+        ("bulk_created", 3),
+        ("bulk_created", 3),
+        ("bulk_created", 1),
+    ]
+
+
+def test_ndjson_stream_is_accepted(live_db, events):
+    payload = "\n".join(json.dumps({"id": 200 + i, "name": "nd"}) for i in range(4)) + "\n"
+    response = TestClient(app).post(
+        "/api/users/bulk",
+        content=payload,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.json()["inserted"] == 4
+    assert _count(live_db) == 29
+
+
+def test_conflicting_batch_fails_without_stopping_others(live_db, events):
+    rows = [{"id": 1, "name": "dup"}, {"id": 300, "name": "new"}]
+    body = TestClient(app).post("/api/users/bulk", params={"batch_size": 1}, json=rows).json()
+
+    assert [batch["status"] for batch in body["batches"]] == ["error", "ok"]
+    assert body["inserted"] == 1
+    assert body["failed"] == 1
+
+
+def test_upsert_updates_existing_rows(live_db, events):
+    rows = [{"id": 1, "name": "renamed"}, {"id": 400, "name": "fresh"}]
+    response = TestClient(app).post("/api/users/bulk", params={"on_conflict": "update"}, json=rows)
+
+    assert response.json()["inserted"] == 2
+    with live_db.connect() as conn:
+        name = conn.execute(text("SELECT name FROM users WHERE id = 1")).scalar()
+        age = conn.execute(text("SELECT age FROM users WHERE id = 1")).scalar()
+    assert name == "renamed"
+    assert age == 21  # columns not supplied are left untouched
+    assert _count(live_db) == 26
+
+
+def test_ignored_conflicts_are_not_counted(live_db, events):
+    rows = [{"id": 1, "name": "dup"}, {"id": 2, "name": "dup"}, {"id": 500, "name": "new"}]
+    response = TestClient(app).post("/api/users/bulk", params={"on_conflict": "ignore"}, json=rows)
+
+    body = response.json()
+    assert body["inserted"] == 1
+    assert body["batches"][0]["rows"] == 1
+    assert events[0][2]["count"] == 1
+    assert _count(live_db) == 26
+
+
+def test_ignore_skips_existing_rows(live_db, events):
+    rows = [{"id": 2, "name": "ignored"}]
+    TestClient(app).post("/api/users/bulk", params={"on_conflict": "ignore"}, json=rows)
+
+    with live_db.connect() as conn:
+        assert conn.execute(text("SELECT name FROM users WHERE id = 2")).scalar() == "user-2"
+
+
+def test_unknown_column_is_reported(live_db, events):
+    body = TestClient(app).post("/api/users/bulk", json=[{"id": 500, "nope": 1}]).json()
+
+    assert body["batches"][0]["status"] == "error"
+    assert "nope" in body["batches"][0]["error"]
+
+
+def test_invalid_json_body_returns_400(live_db):
+    response = TestClient(app).post("/api/users/bulk", json={"id": 1})
+
+    assert response.status_code == 400
+
+
+def test_upsert_rejected_on_unsupported_dialect(live_db):
+    table = db_manager.get_table("users")
+
+    with pytest.raises(ValueError):
+        build_insert(table, "oracle", "update", ["name"])
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_handles_split_lines():
+    async def chunks():
+        yield b'{"a": 1}\n{"a"'
+        yield b': 2}\n\n{"a": 3}'
+
+    assert [row async for row in iter_ndjson(chunks())] == [{"a": 1}, {"a": 2}, {"a": 3}]
@@ -0,0 +1,87 @@
+"""Tests for filter-based bulk update and delete endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from graphsql import rest_routes
+from graphsql.database import db_manager
+from graphsql.filters import parse_filters
+from graphsql.main import app
+
+
+@pytest.fixture
+def events(monkeypatch):
+    calls = []
+
+    async def fake_publish(table, action, record):
+        calls.append((table, action, record))
+
+    monkeypatch.setattr(rest_routes, "publish_change", fake_publish)
+    return calls
+
+
+def test_patch_updates_matching_rows(live_db, events):
+    response = TestClient(app).patch("/api/users", params={"age": "20"}, json={"name": "twenty"})
+
+    assert response.status_code == 200
+    assert response.json()["affected"] == 5
+    with live_db.connect() as conn:
+        names = conn.execute(text("SELECT DISTINCT name FROM users WHERE age = 20")).scalars()
+        assert list(names) == ["twenty"]
+    assert events == [
+        (
+            "users",
+            "bulk_updated",
+            {"count": 5, "filters": {"age": "20"}, "values": {"name": "twenty"}},
+        )
+    ]
+
+
+def test_delete_removes_matching_rows(live_db, events):
+    response = TestClient(app).delete("/api/users", params={"id__in": "1,2,3"})
+
+    assert response.json()["affected"] == 3
+    with live_db.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM users")).scalar() == 22
+    assert len(events) == 1
+    assert events[0][1] == "bulk_deleted"
+
+
+def test_filter_is_required(live_db, events):
+    client = TestClient(app)
+
+    assert client.delete("/api/users").status_code == 400
+    assert client.patch("/api/users", json={"name": "x"}).status_code == 400
+    assert events == []
+
+
+def test_invalid_filter_returns_400(live_db, events):
+    client = TestClient(app)
+
+    assert client.delete("/api/users", params={"nope": "1"}).status_code == 400
+    assert client.delete("/api/users", params={"id__between": "1"}).status_code == 400
+    assert client.delete("/api/users", params={"id": "abc"}).status_code == 400
+
+
+def test_patch_rejects_unknown_columns(live_db, events):
+    response = TestClient(app).patch("/api/users", params={"id": "1"}, json={"nope": 1})
+
+    assert response.status_code == 400
+
+
+def test_parse_filters_operators(live_db):
+    table = db_manager.get_table("users")
+    params = [
+        ("age__gte", "22"),
+        ("age__lt", "24"),
+        ("name__like", "user-1%"),
+        ("age__is_null", "false"),
+        ("limit", "10"),
+    ]
+
+    conditions = parse_filters(table, params, reserved={"limit"})
+
+    with live_db.connect() as conn:
+        rows = conn.execute(table.select().where(*conditions)).all()
+    assert sorted(row.id for row in rows) == [12, 13, 17, 18]
@@ -1,10 +1,10 @@
 """Tests for Redis caching and session storage."""
 
+import asyncio
 import json
 
-import fakeredis.aioredis
 import pytest
-import pytest_asyncio
+from redis.exceptions import ResponseError
 
 from graphsql import cache
 from graphsql.cache import (
@@ -16,15 +16,7 @@ from graphsql.cache import (
     session_get,
 )
 
-
-@pytest_asyncio.fixture(autouse=True, scope="function")
-async def fake_redis():
-    """Provide a fakeredis client and patch the module-level client."""
-    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
-    cache._redis_client = fake
-    yield fake
-    await fake.close()
-    cache._redis_client = None
+pytestmark = pytest.mark.usefixtures("fake_redis")
 
 
 @pytest.mark.asyncio
@@ -34,7 +26,7 @@ async def test_cache_set_and_get(fake_redis):
 
     await cache_set(key, value, ttl=5)
     stored_raw = await fake_redis.get("graphsql:cache:" + key)
-    assert stored_raw == json.dumps(value)
+    assert stored_raw == json.dumps(value).encode()
 
     cached = await cache_get(key)
     assert cached == value
@@ -55,7 +47,7 @@ async def test_session_create_and_get(fake_redis):
 
     await session_create(session_id, data, ttl=5)
     stored_raw = await fake_redis.get("graphsql:session:" + session_id)
-    assert stored_raw == json.dumps(data)
+    assert stored_raw == json.dumps(data).encode()
 
     loaded = await session_get(session_id)
     assert loaded == data
@@ -67,3 +59,368 @@ async def test_session_delete(fake_redis):
     await session_create(session_id, {"x": 1}, ttl=5)
     await session_delete(session_id)
     assert await session_get(session_id) is None
+
+
+def test_local_cache_evicts_least_recently_used():
+    local = cache.LocalCache(max_entries=2, ttl=30)
+    local.set("a", 1)
+    local.set("b", 2)
+    assert local.get("a") == 1
+    local.set("c", 3)
+
+    assert local.get("b") is None
+    assert (local.get("a"), local.get("c")) == (1, 3)
+    assert (local.hits, local.misses) == (3, 1)
+
+
+def test_local_cache_caps_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    local = cache.LocalCache(max_entries=10, ttl=30)
+    local.set("short", 1, ttl=5)
+    local.set("long", 2, ttl=300)
+
+    now[0] += 6
+    assert local.get("short") is None
+    now[0] += 25
+    assert local.get("long") is None
+
+
+@pytest.mark.asyncio
+async def test_local_tier_serves_repeated_reads(fake_redis):
+    await cache_set("tables:list", {"tables": ["users"]})
+    await fake_redis.delete("graphsql:cache:tables:list")
+
+    assert await cache_get("tables:list") == {"tables": ["users"]}
+    assert cache.cache_stats()["local"]["hits"] == 1
+    assert cache.cache_stats()["redis"]["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_hits_populate_local_tier(fake_redis):
+    await fake_redis.set("graphsql:cache:k", json.dumps([1, 2]))
+
+    assert await cache_get("k") == [1, 2]
+    assert await cache_get("k") == [1, 2]
+    assert await cache_get("missing") is None
+
+    stats = cache.cache_stats()
+    assert stats["redis"] == {"hits": 1, "misses": 1, "errors": 0}
+    assert (stats["local"]["hits"], stats["local"]["misses"]) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_delete_broadcasts_invalidation(fake_redis):
+    pubsub = fake_redis.pubsub()
+    await pubsub.subscribe(cache.invalidation_channel())
+    await pubsub.get_message(timeout=1)  # subscribe confirmation
+
+    await cache_delete("tables:info:users")
+
+    message = await pubsub.get_message(timeout=1)
+    payload = json.loads(message["data"])
+    assert payload["origin"] == cache.INSTANCE_ID
+    assert payload["keys"] == ["tables:info:users"]
+    await pubsub.close()
+
+
+def test_apply_invalidation_ignores_own_messages():
+    cache.local_cache.set("a", 1)
+    cache.local_cache.set("records:users:1", {"id": 1})
+    cache.local_cache.set("records:users:2", {"id": 2})
+
+    cache.apply_invalidation(json.dumps({"origin": cache.INSTANCE_ID, "keys": ["a"]}))
+    assert cache.local_cache.get("a") == 1
+
+    cache.apply_invalidation(
+        json.dumps({"origin": "other", "keys": ["a"], "prefix": "records:users:"})
+    )
+    assert len(cache.local_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_listener_applies_other_replicas_invalidations(fake_redis):
+    cache.local_cache.set("tables:list", {"tables": []})
+    await cache.start_invalidation_listener()
+    try:
+        for _ in range(50):
+            if (await fake_redis.pubsub_numsub(cache.invalidation_channel()))[0][1]:
+                break
+            await asyncio.sleep(0.01)
+
+        message = {"origin": "other", "keys": ["tables:list"], "prefix": None}
+        await fake_redis.publish(cache.invalidation_channel(), json.dumps(message))
+        for _ in range(50):
+            if len(cache.local_cache) == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert len(cache.local_cache) == 0
+    finally:
+        await cache.stop_invalidation_listener()
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_computes_concurrent_misses_once(fake_redis):
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"tables": ["users"]}
+
+    results = await asyncio.gather(*(cache.cache_get_or_set("k", compute) for _ in range(10)))
+
+    assert calls == 1
+    assert all(result == {"tables": ["users"]} for result in results)
+    assert await fake_redis.get("graphsql:cache:lock:k") is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_waits_for_lock_holder(fake_redis, monkeypatch):
+    monkeypatch.setattr(cache, "LOCK_POLL_INTERVAL", 0.01)
+    await fake_redis.set("graphsql:cache:lock:k", "peer")
+
+    async def compute():
+        raise AssertionError("peer holds the lock")
+
+    async def peer_finishes():
+        await asyncio.sleep(0.03)
+        await cache_set("k", "from-peer")
+        await fake_redis.delete("graphsql:cache:lock:k")
+
+    result, _ = await asyncio.gather(cache.cache_get_or_set("k", compute), peer_finishes())
+    assert result == "from-peer"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_computes_without_redis(monkeypatch):
+    async def unavailable():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(cache, "get_redis", unavailable)
+
+    async def compute():
+        return 42
+
+    assert await cache.cache_get_or_set("k", compute) == 42
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_does_not_cache_none(fake_redis):
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return None
+
+    assert await cache.cache_get_or_set("k", compute) is None
+    assert await cache.cache_get_or_set("k", compute) is None
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_serves_stale_while_refreshing(fake_redis):
+    values = iter(["old", "new"])
+
+    async def compute():
+        return next(values)
+
+    assert await cache.cache_get_or_set("k", compute, ttl=30, stale_ttl=60) == "old"
+    assert 60 < await fake_redis.ttl("graphsql:cache:k") <= 90
+
+    # Freshness window elapsed: the stale value is served and refreshed in the background
+    await cache_delete("fresh:k")
+    assert await cache.cache_get_or_set("k", compute, ttl=30, stale_ttl=60) == "old"
+    for _ in range(50):
+        if await cache_get("k") == "new":
+            break
+        await asyncio.sleep(0.01)
+    assert await cache.cache_get_or_set("k", compute, ttl=30, stale_ttl=60) == "new"
+
+
+def test_circuit_breaker_opens_and_probes(monkeypatch):
+    breaker = cache.CircuitBreaker(threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    breaker.reset_timeout = 0
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.snapshot() == {"state": "closed", "consecutive_failures": 0}
+
+
+class _UnreachableRedis:
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        raise cache.RedisConnectionError("connection refused")
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_bypasses_redis(monkeypatch):
+    client = _UnreachableRedis()
+    monkeypatch.setattr(cache, "_redis_client", client)
+    monkeypatch.setattr(cache, "redis_breaker", cache.CircuitBreaker(3, 30))
+
+    for _ in range(10):
+        assert await cache_get("k") is None
+
+    assert client.calls == 3
+    assert cache.cache_stats()["breaker"]["state"] == "open"
+    with pytest.raises(cache.RedisUnavailableError):
+        await cache.get_redis()
+
+
+@pytest.mark.asyncio
+async def test_redis_replies_do_not_trip_breaker(fake_redis, monkeypatch):
+    monkeypatch.setattr(cache, "redis_breaker", cache.CircuitBreaker(1, 30))
+    await fake_redis.set("graphsql:cache:list", "x")
+
+    client = await cache.get_redis()
+    with pytest.raises(ResponseError):
+        await client.lpush("graphsql:cache:list", "y")
+
+    assert cache.redis_breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cache_set_many_and_get_many(fake_redis):
+    await cache.cache_set_many({"a": 1, "b": {"x": 2}}, ttl=10)
+    assert 0 < await fake_redis.ttl("graphsql:cache:b") <= 10
+
+    cache.local_cache.clear()
+    cache.local_cache.set("c", "local only")
+    found = await cache.cache_get_many(["a", "b", "c", "missing", "a"])
+
+    assert found == {"a": 1, "b": {"x": 2}, "c": "local only"}
+    assert cache.cache_stats()["redis"] == {"hits": 2, "misses": 1, "errors": 0}
+    assert cache.local_cache.get("b") == {"x": 2}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_failures_count_towards_breaker(monkeypatch):
+    class _Pipeline:
+        def set(self, *args, **kwargs):
+            return self
+
+        async def execute(self):
+            raise cache.RedisConnectionError("connection refused")
+
+    class _Client:
+        def pipeline(self, transaction=True):
+            return _Pipeline()
+
+    monkeypatch.setattr(cache, "_redis_client", _Client())
+    monkeypatch.setattr(cache, "redis_breaker", cache.CircuitBreaker(1, 30))
+
+    await cache.cache_set_many({"a": 1})
+    assert cache.redis_breaker.state == "open"
+
+
+class _RespServer:
+    """Minimal RESP server over a real socket that confirms subscriptions."""
+
+    def __init__(self):
+        self.subscribers: list[asyncio.StreamWriter] = []
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.url = f"redis://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/0"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        for writer in self.subscribers:
+            writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    @staticmethod
+    def _bulk(value: bytes) -> bytes:
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    async def _serve(self, reader, writer):
+        while header := await reader.readline():
+            command = []
+            for _ in range(int(header[1:])):
+                length = int((await reader.readline())[1:])
+                command.append((await reader.readexactly(length + 2))[:-2])
+            if command[0].upper() == b"SUBSCRIBE":
+                for count, channel in enumerate(command[1:], 1):
+                    writer.write(
+                        b"*3\r\n%s%s:%d\r\n"
+                        % (self._bulk(b"subscribe"), self._bulk(channel), count)
+                    )
+                self.subscribers.append(writer)
+            elif command[0].upper() == b"PING":
+                writer.write(b"+PONG\r\n")
+            else:
+                writer.write(b"+OK\r\n")
+            await writer.drain()
+
+    async def publish(self, channel: bytes, data: bytes) -> None:
+        for writer in self.subscribers:
+            writer.write(
+                b"*3\r\n" + self._bulk(b"message") + self._bulk(channel) + self._bulk(data)
+            )
+            await writer.drain()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_outlive_the_command_socket_timeout(monkeypatch):
+    monkeypatch.setattr(cache.settings, "redis_socket_timeout_seconds", 0.05)
+    monkeypatch.setattr(cache, "_pubsub_client", None)
+
+    async with _RespServer() as server:
+        monkeypatch.setattr(cache.settings, "redis_url", server.url)
+        pubsub = await cache.get_pubsub()
+        try:
+            await pubsub.subscribe("events")
+            listener = pubsub.listen()
+            assert (await anext(listener))["type"] == "subscribe"
+
+            waiting = asyncio.ensure_future(anext(listener))
+            # A quiet channel is not a dead connection
+            await asyncio.sleep(0.3)
+            assert not waiting.done()
+
+            await server.publish(b"events", b"hello")
+            message = await asyncio.wait_for(waiting, 1)
+        finally:
+            await pubsub.aclose()
+            await cache.close_redis()
+
+    assert (message["channel"], message["data"]) == (b"events", b"hello")
+
+
+@pytest.mark.asyncio
+async def test_pool_exhaustion_does_not_trip_breaker(monkeypatch):
+    monkeypatch.setattr(cache.settings, "redis_max_connections", 1)
+    monkeypatch.setattr(cache.settings, "redis_pool_timeout_seconds", 0.05)
+    monkeypatch.setattr(cache, "_redis_client", None)
+    monkeypatch.setattr(cache, "redis_breaker", cache.CircuitBreaker(1, 30))
+
+    async with _RespServer() as server:
+        monkeypatch.setattr(cache.settings, "redis_url", server.url)
+        client = await cache.get_redis()
+        pool = client.connection_pool
+        busy = await pool.get_connection()
+        try:
+            with pytest.raises(cache.RedisPoolExhaustedError):
+                await client.get("k")
+            assert await cache_get("k") is None
+        finally:
+            await pool.release(busy)
+            await cache.close_redis()
+
+    assert cache.redis_breaker.snapshot() == {"state": "closed", "consecutive_failures": 0}
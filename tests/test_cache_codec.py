@@ -0,0 +1,83 @@
+"""Tests for the pluggable cache value codec."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from graphsql import cache, cache_codec
+from graphsql.config import settings
+
+VALUE = {"tables": [f"table_{i}" for i in range(200)], "at": datetime(2024, 1, 2)}
+DECODED = {"tables": VALUE["tables"], "at": "2024-01-02 00:00:00"}
+
+
+@pytest.fixture(params=["json", "msgpack"])
+def codec(request, monkeypatch):
+    if request.param == "msgpack" and cache_codec.msgpack is None:
+        pytest.skip("msgpack not installed")
+    monkeypatch.setattr(cache_codec, "CODEC", request.param)
+    return request.param
+
+
+def test_json_codec_stores_plain_json(monkeypatch):
+    monkeypatch.setattr(cache_codec, "CODEC", "json")
+
+    assert cache_codec.encode(VALUE) == json.dumps(VALUE, default=str)
+
+
+@pytest.mark.parametrize("compress_min_bytes", [0, 64])
+def test_values_round_trip(codec, monkeypatch, compress_min_bytes):
+    monkeypatch.setattr(settings, "cache_compress_min_bytes", compress_min_bytes)
+
+    raw = cache_codec.encode(VALUE)
+
+    assert cache_codec.decode(raw) == DECODED
+    if compress_min_bytes:
+        assert raw[:2] == b"\x01z"
+        assert len(raw) < len(json.dumps(VALUE, default=str))
+    elif codec == "msgpack":
+        assert raw[:2] == b"\x01m"
+
+
+def test_small_values_are_not_compressed(monkeypatch):
+    monkeypatch.setattr(settings, "cache_compress_min_bytes", 64)
+
+    assert cache_codec.encode({"id": 1}) == '{"id": 1}'
+
+
+def test_decode_reads_untagged_json_as_text_or_bytes():
+    assert cache_codec.decode('{"id": 1}') == {"id": 1}
+    assert cache_codec.decode(b'{"id": 1}') == {"id": 1}
+
+
+def test_decode_rejects_unknown_tags():
+    with pytest.raises(ValueError):
+        cache_codec.decode(b"\x01?payload")
+
+
+def test_select_codec_falls_back_without_msgpack(monkeypatch):
+    monkeypatch.setattr(cache_codec, "msgpack", None)
+
+    assert cache_codec._select_codec("msgpack") == "json"
+    assert cache_codec._select_codec("bogus") == "json"
+
+
+@pytest.mark.asyncio
+async def test_mixed_codecs_share_redis(codec, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "cache_compress_min_bytes", 64)
+    await fake_redis.set("graphsql:cache:legacy", json.dumps({"id": 1}))
+    await cache.cache_set("new", VALUE)
+    cache.local_cache.clear()
+
+    assert await cache.cache_get("legacy") == {"id": 1}
+    assert await cache.cache_get("new") == DECODED
+    assert await cache.cache_get_many(["legacy", "new"]) == {"legacy": {"id": 1}, "new": DECODED}
+
+
+@pytest.mark.asyncio
+async def test_unreadable_values_count_as_errors(fake_redis):
+    await fake_redis.set("graphsql:cache:broken", b"\x01?payload")
+
+    assert await cache.cache_get("broken") is None
+    assert cache.cache_stats()["redis"]["errors"] == 1
@@ -0,0 +1,106 @@
+"""Tests for the Core-select read path used by REST and GraphQL reads."""
+
+import importlib.util
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from graphsql import database
+from graphsql.database import async_database_url, db_manager, fetch_rows
+from graphsql.graphql_schema import create_graphql_schema
+from graphsql.main import app
+
+
+def test_fetch_rows_does_not_hydrate_instances(live_db):
+    users = db_manager.get_table("users")
+    with db_manager.get_session() as session:
+        rows = fetch_rows(session, select(users).where(users.c.id <= 3))
+
+        assert [tuple(row) for row in rows] == [
+            (1, "user-1", 21),
+            (2, "user-2", 22),
+            (3, "user-3", 23),
+        ]
+        assert len(session.identity_map) == 0
+
+
+def test_get_record_reads_row(live_db):
+    client = TestClient(app)
+
+    assert client.get("/api/users/7").json() == {"id": 7, "name": "user-7", "age": 22}
+    assert client.get("/api/users/99").status_code == 404
+
+
+def test_graphql_reads_use_rows(live_db):
+    graphql_app = FastAPI()
+    graphql_app.include_router(create_graphql_schema())
+    client = TestClient(graphql_app)
+
+    body = client.post(
+        "/graphql",
+        json={"query": "{ users(id: 4) { id name } allUsers(limit: 2, offset: 1) { id age } }"},
+    ).json()
+
+    assert body["data"]["users"] == {"id": 4, "name": "user-4"}
+    assert body["data"]["allUsers"] == [{"id": 2, "age": 22}, {"id": 3, "age": 23}]
+
+
+def test_mutation_inputs_keep_auto_autoincrement_columns(live_db):
+    # Columns default to autoincrement="auto"; only the primary key is generated
+    graphql_app = FastAPI()
+    graphql_app.include_router(create_graphql_schema())
+    client = TestClient(graphql_app)
+
+    body = client.post(
+        "/graphql",
+        json={"query": 'mutation { createUsers(data: {name: "new", age: 40}) { id name age } }'},
+    ).json()
+
+    assert body["data"]["createUsers"] == {"id": 26, "name": "new", "age": 40}
+
+
+def test_async_database_url():
+    assert async_database_url("sqlite://") is None
+    assert async_database_url("sqlite:///:memory:") is None
+    assert async_database_url("oracle://scott@db/orcl") is None
+    if importlib.util.find_spec("aiosqlite") is not None:
+        assert async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    if importlib.util.find_spec("asyncpg") is None:
+        assert async_database_url("postgresql://app@db/shop") is None
+
+
+def test_graphql_reads_use_async_session(live_db, tmp_path, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    file_engine = create_engine(url)
+    db_manager.metadata.create_all(file_engine)
+    with live_db.connect() as source, file_engine.begin() as target:
+        users = db_manager.get_table("users")
+        target.execute(
+            users.insert(), [dict(row._mapping) for row in source.execute(select(users))]
+        )
+
+    async_engine = create_async_engine(async_database_url(url))
+    monkeypatch.setattr(
+        db_manager, "AsyncSessionLocal", sessionmaker(bind=async_engine, class_=AsyncSession)
+    )
+
+    async def no_threads(*args, **kwargs):
+        raise AssertionError("reads should not use the thread pool")
+
+    monkeypatch.setattr(database, "run_in_db_thread", no_threads)
+    graphql_app = FastAPI()
+    graphql_app.include_router(create_graphql_schema())
+
+    body = (
+        TestClient(graphql_app)
+        .post("/graphql", json={"query": "{ users(id: 4) { name } allUsers(limit: 2) { id } }"})
+        .json()
+    )
+
+    assert body["data"] == {"users": {"name": "user-4"}, "allUsers": [{"id": 1}, {"id": 2}]}
+    file_engine.dispose()
@@ -0,0 +1,53 @@
+"""Tests for list total-count strategies."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from graphsql.config import settings
+from graphsql.database import db_manager
+from graphsql.main import app
+
+
+def test_none_strategy_omits_total(live_db):
+    body = TestClient(app).get("/api/users", params={"count": "none"}).json()
+
+    assert body["total"] is None
+    assert body["count_strategy"] == "none"
+
+
+def test_default_strategy_comes_from_settings(monkeypatch, live_db):
+    monkeypatch.setattr(settings, "count_strategy", "none")
+    body = TestClient(app).get("/api/users").json()
+
+    assert body["total"] is None
+
+
+def test_estimated_falls_back_to_exact_without_stats(live_db):
+    body = TestClient(app).get("/api/users", params={"count": "estimated"}).json()
+
+    assert body["total"] == 25
+    assert body["count_strategy"] == "exact"
+
+
+def test_estimated_uses_sqlite_stat1(live_db):
+    with live_db.begin() as conn:
+        conn.execute(text("ANALYZE"))
+        conn.execute(text("UPDATE sqlite_stat1 SET stat = '1000' WHERE tbl = 'users'"))
+
+    assert db_manager.estimate_row_count("users") == 1000
+    body = TestClient(app).get("/api/users", params={"count": "estimated"}).json()
+    assert body["total"] == 1000
+    assert body["count_strategy"] == "estimated"
+
+
+def test_cached_total_is_invalidated_on_write(live_db, fake_redis):
+    client = TestClient(app)
+
+    assert client.get("/api/users", params={"count": "cached"}).json()["total"] == 25
+    with live_db.begin() as conn:
+        conn.execute(text("INSERT INTO users (id, name) VALUES (100, 'outside-api')"))
+    # Writes that bypass the API are not seen until the cache entry expires
+    assert client.get("/api/users", params={"count": "cached"}).json()["total"] == 25
+
+    assert client.post("/api/users", json={"id": 101, "name": "via-api"}).status_code == 201
+    assert client.get("/api/users", params={"count": "cached"}).json()["total"] == 27
@@ -0,0 +1,57 @@
+"""Tests for the blocking-database thread dispatcher."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from graphsql import database
+from graphsql.config import settings
+from graphsql.database import db_thread_limit, run_in_db_thread
+
+
+@pytest.mark.asyncio
+async def test_runs_off_the_event_loop_thread():
+    loop_thread = threading.get_ident()
+
+    worker_thread = await run_in_db_thread(threading.get_ident)
+
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_passes_arguments_through():
+    assert await run_in_db_thread(pow, 2, 5) == 32
+    assert await run_in_db_thread(int, "ff", base=16) == 255
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_by_pool(monkeypatch):
+    monkeypatch.setattr(settings, "database_url", "postgresql://example/db")
+    monkeypatch.setattr(settings, "db_pool_size", 2)
+    monkeypatch.setattr(settings, "db_max_overflow", 1)
+    monkeypatch.setattr(database, "_db_limiter", None)
+    assert db_thread_limit() == 3
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    await asyncio.gather(*(run_in_db_thread(work) for _ in range(10)))
+
+    assert peak == 3
+
+
+def test_sqlite_is_serialized(monkeypatch):
+    monkeypatch.setattr(settings, "database_url", "sqlite:///./x.db")
+    assert db_thread_limit() == 1
@@ -0,0 +1,55 @@
+"""Tests for the pluggable JSON encoding layer."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+from graphsql import encoding
+from graphsql.main import app
+
+PAYLOAD = {"id": 1, "name": "Zoë", "at": datetime(2024, 1, 2, 3, 4, 5), "price": Decimal("1.50")}
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_backends_agree(monkeypatch, backend):
+    if backend == "orjson" and encoding.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(encoding, "BACKEND", backend)
+
+    raw = encoding.dumps(PAYLOAD)
+
+    assert raw == '{"id":1,"name":"Zoë","at":"2024-01-02T03:04:05","price":"1.50"}'.encode()
+    assert json.loads(encoding.dumps_str(PAYLOAD, indent=True)) == json.loads(raw)
+    assert b'\n  "id": 1' in encoding.dumps(PAYLOAD, indent=True)
+
+
+def test_select_backend_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(encoding, "orjson", None)
+
+    assert encoding._select_backend("auto") == "json"
+    assert encoding._select_backend("orjson") == "json"
+    assert encoding._select_backend("json") == "json"
+
+
+def test_list_response_is_encoded_directly(live_db):
+    response = TestClient(app).get("/api/users", params={"limit": 2, "fields": "id"})
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "data": [{"id": 1}, {"id": 2}],
+        "total": 25,
+        "limit": 2,
+        "offset": 0,
+        "next_cursor": None,
+        "count_strategy": "exact",
+    }
+
+
+def test_create_keeps_created_status(live_db):
+    response = TestClient(app).post("/api/users", json={"name": "new", "age": 40})
+
+    assert response.status_code == 201
+    assert response.json() == {"id": 26, "name": "new", "age": 40}
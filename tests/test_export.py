@@ -0,0 +1,40 @@
+"""Tests for the streaming table export endpoint."""
+
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+
+from graphsql.config import settings
+from graphsql.main import app
+
+
+def test_export_ndjson_streams_all_rows(monkeypatch, live_db):
+    monkeypatch.setattr(settings, "export_batch_size", 7)
+    response = TestClient(app).get("/api/users/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == list(range(1, 26))
+    assert rows[0] == {"id": 1, "name": "user-1", "age": 21}
+    # Lines are encoded like every other response body
+    assert response.text.splitlines()[0] == '{"id":1,"name":"user-1","age":21}'
+
+
+def test_export_csv_has_header(monkeypatch, live_db):
+    monkeypatch.setattr(settings, "export_batch_size", 10)
+    response = TestClient(app).get("/api/users/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert 'filename="users.csv"' in response.headers["content-disposition"]
+    reader = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(reader) == 25
+    assert reader[1] == {"id": "2", "name": "user-2", "age": "22"}
+
+
+def test_export_unknown_table_returns_404(live_db):
+    response = TestClient(app).get("/api/missing/export")
+
+    assert response.status_code == 404
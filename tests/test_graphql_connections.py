@@ -0,0 +1,129 @@
+"""Tests for Relay-style connection fields."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from graphsql.graphql_schema import create_graphql_schema
+
+PAGE = """
+query ($after: String) {
+  usersConnection(first: 10, after: $after) {
+    edges { cursor node { id name } }
+    pageInfo { hasNextPage hasPreviousPage startCursor endCursor }
+  }
+}
+"""
+
+
+@pytest.fixture
+def graphql(live_db):
+    app = FastAPI()
+    app.include_router(create_graphql_schema())
+    statements: list[str] = []
+    event.listen(live_db, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return TestClient(app), statements
+
+
+def _page(client, after=None) -> dict:
+    body = client.post("/graphql", json={"query": PAGE, "variables": {"after": after}}).json()
+    return body["data"]["usersConnection"]
+
+
+def test_cursors_walk_every_page(graphql):
+    client, statements = graphql
+    ids, after, pages = [], None, []
+
+    while True:
+        page = _page(client, after)
+        pages.append(page["pageInfo"])
+        ids += [edge["node"]["id"] for edge in page["edges"]]
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        after = page["pageInfo"]["endCursor"]
+
+    assert ids == list(range(1, 26))
+    assert [info["hasPreviousPage"] for info in pages] == [False, True, True]
+    # Later pages seek past the cursor instead of skipping rows
+    assert len([sql for sql in statements if "WHERE users.id > " in sql]) == 2
+
+
+def test_edge_cursors_resume_after_their_node(graphql):
+    client, _ = graphql
+    first = _page(client)
+
+    resumed = _page(client, first["edges"][4]["cursor"])
+
+    assert first["pageInfo"]["startCursor"] == first["edges"][0]["cursor"]
+    assert first["pageInfo"]["endCursor"] == first["edges"][-1]["cursor"]
+    assert resumed["edges"][0]["node"] == {"id": 6, "name": "user-6"}
+
+
+def test_total_count_is_only_computed_when_selected(graphql):
+    client, statements = graphql
+
+    client.post(
+        "/graphql", json={"query": "{ usersConnection(first: 2) { edges { node { id } } } }"}
+    )
+    assert not [sql for sql in statements if "count(" in sql.lower()]
+
+    body = client.post(
+        "/graphql", json={"query": "{ usersConnection(first: 2) { totalCount } }"}
+    ).json()
+    assert body["data"]["usersConnection"] == {"totalCount": 25}
+    assert [sql for sql in statements if "count(" in sql.lower()]
+
+
+def test_nodes_select_only_requested_columns(graphql):
+    client, statements = graphql
+
+    client.post(
+        "/graphql", json={"query": "{ usersConnection(first: 2) { edges { node { age } } } }"}
+    )
+
+    (sql,) = [sql for sql in statements if "FROM users" in sql]
+    selected = sql.split("FROM")[0]
+    # The primary key is always read to build the cursors
+    assert "users.age" in selected and "users.id" in selected and "users.name" not in selected
+
+
+def test_invalid_cursor_is_reported(graphql):
+    client, _ = graphql
+
+    body = client.post(
+        "/graphql", json={"query": PAGE, "variables": {"after": "not a cursor"}}
+    ).json()
+
+    assert body["data"] is None
+    assert body["errors"][0]["message"].startswith("Invalid cursor")
+
+
+def test_negative_first_is_rejected(graphql):
+    client, _ = graphql
+
+    body = client.post(
+        "/graphql", json={"query": "{ usersConnection(first: -5) { edges { cursor } } }"}
+    ).json()
+
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == "first must not be negative"
+
+
+def test_empty_page_reads_no_rows(graphql):
+    client, statements = graphql
+
+    body = client.post(
+        "/graphql",
+        json={
+            "query": "{ usersConnection(first: 0) { totalCount edges { cursor }"
+            " pageInfo { hasNextPage endCursor } } }"
+        },
+    ).json()
+
+    assert body["data"]["usersConnection"] == {
+        "totalCount": 25,
+        "edges": [],
+        "pageInfo": {"hasNextPage": False, "endCursor": None},
+    }
+    assert not [sql for sql in statements if "FROM users" in sql and "LIMIT" in sql]
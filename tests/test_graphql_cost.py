@@ -0,0 +1,153 @@
+"""Tests for cost-based GraphQL complexity limits."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from graphql import parse
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    event,
+    text,
+)
+from sqlalchemy.ext.automap import automap_base
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from graphsql.config import settings
+from graphsql.database import db_manager
+from graphsql.graphql_cost import operation_cost
+from graphsql.graphql_schema import create_graphql_schema
+
+# Keep cached row estimates from leaking between tests
+pytestmark = pytest.mark.usefixtures("fake_redis")
+
+
+@pytest.fixture
+def analyzed_db(monkeypatch):
+    """Serve 3 ``users`` and 7 ``orders`` with up-to-date catalog statistics."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    metadata = MetaData()
+    users = Table(
+        "users", metadata, Column("id", Integer, primary_key=True), Column("name", String(50))
+    )
+    orders = Table(
+        "orders",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("user_id", Integer, ForeignKey("users.id")),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(users.insert(), [{"id": i} for i in range(1, 4)])
+        conn.execute(orders.insert(), [{"id": i, "user_id": i % 3 + 1} for i in range(1, 8)])
+        conn.execute(text("ANALYZE"))
+
+    base = automap_base(metadata=metadata)
+    base.prepare()
+    monkeypatch.setattr(db_manager, "engine", engine)
+    monkeypatch.setattr(db_manager, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(db_manager, "Base", base)
+    monkeypatch.setattr(
+        db_manager, "_models", {"users": base.classes.users, "orders": base.classes.orders}
+    )
+    monkeypatch.setattr(db_manager, "metadata", metadata)
+    monkeypatch.setattr(db_manager, "AsyncSessionLocal", None)
+    yield engine
+    engine.dispose()
+
+
+async def _cost(query: str, variables: dict | None = None) -> int:
+    schema = create_graphql_schema().schema
+    return await operation_cost(schema, parse(query), None, variables)
+
+
+@pytest.mark.asyncio
+async def test_list_cost_follows_limit_without_statistics(live_db):
+    assert await _cost("{ allUsers(limit: 10) { id } }") == 10
+    assert await _cost("{ allUsers { id } }") == settings.default_page_size
+    assert await _cost("{ allUsers(limit: 100000) { id } }") == settings.max_page_size
+    assert await _cost("query ($n: Int!) { allUsers(limit: $n) { id } }", {"n": 7}) == 7
+    # Connections cost the nodes of their page
+    assert await _cost("{ usersConnection(first: 4) { totalCount edges { node { id } } } }") == 4
+
+
+@pytest.mark.asyncio
+async def test_single_records_and_fragments(live_db):
+    query = (
+        "{ users(id: 1) { ...F } a: users(id: 2) { id __typename } } fragment F on UsersType { id }"
+    )
+
+    assert await _cost(query) == 2
+
+
+@pytest.mark.asyncio
+async def test_statistics_bound_rows_and_relationship_fan_out(analyzed_db):
+    # allUsers is capped by the 3 estimated users
+    assert await _cost("{ allUsers(limit: 500) { id } }") == 3
+    # 3 users x (1 + ceil(7 / 3) orders x (1 + 1 user))
+    assert await _cost("{ allUsers(limit: 500) { orders { user { id } } } }") == 21
+    # Operations select by name; mutations cost the rows they return
+    query = "query A { allUsers { id } } mutation B { createOrders(data: {}) { user { id } } }"
+    schema = create_graphql_schema().schema
+    assert await operation_cost(schema, parse(query), "B", None) == 2
+
+
+def test_expensive_operations_are_rejected_before_sql_runs(live_db, monkeypatch):
+    monkeypatch.setattr(settings, "graphql_max_cost", 5)
+    app = FastAPI()
+    app.include_router(create_graphql_schema())
+    client = TestClient(app)
+    statements: list[str] = []
+    event.listen(live_db, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    body = client.post("/graphql", json={"query": "{ allUsers(limit: 10) { id } }"}).json()
+
+    assert body["data"] is None
+    assert body["errors"][0]["extensions"] == {
+        "code": "QUERY_TOO_EXPENSIVE",
+        "cost": 10,
+        "budget": 5,
+    }
+    assert not [sql for sql in statements if "FROM users" in sql]
+
+    allowed = client.post("/graphql", json={"query": "{ allUsers(limit: 5) { id } }"}).json()
+    assert len(allowed["data"]["allUsers"]) == 5
+
+
+def test_negative_page_sizes_cannot_bypass_the_budget(live_db, monkeypatch):
+    monkeypatch.setattr(settings, "graphql_max_cost", 5)
+    app = FastAPI()
+    app.include_router(create_graphql_schema())
+    client = TestClient(app)
+    statements: list[str] = []
+    event.listen(live_db, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    # SQLite reads "LIMIT -1" as no limit at all
+    body = client.post("/graphql", json={"query": "{ allUsers(limit: -1) { id } }"}).json()
+
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == "limit must not be negative"
+    assert not [sql for sql in statements if "FROM users" in sql]
+
+    offset = client.post(
+        "/graphql", json={"query": "{ allUsers(limit: 1, offset: -1) { id } }"}
+    ).json()
+    assert offset["errors"][0]["message"] == "offset must not be negative"
+
+
+def test_zero_budget_disables_the_limit(live_db, monkeypatch):
+    monkeypatch.setattr(settings, "graphql_max_cost", 0)
+    app = FastAPI()
+    app.include_router(create_graphql_schema())
+
+    body = TestClient(app).post("/graphql", json={"query": "{ allUsers(limit: 1000) { id } }"})
+
+    assert len(body.json()["data"]["allUsers"]) == 25
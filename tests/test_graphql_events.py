@@ -21,6 +21,7 @@ class FakeTable:
             FakeColumn("id", int, primary_key=True, autoincrement=True),
             FakeColumn("name", str),
         ]
+        self.foreign_key_constraints = set()
 
 
 class FakeModel:
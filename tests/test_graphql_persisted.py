@@ -0,0 +1,97 @@
+"""Tests for automatic persisted queries and the document caches."""
+
+import hashlib
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from strawberry.extensions import ParserCache, ValidationCache
+
+from graphsql import cache
+from graphsql.graphql_persisted import persisted_query_key
+from graphsql.graphql_schema import create_graphql_schema
+
+QUERY = "{ allUsers(limit: 2) { id name } }"
+QUERY_HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+def _persisted(sha256_hash: str = QUERY_HASH, version: int = 1) -> dict:
+    return {"persistedQuery": {"version": version, "sha256Hash": sha256_hash}}
+
+
+@pytest.fixture
+def graphql(live_db, fake_redis):
+    router = create_graphql_schema()
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app), router.schema
+
+
+def test_unknown_hash_asks_for_the_document(graphql):
+    client, _ = graphql
+
+    body = client.post("/graphql", json={"extensions": _persisted()}).json()
+
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert body["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_registered_document_is_replayed_by_hash(graphql, fake_redis):
+    client, _ = graphql
+    expected = {"allUsers": [{"id": 1, "name": "user-1"}, {"id": 2, "name": "user-2"}]}
+
+    registered = client.post("/graphql", json={"query": QUERY, "extensions": _persisted()})
+    assert registered.json() == {"data": expected}
+    assert await fake_redis.exists(f"graphsql:cache:{persisted_query_key(QUERY_HASH)}")
+
+    # Another replica only sees the shared tier
+    cache.local_cache.clear()
+    replayed = client.post("/graphql", json={"extensions": _persisted()})
+    assert replayed.json() == {"data": expected}
+
+    # Clients may also replay over GET; without a JSON Accept header that serves GraphiQL
+    params = {"extensions": json.dumps(_persisted())}
+    replayed = client.get("/graphql", params=params, headers={"Accept": "application/json"})
+    assert replayed.json() == {"data": expected}
+
+
+@pytest.mark.parametrize(
+    ("extensions", "code"),
+    [
+        (_persisted(hashlib.sha256(b"{ other }").hexdigest()), "PERSISTED_QUERY_HASH_MISMATCH"),
+        (_persisted(version=2), "PERSISTED_QUERY_NOT_SUPPORTED"),
+        (_persisted("not-a-hash"), "PERSISTED_QUERY_INVALID_HASH"),
+    ],
+)
+def test_invalid_persisted_queries_are_rejected(graphql, fake_redis, extensions, code):
+    client, _ = graphql
+
+    body = client.post("/graphql", json={"query": QUERY, "extensions": extensions}).json()
+
+    assert body["data"] is None
+    assert body["errors"][0]["extensions"]["code"] == code
+
+
+def test_repeated_operations_skip_parsing_and_validation(graphql):
+    client, schema = graphql
+    parser = next(ext for ext in schema.extensions if isinstance(ext, ParserCache))
+    validator = next(ext for ext in schema.extensions if isinstance(ext, ValidationCache))
+
+    for _ in range(3):
+        assert "errors" not in client.post("/graphql", json={"query": QUERY}).json()
+
+    assert parser.cached_parse_document.cache_info().misses == 1
+    assert parser.cached_parse_document.cache_info().hits == 2
+    assert validator.cached_validate_document.cache_info().misses == 1
+    assert validator.cached_validate_document.cache_info().hits == 2
+
+
+def test_document_caches_can_be_disabled(live_db, monkeypatch):
+    monkeypatch.setattr("graphsql.graphql_schema.settings.graphql_document_cache_size", 0)
+
+    schema = create_graphql_schema().schema
+
+    assert not [ext for ext in schema.extensions if isinstance(ext, (ParserCache, ValidationCache))]
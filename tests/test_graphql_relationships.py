@@ -0,0 +1,161 @@
+"""Tests for foreign-key relationship fields and their DataLoaders."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, String, Table, create_engine, event
+from sqlalchemy.ext.automap import automap_base
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from graphsql.database import db_manager
+from graphsql.graphql_loaders import foreign_key_relationships
+from graphsql.graphql_schema import create_graphql_schema
+
+
+def _tables() -> MetaData:
+    metadata = MetaData()
+    Table(
+        "users",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(50)),
+    )
+    Table(
+        "orders",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("user_id", Integer, ForeignKey("users.id")),
+        Column("total", Integer),
+    )
+    return metadata
+
+
+@pytest.fixture
+def relational_db(monkeypatch):
+    """Serve ``users`` (3 rows) and ``orders`` (2 per user, plus one orphan)."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    metadata = _tables()
+    metadata.create_all(engine)
+    users, orders = metadata.tables["users"], metadata.tables["orders"]
+    with engine.begin() as conn:
+        conn.execute(users.insert(), [{"id": i, "name": f"user-{i}"} for i in range(1, 4)])
+        conn.execute(
+            orders.insert(),
+            [{"id": i, "user_id": (i + 1) // 2, "total": i * 10} for i in range(1, 7)]
+            + [{"id": 7, "user_id": None, "total": 70}],
+        )
+
+    base = automap_base(metadata=metadata)
+    base.prepare()
+    monkeypatch.setattr(db_manager, "engine", engine)
+    monkeypatch.setattr(db_manager, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(db_manager, "Base", base)
+    monkeypatch.setattr(
+        db_manager, "_models", {"users": base.classes.users, "orders": base.classes.orders}
+    )
+    monkeypatch.setattr(db_manager, "metadata", metadata)
+    monkeypatch.setattr(db_manager, "AsyncSessionLocal", None)
+
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    app = FastAPI()
+    app.include_router(create_graphql_schema())
+    yield TestClient(app), statements
+    engine.dispose()
+
+
+def test_relationship_names():
+    relationships = foreign_key_relationships(_tables().tables)
+
+    assert [(rel.name, rel.target, rel.many) for rel in relationships["orders"]] == [
+        ("user", "users", False)
+    ]
+    assert [(rel.name, rel.target, rel.many) for rel in relationships["users"]] == [
+        ("orders", "orders", True)
+    ]
+
+
+def test_relationship_names_avoid_columns():
+    metadata = MetaData()
+    Table("users", metadata, Column("id", Integer, primary_key=True), Column("orders", Integer))
+    Table(
+        "orders",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("owner", Integer, ForeignKey("users.id")),
+    )
+
+    relationships = foreign_key_relationships(metadata.tables)
+
+    assert [rel.name for rel in relationships["orders"]] == ["users"]
+    assert [rel.name for rel in relationships["users"]] == ["orders_by_owner"]
+
+
+def test_nested_relationships_batch_one_query_per_level(relational_db):
+    client, statements = relational_db
+
+    body = client.post(
+        "/graphql",
+        json={"query": "{ allUsers(limit: 3) { id orders { id user { name } } } }"},
+    ).json()
+
+    assert body["data"]["allUsers"] == [
+        {
+            "id": user_id,
+            "orders": [
+                {"id": order_id, "user": {"name": f"user-{user_id}"}}
+                for order_id in (2 * user_id - 1, 2 * user_id)
+            ],
+        }
+        for user_id in (1, 2, 3)
+    ]
+    # Catalog statistics read by the cost analysis are not data queries
+    selects = [
+        sql
+        for sql in statements
+        if sql.lstrip().upper().startswith("SELECT") and "sqlite_stat1" not in sql
+    ]
+    assert len(selects) == 3
+    assert " IN (" in selects[1] and " IN (" in selects[2]
+
+
+def test_missing_foreign_key_resolves_to_null(relational_db):
+    client, _ = relational_db
+
+    body = client.post("/graphql", json={"query": "{ orders(id: 7) { id user { id } } }"}).json()
+
+    assert body["data"]["orders"] == {"id": 7, "user": None}
+
+
+def _selected(sql: str) -> str:
+    return sql.split("FROM")[0]
+
+
+def test_resolvers_select_only_requested_columns(relational_db):
+    client, statements = relational_db
+
+    body = client.post(
+        "/graphql",
+        json={
+            "query": "{ users(id: 1) { ...Names } allUsers(limit: 1) { orders { total } } }"
+            " fragment Names on UsersType { name }"
+        },
+    ).json()
+
+    assert body["data"] == {
+        "users": {"name": "user-1"},
+        "allUsers": [{"orders": [{"total": 10}, {"total": 20}]}],
+    }
+    (orders,) = [_selected(sql) for sql in statements if "FROM orders" in sql]
+    (single,) = [_selected(sql) for sql in statements if "WHERE users.id =" in sql]
+    (listing,) = [
+        _selected(sql) for sql in statements if "FROM users" in sql and "WHERE" not in sql
+    ]
+    assert "users.name" in single and "users.id" not in single
+    # The relationship's key columns are read even though they are not selected
+    assert "users.id" in listing and "users.name" not in listing
+    assert "orders.user_id" in orders and "orders.total" in orders and "orders.id" not in orders
@@ -0,0 +1,161 @@
+"""Tests for GraphQL change subscriptions over graphql-ws."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, Numeric, String, Table, create_engine
+from sqlalchemy.ext.automap import automap_base
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from graphsql.database import db_manager
+from graphsql.events import build_channel, publish_change
+from graphsql.graphql_schema import create_graphql_schema
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def client(live_db, fake_redis):
+    app = FastAPI()
+    app.include_router(create_graphql_schema())
+    return TestClient(app)
+
+
+def _wait_for_subscriber(fake, table: str) -> None:
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        if _run(fake.pubsub_numsub(build_channel(table)))[0][1]:
+            return
+        time.sleep(0.01)
+    raise AssertionError("subscription never reached Redis")
+
+
+def _subscribe(websocket, query: str) -> None:
+    websocket.send_json({"type": "connection_init"})
+    assert websocket.receive_json()["type"] == "connection_ack"
+    websocket.send_json({"type": "start", "id": "1", "payload": {"query": query}})
+
+
+def test_subscription_receives_matching_rows(client, fake_redis):
+    query = (
+        'subscription { onUsersChanged(action: "updated", where: {age: 30}) '
+        "{ action record { id name } } }"
+    )
+
+    with client.websocket_connect("/graphql", subprotocols=["graphql-ws"]) as websocket:
+        _subscribe(websocket, query)
+        _wait_for_subscriber(fake_redis, "users")
+
+        _run(publish_change("users", "created", {"id": 26, "name": "new", "age": 30}))
+        _run(publish_change("users", "updated", {"id": 1, "name": "young", "age": 21}))
+        _run(publish_change("users", "bulk_updated", {"count": 3, "filters": {}}))
+        _run(publish_change("orders", "updated", {"id": 2, "name": "order", "age": 30}))
+        _run(publish_change("users", "updated", {"id": 2, "name": "match", "age": 30}))
+
+        message = websocket.receive_json()
+        websocket.send_json({"type": "stop", "id": "1"})
+
+    assert message == {
+        "type": "data",
+        "id": "1",
+        "payload": {
+            "data": {"onUsersChanged": {"action": "updated", "record": {"id": 2, "name": "match"}}}
+        },
+    }
+
+
+def test_unfiltered_subscription_receives_bulk_events(client, fake_redis):
+    query = "subscription { onUsersChanged { action record { id } } }"
+
+    with client.websocket_connect("/graphql", subprotocols=["graphql-ws"]) as websocket:
+        _subscribe(websocket, query)
+        _wait_for_subscriber(fake_redis, "users")
+
+        _run(publish_change("users", "bulk_deleted", {"count": 4, "filters": {"age": "20"}}))
+        _run(publish_change("users", "deleted", {"id": 5, "name": "user-5", "age": 20}))
+
+        bulk = websocket.receive_json()["payload"]["data"]["onUsersChanged"]
+        deleted = websocket.receive_json()["payload"]["data"]["onUsersChanged"]
+        websocket.send_json({"type": "stop", "id": "1"})
+
+    assert bulk == {"action": "bulk_deleted", "record": None}
+    assert deleted == {"action": "deleted", "record": {"id": 5}}
+
+
+@pytest.fixture
+def priced_client(monkeypatch, fake_redis):
+    """Serve a ``products`` table whose ``price`` is exposed as a string.
+
+    Its ``action`` column shares a name with the subscription's event argument.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    metadata = MetaData()
+    Table(
+        "products",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("price", Numeric(10, 2)),
+        Column("action", String(20)),
+    )
+    metadata.create_all(engine)
+    base = automap_base(metadata=metadata)
+    base.prepare()
+    monkeypatch.setattr(db_manager, "engine", engine)
+    monkeypatch.setattr(db_manager, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(db_manager, "Base", base)
+    monkeypatch.setattr(db_manager, "_models", {"products": base.classes.products})
+    monkeypatch.setattr(db_manager, "metadata", metadata)
+    monkeypatch.setattr(db_manager, "AsyncSessionLocal", None)
+    app = FastAPI()
+    app.include_router(create_graphql_schema())
+    yield TestClient(app)
+    engine.dispose()
+
+
+def test_decimal_filters_match_serialized_records(priced_client, fake_redis):
+    query = 'subscription { onProductsChanged(where: {price: "9.50"}) { record { id price } } }'
+
+    with priced_client.websocket_connect("/graphql", subprotocols=["graphql-ws"]) as websocket:
+        _subscribe(websocket, query)
+        _wait_for_subscriber(fake_redis, "products")
+
+        # Records are published serialized: decimals as floats
+        _run(publish_change("products", "updated", {"id": 1, "price": 3.0}))
+        _run(publish_change("products", "updated", {"id": 2, "price": 9.5}))
+
+        record = websocket.receive_json()["payload"]["data"]["onProductsChanged"]["record"]
+        websocket.send_json({"type": "stop", "id": "1"})
+
+    assert record == {"id": 2, "price": "9.5"}
+
+
+def test_invalid_filter_values_are_reported(priced_client):
+    query = 'subscription { onProductsChanged(where: {price: "cheap"}) { action } }'
+
+    with priced_client.websocket_connect("/graphql", subprotocols=["graphql-ws"]) as websocket:
+        _subscribe(websocket, query)
+        message = websocket.receive_json()
+
+    assert message["payload"]["data"] is None
+    assert message["payload"]["errors"][0]["message"] == "Invalid filter: Invalid decimal: 'cheap'"
+
+
+def test_columns_named_action_are_filterable(priced_client):
+    query = '{ __type(name: "ProductsFilter") { inputFields { name } } }'
+
+    body = priced_client.post("/graphql", json={"query": query}).json()
+
+    fields = {field["name"] for field in body["data"]["__type"]["inputFields"]}
+    assert fields == {"id", "price", "action"}
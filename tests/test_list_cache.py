@@ -0,0 +1,121 @@
+"""Tests for tag-invalidated caching of list results."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from graphsql import cache
+from graphsql.config import settings
+from graphsql.graphql_schema import create_graphql_schema
+from graphsql.main import app
+
+
+@pytest.fixture
+def cached_lists(monkeypatch, fake_redis):
+    monkeypatch.setattr(settings, "list_cache_tables", {"users": 30})
+    return fake_redis
+
+
+def _rename_outside_api(engine, record_id: int, name: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE users SET name = :name WHERE id = :id"), {"name": name, "id": record_id}
+        )
+
+
+@pytest.mark.asyncio
+async def test_bump_changes_tagged_keys(fake_redis):
+    first = await cache.tagged_cache_key("table:users", "rest", [("b", "2"), ("a", "1")])
+    assert first == await cache.tagged_cache_key("table:users", "rest", [("a", "1"), ("b", "2")])
+    assert first.startswith("tagged:table:users:0:rest:")
+
+    await cache.bump_tag("table:users")
+
+    second = await cache.tagged_cache_key("table:users", "rest", [("a", "1"), ("b", "2")])
+    assert second.startswith("tagged:table:users:1:rest:")
+    assert await cache.tagged_cache_key("table:orders", "rest", []) is not None
+
+
+@pytest.mark.asyncio
+async def test_lookup_racing_a_bump_keeps_the_new_generation(monkeypatch, fake_redis):
+    read, release = asyncio.Event(), asyncio.Event()
+    real_get = fake_redis.get
+
+    async def slow_get(name):
+        value = await real_get(name)
+        read.set()
+        await release.wait()
+        return value
+
+    monkeypatch.setattr(fake_redis, "get", slow_get)
+    # The lookup reads generation 0 from Redis, then the bump lands before it stores it
+    lookup = asyncio.create_task(cache.tag_generation("table:users"))
+    await read.wait()
+    await cache.bump_tag("table:users")
+    release.set()
+    await lookup
+
+    assert cache.local_cache.get("gen:table:users") == 1
+    assert await cache.tag_generation("table:users") == 1
+
+
+@pytest.mark.asyncio
+async def test_tagged_key_unavailable_without_redis(monkeypatch):
+    async def broken_redis():
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(cache, "get_redis", broken_redis)
+
+    assert await cache.tagged_cache_key("table:users", "rest", []) is None
+
+
+def test_lists_are_not_cached_by_default(live_db, fake_redis):
+    client = TestClient(app)
+
+    assert client.get("/api/users", params={"limit": 1}).json()["data"][0]["name"] == "user-1"
+    _rename_outside_api(live_db, 1, "renamed")
+    assert client.get("/api/users", params={"limit": 1}).json()["data"][0]["name"] == "renamed"
+
+
+def test_rest_pages_are_invalidated_by_writes(live_db, cached_lists):
+    client = TestClient(app)
+    params = {"limit": 2, "sort": "id"}
+
+    first = client.get("/api/users", params=params).json()
+    _rename_outside_api(live_db, 1, "renamed")
+    assert client.get("/api/users", params=params).json() == first
+    # A different query is a different entry
+    assert client.get("/api/users", params={"limit": 1}).json()["data"][0]["name"] == "renamed"
+
+    assert client.put("/api/users/2", json={"name": "via-api"}).status_code == 200
+    names = [row["name"] for row in client.get("/api/users", params=params).json()["data"]]
+    assert names == ["renamed", "via-api"]
+
+
+def test_graphql_lists_share_the_table_tag(live_db, cached_lists):
+    graphql_app = FastAPI()
+    graphql_app.include_router(create_graphql_schema())
+    graphql = TestClient(graphql_app)
+    query = {"query": "{ allUsers(limit: 1) { name } }"}
+
+    assert graphql.post("/graphql", json=query).json()["data"]["allUsers"] == [{"name": "user-1"}]
+    _rename_outside_api(live_db, 1, "renamed")
+    assert graphql.post("/graphql", json=query).json()["data"]["allUsers"] == [{"name": "user-1"}]
+
+    assert TestClient(app).delete("/api/users", params={"id": "25"}).status_code == 200
+    assert graphql.post("/graphql", json=query).json()["data"]["allUsers"] == [{"name": "renamed"}]
+
+
+def test_graphql_list_cache_is_keyed_by_projection(live_db, cached_lists):
+    graphql_app = FastAPI()
+    graphql_app.include_router(create_graphql_schema())
+    graphql = TestClient(graphql_app)
+
+    narrow = graphql.post("/graphql", json={"query": "{ allUsers(limit: 1) { id } }"}).json()
+    wide = graphql.post("/graphql", json={"query": "{ allUsers(limit: 1) { id name } }"}).json()
+
+    assert narrow["data"]["allUsers"] == [{"id": 1}]
+    assert wide["data"]["allUsers"] == [{"id": 1, "name": "user-1"}]
@@ -0,0 +1,55 @@
+"""Tests for filtering, sorting and projection on REST listings."""
+
+from fastapi.testclient import TestClient
+
+from graphsql.main import app
+
+
+def test_filters_are_applied_and_counted(live_db):
+    body = TestClient(app).get("/api/users", params={"age": "22", "id__lt": "20"}).json()
+
+    assert [row["id"] for row in body["data"]] == [2, 7, 12, 17]
+    assert body["total"] == 4
+
+
+def test_multi_column_sort(live_db):
+    body = TestClient(app).get("/api/users", params={"sort": "-age,id", "limit": 6}).json()
+
+    assert [(row["age"], row["id"]) for row in body["data"]] == [
+        (24, 4),
+        (24, 9),
+        (24, 14),
+        (24, 19),
+        (24, 24),
+        (23, 3),
+    ]
+
+
+def test_fields_projection(live_db):
+    body = TestClient(app).get("/api/users", params={"fields": "name", "limit": 2}).json()
+
+    assert body["data"] == [{"name": "user-1"}, {"name": "user-2"}]
+
+
+def test_cursor_pages_follow_sort_and_projection(live_db):
+    client = TestClient(app)
+    params = {"sort": "-age", "fields": "name", "age__gte": "23", "limit": 4, "after": ""}
+    names: list[str] = []
+
+    while True:
+        body = client.get("/api/users", params=params).json()
+        names.extend(row["name"] for row in body["data"])
+        assert all(set(row) == {"name"} for row in body["data"])
+        if body["next_cursor"] is None:
+            break
+        params["after"] = body["next_cursor"]
+
+    assert names == [f"user-{i}" for i in (4, 9, 14, 19, 24, 3, 8, 13, 18, 23)]
+
+
+def test_invalid_query_parameters_return_400(live_db):
+    client = TestClient(app)
+
+    assert client.get("/api/users", params={"sort": "nope"}).status_code == 400
+    assert client.get("/api/users", params={"fields": "id,nope"}).status_code == 400
+    assert client.get("/api/users", params={"nope__gt": "1"}).status_code == 400
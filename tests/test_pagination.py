@@ -4,53 +4,43 @@ from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, String, Table
 
 from graphsql import rest_routes
 from graphsql.config import settings
 from graphsql.database import get_db
 from graphsql.main import app
 
-
-class FakeColumn:
-    def __init__(self, name: str) -> None:
-        self.name = name
-
-
-class FakeTable:
-    def __init__(self, column_names: list[str]) -> None:
-        self.columns = [FakeColumn(name) for name in column_names]
+USERS = Table("users", MetaData(), Column("id", Integer, primary_key=True), Column("name", String))
 
 
 class FakeModel:
-    __table__ = FakeTable(["id", "name"])
-
-
-class FakeRecord:
-    __table__ = FakeTable(["id", "name"])
-
-    def __init__(self, idx: int) -> None:
-        self.id = idx
-        self.name = f"record-{idx}"
+    __table__ = USERS
 
 
 class FakeQuery:
     def __init__(self, count_result: int) -> None:
         self._count_result = count_result
-        self.limit_value = None
 
     def count(self) -> int:
         return self._count_result
 
-    def offset(self, _: int) -> "FakeQuery":
-        return self
 
-    def limit(self, value: int) -> "FakeQuery":
-        self.limit_value = value
-        return self
+class FakeResult:
+    def __init__(self, rows: list[tuple[int, str]]) -> None:
+        self._rows = rows
 
-    def all(self) -> list[FakeRecord]:
-        size = min(self.limit_value or 0, self._count_result)
-        return [FakeRecord(i) for i in range(size)]
+    def all(self) -> list[tuple[int, str]]:
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, count_result: int) -> None:
+        self._count_result = count_result
+
+    def execute(self, stmt: Any) -> FakeResult:
+        size = min(stmt._limit or 0, self._count_result)
+        return FakeResult([(i, f"record-{i}") for i in range(size)])
 
 
 class FakeSession:
@@ -61,6 +51,9 @@ class FakeSession:
     def query(self, _model: Any) -> FakeQuery:
         return self.query_obj
 
+    def connection(self) -> FakeConnection:
+        return FakeConnection(self._count_result)
+
     def close(self) -> None:  # pragma: no cover - no-op for test
         return None
 
@@ -80,6 +73,7 @@ def override_db(monkeypatch) -> None:
 
     # Patch db_manager.get_model to return our fake model
     monkeypatch.setattr(rest_routes.db_manager, "get_model", lambda _name: FakeModel())
+    monkeypatch.setattr(rest_routes.db_manager, "get_table", lambda _name: USERS)
 
     yield
 
@@ -0,0 +1,107 @@
+"""Tests for the opt-in read-through record cache."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from graphsql import cache
+from graphsql.config import Settings, settings
+from graphsql.main import app
+
+
+@pytest.fixture
+def cached_users(monkeypatch, fake_redis):
+    monkeypatch.setattr(settings, "record_cache_tables", {"users": 30})
+    return fake_redis
+
+
+def _rename_outside_api(engine, record_id: int, name: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE users SET name = :name WHERE id = :id"), {"name": name, "id": record_id}
+        )
+
+
+def test_parse_table_ttls():
+    assert Settings.parse_table_ttls("users:30, orders,,*:5", 60) == {
+        "users": 30,
+        "orders": 60,
+        "*": 5,
+    }
+    assert Settings.parse_table_ttls("", 60) == {}
+
+
+def test_wildcard_enables_all_tables(monkeypatch):
+    monkeypatch.setattr(settings, "record_cache_tables", {"*": 10, "orders": 2})
+
+    assert cache.record_cache_ttl("users") == 10
+    assert cache.record_cache_ttl("orders") == 2
+
+
+def test_uncached_tables_always_hit_the_database(live_db, fake_redis):
+    client = TestClient(app)
+
+    assert client.get("/api/users/3").json()["name"] == "user-3"
+    _rename_outside_api(live_db, 3, "renamed")
+    assert client.get("/api/users/3").json()["name"] == "renamed"
+    assert cache.record_cache_ttl("users") is None
+
+
+@pytest.mark.asyncio
+async def test_get_record_reads_through_with_table_ttl(live_db, cached_users):
+    client = TestClient(app)
+
+    assert client.get("/api/users/3").json()["name"] == "user-3"
+    key = "graphsql:cache:records:users:3"
+    assert 0 < await cached_users.ttl(key) <= 30
+
+    _rename_outside_api(live_db, 3, "renamed")
+    # Served from the cache until a write through the API refreshes it
+    assert client.get("/api/users/3").json()["name"] == "user-3"
+
+
+def test_writes_refresh_and_evict_cached_records(live_db, cached_users):
+    client = TestClient(app)
+
+    created = client.post("/api/users", json={"id": 50, "name": "new", "age": 1}).json()
+    _rename_outside_api(live_db, 50, "stale")
+    assert client.get("/api/users/50").json() == created
+
+    client.get("/api/users/4")
+    assert client.put("/api/users/4", json={"name": "updated"}).status_code == 200
+    _rename_outside_api(live_db, 4, "stale")
+    assert client.get("/api/users/4").json()["name"] == "updated"
+
+    assert client.delete("/api/users/4").status_code == 204
+    assert client.get("/api/users/4").status_code == 404
+
+
+def test_written_records_are_dropped_from_other_replicas(live_db, cached_users, monkeypatch):
+    broadcasts: list[list[str] | None] = []
+
+    async def fake_broadcast(keys=None, prefix=None):
+        broadcasts.append(keys)
+
+    monkeypatch.setattr(cache, "broadcast_invalidation", fake_broadcast)
+    client = TestClient(app)
+
+    # Read-through fills hold the current row and are not broadcast
+    client.get("/api/users/4")
+    assert broadcasts == []
+
+    client.put("/api/users/4", json={"name": "updated"})
+    client.post("/api/users", json={"id": 51, "name": "new"})
+    records = [keys for keys in broadcasts if keys and keys[0].startswith("records:")]
+    assert records == [["records:users:4"], ["records:users:51"]]
+
+
+def test_set_based_writes_evict_cached_records(live_db, cached_users):
+    client = TestClient(app)
+    client.get("/api/users/5")
+    client.get("/api/users/6")
+
+    assert client.patch("/api/users", params={"id__in": "5"}, json={"age": 99}).status_code == 200
+    assert client.get("/api/users/5").json()["age"] == 99
+
+    assert client.delete("/api/users", params={"id": "6"}).status_code == 200
+    assert client.get("/api/users/6").status_code == 404
@@ -22,6 +22,9 @@ class TestHealthCheck:
 
         assert isinstance(data["status"], str)
         assert isinstance(data["tables_count"], int)
+        assert set(data["cache"]) == {"local", "redis", "breaker"}
+        assert data["cache"]["breaker"]["state"] in {"closed", "open", "half_open"}
+        assert {"hits", "misses"} <= set(data["cache"]["local"])
 
 
 class TestRootEndpoint:
@@ -0,0 +1,134 @@
+"""Tests for precompiled row serializers."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    LargeBinary,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+)
+
+from graphsql.serializers import (
+    RowSerializer,
+    get_serializer,
+    registry,
+    serialize_input,
+    serialize_value,
+    serializer_for_result,
+)
+
+metadata = MetaData()
+events = Table(
+    "events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("class", String),
+    Column("happened_at", DateTime),
+    Column("day", Date),
+    Column("amount", Numeric(10, 2)),
+    Column("payload", LargeBinary),
+    Column("extra", JSON),
+)
+
+ROW = (
+    1,
+    "audit",
+    datetime(2024, 1, 2, 3, 4, 5),
+    date(2024, 1, 2),
+    Decimal("9.50"),
+    b"raw",
+    {"k": "v"},
+)
+EXPECTED = {
+    "id": 1,
+    "class": "audit",
+    "happened_at": "2024-01-02T03:04:05",
+    "day": "2024-01-02",
+    "amount": 9.5,
+    "payload": "raw",
+    "extra": {"k": "v"},
+}
+
+
+def test_serializer_matches_dynamic_semantics():
+    serializer = get_serializer(events)
+    mapping = dict(zip(serializer.names, ROW, strict=True))
+
+    assert serializer.from_tuple(ROW) == EXPECTED
+    assert serializer.from_mapping(mapping) == EXPECTED
+    assert {key: serialize_value(value) for key, value in mapping.items()} == EXPECTED
+
+
+def test_from_object_handles_keyword_column_names():
+    class Obj:
+        pass
+
+    obj = Obj()
+    for name, value in zip(get_serializer(events).names, ROW, strict=True):
+        setattr(obj, name, value)
+
+    assert get_serializer(events).from_object(obj) == EXPECTED
+
+
+def test_nulls_pass_through_converters():
+    row = (2, None, None, None, None, None, None)
+
+    assert set(get_serializer(events).from_tuple(row).values()) == {2, None}
+
+
+def test_serializers_are_compiled_once_per_table():
+    assert registry.get(events) is registry.get(events)
+
+
+def test_projection_reads_selected_columns_by_position():
+    projected = get_serializer(events).project(["amount", "id"])
+
+    assert projected.from_tuple((Decimal("1.25"), 7)) == {"amount": 1.25, "id": 7}
+    assert get_serializer(events).project(["amount", "id"]) is projected
+
+
+def test_untyped_columns_fall_back_to_dynamic_conversion():
+    class Untyped:
+        name = "value"
+
+    serializer = RowSerializer.for_columns([Untyped()])
+
+    assert serializer.from_tuple((Decimal("2"),)) == {"value": 2.0}
+
+
+def test_result_serializer_guards_heterogeneous_columns():
+    serializer = serializer_for_result(["a", "b"], (1, datetime(2024, 1, 1)))
+
+    assert serializer.from_tuple((1, datetime(2024, 1, 1))) == {
+        "a": 1,
+        "b": "2024-01-01T00:00:00",
+    }
+    # A later row may carry a different type in the same raw-SQL column
+    assert serializer.from_tuple((b"x", None)) == {"a": "x", "b": None}
+
+
+def test_inputs_are_converted_like_stored_values():
+    columns = events.columns
+
+    assert serialize_input(columns.amount, "9.50") == EXPECTED["amount"]
+    assert serialize_input(columns.happened_at, "2024-01-02 03:04:05") == EXPECTED["happened_at"]
+    assert serialize_input(columns.day, "2024-01-02") == EXPECTED["day"]
+    # Scalars, untyped values and non-string inputs pass through
+    assert serialize_input(columns["class"], "audit") == "audit"
+    assert serialize_input(columns.extra, "v") == "v"
+    assert serialize_input(columns.amount, 9.5) == 9.5
+
+
+def test_invalid_inputs_are_rejected():
+    for column, value in ((events.columns.amount, "cheap"), (events.columns.day, "yesterday")):
+        with pytest.raises(ValueError):
+            serialize_input(column, value)
@@ -0,0 +1,54 @@
+"""Tests for the startup cache warm-up."""
+
+import asyncio
+import time
+
+import pytest
+
+from graphsql import cache, warmup
+from graphsql.config import settings
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_populates_metadata_and_hot_records(live_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "record_cache_tables", {"users": 30})
+    monkeypatch.setattr(settings, "cache_warmup_tables", {"users": 3})
+
+    results = await warmup.warm_cache()
+
+    assert results == {"metadata": 2, "records:users": 3}
+    assert await fake_redis.exists("graphsql:cache:tables:list")
+    assert await fake_redis.exists("graphsql:cache:tables:info:users")
+    cache.local_cache.clear()
+    assert await cache.get_cached_record("users", 3) == {"id": 3, "name": "user-3", "age": 23}
+    assert await cache.get_cached_record("users", 4) is None
+
+
+@pytest.mark.asyncio
+async def test_tables_without_record_cache_are_skipped(live_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "cache_warmup_tables", {"users": 3})
+
+    assert await warmup.warm_cache() == {"metadata": 2, "records:users": 0}
+    assert not await fake_redis.exists("graphsql:cache:records:users:1")
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_respects_budget(live_db, fake_redis, monkeypatch):
+    async def slow_metadata():
+        await asyncio.sleep(10)
+        return 1
+
+    monkeypatch.setattr(warmup, "warm_metadata", slow_metadata)
+    monkeypatch.setattr(settings, "cache_warmup_budget_seconds", 0.05)
+
+    started = time.monotonic()
+    assert await warmup.warm_cache() == {}
+    assert time.monotonic() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_zero_budget_disables_warm_up(live_db, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "cache_warmup_budget_seconds", 0)
+
+    assert await warmup.warm_cache() == {}
+    assert not await fake_redis.exists("graphsql:cache:tables:list")
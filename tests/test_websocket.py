@@ -1,23 +1,15 @@
 import asyncio
 
-import fakeredis.aioredis
 import pytest
 from fastapi.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
-from graphsql import cache
 from graphsql.auth import create_access_token
 from graphsql.config import settings
 from graphsql.events import publish_change
 from graphsql.main import app
 
 
-def _use_fake_redis(monkeypatch):
-    fake = fakeredis.aioredis.FakeRedis()
-    monkeypatch.setattr(cache, "_redis_client", fake, raising=True)
-    return fake
-
-
 def _run(coro):
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -28,8 +20,7 @@ def _run(coro):
         asyncio.set_event_loop(None)
 
 
-def test_websocket_receives_table_events(monkeypatch):
-    _use_fake_redis(monkeypatch)
+def test_websocket_receives_table_events(monkeypatch, fake_redis):
     monkeypatch.setattr(settings, "enable_auth", False)
     client = TestClient(app)
 
@@ -46,8 +37,7 @@ def test_websocket_receives_table_events(monkeypatch):
         assert message["record"]["name"] == "Alice"
 
 
-def test_websocket_receives_global_events(monkeypatch):
-    _use_fake_redis(monkeypatch)
+def test_websocket_receives_global_events(monkeypatch, fake_redis):
     monkeypatch.setattr(settings, "enable_auth", False)
     client = TestClient(app)
 
@@ -63,8 +53,7 @@ def test_websocket_receives_global_events(monkeypatch):
         assert message["record"]["id"] == 42
 
 
-def test_websocket_requires_auth_when_enabled(monkeypatch):
-    _use_fake_redis(monkeypatch)
+def test_websocket_requires_auth_when_enabled(monkeypatch, fake_redis):
     monkeypatch.setattr(settings, "enable_auth", True)
     client = TestClient(app)
 
@@ -73,8 +62,7 @@ def test_websocket_requires_auth_when_enabled(monkeypatch):
             pass
 
 
-def test_websocket_allows_authenticated_client(monkeypatch):
-    _use_fake_redis(monkeypatch)
+def test_websocket_allows_authenticated_client(monkeypatch, fake_redis):
     monkeypatch.setattr(settings, "enable_auth", True)
     token = create_access_token("user1").access_token
     client = TestClient(app)